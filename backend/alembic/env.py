@@ -15,6 +15,7 @@ from app.models.team_member import TeamMember
 from app.models.system_log import SystemLog
 from app.models.audit_log import AuditLog
 from app.models.attachment import Attachment
+from app.models.tombstone import Tombstone
 
 # Import settings for database URL
 from app.core.config import settings
@@ -0,0 +1,88 @@
+"""Composite indexes for hot query shapes
+
+Revision ID: 002_composite_indexes
+Revises: 001_initial
+Create Date: 2026-10-19
+
+Adds composite indexes for the filters that fell back to single-column
+indexes plus a filesort:
+
+- status IN (...) AND created_at < ?      (attention items, dashboard counts, admin lists)
+- user_id = ? ORDER BY created_at DESC    (customer lists, admin user detail)
+- category/subcategory ORDER BY created_at DESC (admin lists)
+- appointment_date / appointment_requested = today (attention items)
+
+On MariaDB/MySQL each table gets one ALTER TABLE with ALGORITHM=INPLACE,
+LOCK=NONE, so reads and writes continue while the indexes are built. The
+server refuses the statement instead of silently taking a table lock if an
+online build is not possible. lock_wait_timeout is lowered so that waiting
+for the metadata lock behind a long transaction fails the migration (rerun
+it later) rather than queueing every new query behind the ALTER.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_composite_indexes'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrored in the models' __table_args__
+INDEXES = {
+    'quote_requests': [
+        ('ix_quote_requests_status_created_at', ['status', 'created_at']),
+        ('ix_quote_requests_user_id_created_at', ['user_id', 'created_at']),
+        ('ix_quote_requests_category_subcategory_created_at', ['category', 'subcategory', 'created_at']),
+        ('ix_quote_requests_appointment_date', ['appointment_date']),
+    ],
+    'claims': [
+        ('ix_claims_status_created_at', ['status', 'created_at']),
+        ('ix_claims_user_id_created_at', ['user_id', 'created_at']),
+        ('ix_claims_category_subcategory_created_at', ['category', 'subcategory', 'created_at']),
+        ('ix_claims_appointment_requested', ['appointment_requested']),
+    ],
+    'contact_messages': [
+        ('ix_contact_messages_status_created_at', ['status', 'created_at']),
+        ('ix_contact_messages_user_id_created_at', ['user_id', 'created_at']),
+        ('ix_contact_messages_subject_created_at', ['subject', 'created_at']),
+        ('ix_contact_messages_appointment_date', ['appointment_date']),
+    ],
+}
+
+# Seconds to wait for the metadata lock before giving up (MariaDB/MySQL)
+LOCK_WAIT_TIMEOUT = 10
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name in ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    if not _is_mysql():
+        for table, indexes in INDEXES.items():
+            for name, columns in indexes:
+                op.create_index(name, table, columns, unique=False)
+        return
+
+    op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+    for table, indexes in INDEXES.items():
+        # One statement per table: a single scan builds all of its indexes
+        clauses = ', '.join(f"ADD INDEX {name} ({', '.join(columns)})" for name, columns in indexes)
+        op.execute(sa.text(f'ALTER TABLE {table} {clauses}, ALGORITHM=INPLACE, LOCK=NONE'))
+
+
+def downgrade() -> None:
+    if not _is_mysql():
+        for table, indexes in INDEXES.items():
+            for name, _ in indexes:
+                op.drop_index(name, table_name=table)
+        return
+
+    op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+    for table, indexes in INDEXES.items():
+        clauses = ', '.join(f'DROP INDEX {name}' for name, _ in indexes)
+        op.execute(sa.text(f'ALTER TABLE {table} {clauses}, ALGORITHM=INPLACE, LOCK=NONE'))
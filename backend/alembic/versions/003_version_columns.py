@@ -0,0 +1,50 @@
+"""Version columns for optimistic concurrency
+
+Revision ID: 003_version_columns
+Revises: 002_composite_indexes
+Create Date: 2026-10-19
+
+Adds an integer version to quote_requests, claims and contact_messages.
+Admin updates apply "UPDATE ... WHERE id = ? AND version = ?" and bump it;
+the API exposes it as the ETag and checks If-Match against it.
+
+On MariaDB/MySQL the column is appended with ALGORITHM=INSTANT (a metadata
+change, no table rebuild). It still needs the table's metadata lock, so
+lock_wait_timeout is lowered as in migration 002.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_version_columns'
+down_revision: Union[str, None] = '002_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['quote_requests', 'claims', 'contact_messages']
+
+# Seconds to wait for the metadata lock before giving up (MariaDB/MySQL)
+LOCK_WAIT_TIMEOUT = 10
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name in ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    if not _is_mysql():
+        for table in TABLES:
+            op.add_column(table, sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+        return
+
+    op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+    for table in TABLES:
+        op.execute(sa.text(f'ALTER TABLE {table} ADD COLUMN version INT NOT NULL DEFAULT 1, ALGORITHM=INSTANT'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, 'version')
@@ -0,0 +1,71 @@
+"""Covering indexes for customer list validators
+
+Revision ID: 004_covering_user_indexes
+Revises: 003_version_columns
+Create Date: 2026-10-19
+
+Replaces (user_id, created_at) with (user_id, created_at, id, version) on
+quote_requests, claims and contact_messages. The customer list endpoints
+answer If-None-Match from the (id, version) pairs of the requested page,
+which this index covers, so that query is read from the index alone. The
+id before version also serves keyset pages ordered by (created_at, id).
+The ORDER BY created_at lists use the new index as they used the old one.
+
+Same online ALTER as migration 002: one statement per table with
+ALGORITHM=INPLACE, LOCK=NONE and a short lock_wait_timeout.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_covering_user_indexes'
+down_revision: Union[str, None] = '003_version_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (old index, new index); mirrored in the models' __table_args__
+INDEXES = {
+    'quote_requests': ('ix_quote_requests_user_id_created_at', 'ix_quote_requests_user_id_created_at_id_version'),
+    'claims': ('ix_claims_user_id_created_at', 'ix_claims_user_id_created_at_id_version'),
+    'contact_messages': ('ix_contact_messages_user_id_created_at', 'ix_contact_messages_user_id_created_at_id_version'),
+}
+
+# Seconds to wait for the metadata lock before giving up (MariaDB/MySQL)
+LOCK_WAIT_TIMEOUT = 10
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name in ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    if not _is_mysql():
+        for table, (old, new) in INDEXES.items():
+            op.create_index(new, table, ['user_id', 'created_at', 'id', 'version'], unique=False)
+            op.drop_index(old, table_name=table)
+        return
+
+    op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+    for table, (old, new) in INDEXES.items():
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ADD INDEX {new} (user_id, created_at, id, version), DROP INDEX {old}, '
+            f'ALGORITHM=INPLACE, LOCK=NONE'
+        ))
+
+
+def downgrade() -> None:
+    if not _is_mysql():
+        for table, (old, new) in INDEXES.items():
+            op.create_index(old, table, ['user_id', 'created_at'], unique=False)
+            op.drop_index(new, table_name=table)
+        return
+
+    op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+    for table, (old, new) in INDEXES.items():
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ADD INDEX {old} (user_id, created_at), DROP INDEX {new}, '
+            f'ALGORITHM=INPLACE, LOCK=NONE'
+        ))
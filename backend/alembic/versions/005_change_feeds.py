@@ -0,0 +1,80 @@
+"""Tombstones and (updated_at, id) indexes for the admin change feeds
+
+Revision ID: 005_change_feeds
+Revises: 004_covering_user_indexes
+Create Date: 2026-10-19
+
+The admin change feeds return the rows of a table changed after a client's
+cursor, in (updated_at, id) order. Adds that index to quote_requests,
+claims, contact_messages and users, so a feed page is one index range read,
+and the tombstones table, where deleted rows of those tables are recorded
+(app/models/tombstone.py).
+
+The indexes use the same online ALTER as migration 002: one statement per
+table with ALGORITHM=INPLACE, LOCK=NONE and a short lock_wait_timeout.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_change_feeds'
+down_revision: Union[str, None] = '004_covering_user_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> index; mirrored in the models' __table_args__
+INDEXES = {
+    'quote_requests': 'ix_quote_requests_updated_at_id',
+    'claims': 'ix_claims_updated_at_id',
+    'contact_messages': 'ix_contact_messages_updated_at_id',
+    'users': 'ix_users_updated_at_id',
+}
+
+# Seconds to wait for the metadata lock before giving up (MariaDB/MySQL)
+LOCK_WAIT_TIMEOUT = 10
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name in ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tombstones',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('entity_type', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_tombstones_entity_type_deleted_at_entity_id', 'tombstones',
+        ['entity_type', 'deleted_at', 'entity_id'], unique=False,
+    )
+
+    if not _is_mysql():
+        for table, index in INDEXES.items():
+            op.create_index(index, table, ['updated_at', 'id'], unique=False)
+        return
+
+    op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+    for table, index in INDEXES.items():
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ADD INDEX {index} (updated_at, id), ALGORITHM=INPLACE, LOCK=NONE'
+        ))
+
+
+def downgrade() -> None:
+    if not _is_mysql():
+        for table, index in INDEXES.items():
+            op.drop_index(index, table_name=table)
+    else:
+        op.execute(sa.text(f'SET SESSION lock_wait_timeout = {LOCK_WAIT_TIMEOUT}'))
+        for table, index in INDEXES.items():
+            op.execute(sa.text(f'ALTER TABLE {table} DROP INDEX {index}, ALGORITHM=INPLACE, LOCK=NONE'))
+
+    op.drop_index('ix_tombstones_entity_type_deleted_at_entity_id', table_name='tombstones')
+    op.drop_table('tombstones')
@@ -0,0 +1,144 @@
+"""
+Admission control for the API.
+
+Sync routes run on Starlette's worker threadpool (anyio's default limiter,
+40 threads) and each holds a database connection from its lane's pool.
+Past either limit, requests used to queue invisibly - on a free thread, then
+on a free connection for up to the pool timeout - until clients gave up.
+
+Each request lane (app/core/lanes.py) has an AdmissionController that bounds
+this explicitly: at most ADMISSION_<LANE>_MAX_CONCURRENT requests run at
+once, up to ADMISSION_<LANE>_MAX_QUEUE wait in FIFO order for at most
+ADMISSION_QUEUE_TIMEOUT_SECONDS, and everything beyond is rejected
+immediately. A request about to start (given a free slot, directly or from
+the queue) is rejected instead when the lane's connection pool is already
+exhausted by connections held outside admission control, since it would
+only block on checkout. Admitted requests hold connections themselves, so
+the pool is checked only then: a lane at its limit queues new arrivals.
+AdmissionMiddleware (app/middleware/admission_middleware.py) turns
+rejections into 503 responses with Retry-After; queue time and rejections
+are exported as metrics.
+
+Keep each lane's limit at or below its connection pool capacity and the sum
+of the limits at or below the threadpool size, so admitted requests never
+queue again behind them and a busy admin lane cannot take threads or
+connections from public submissions.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict
+
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.lanes import ADMIN, PUBLIC
+
+
+class Overloaded(Exception):
+    """Raised when a request is not admitted. reason is one of queue_full, queue_timeout, db_pool"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Service overloaded ({reason})")
+        self.reason = reason
+
+
+def db_pool_saturated(lane: str) -> bool:
+    """Whether every connection of the lane's pool (including overflow) is checked out"""
+    from app.core.database import engines, pool_capacity
+
+    pool = engines[lane].pool
+    if not isinstance(pool, QueuePool):
+        return False
+    return pool.checkedout() >= pool_capacity[lane]
+
+
+class AdmissionController:
+    """
+    Concurrency limiter with a bounded FIFO wait queue.
+
+    Used from the event loop only (no locking needed). A released slot is
+    handed directly to the oldest waiter, so queued requests cannot be
+    overtaken by new arrivals.
+    """
+
+    def __init__(self, lane: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.lane = lane
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """
+        Wait for a slot.
+
+        Returns:
+            Seconds spent in the queue
+
+        Raises:
+            Overloaded: If the queue is full, the wait timed out or the DB pool is
+                exhausted when the request would start
+        """
+        if self.active < self.max_concurrent and not self._waiters:
+            if db_pool_saturated(self.lane):
+                raise Overloaded("db_pool")
+            self.active += 1
+            return 0.0
+
+        if len(self._waiters) >= self.max_queue:
+            raise Overloaded("queue_full")
+
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the wait ended - give it back
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.TimeoutError):
+                raise Overloaded("queue_timeout")
+            raise
+
+        if db_pool_saturated(self.lane):
+            # Handed a slot, but no connection to run on: pass the slot on
+            self.release()
+            raise Overloaded("db_pool")
+        return time.perf_counter() - start
+
+    def release(self):
+        """Free a slot, handing it to the oldest waiter if any"""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+admission_controllers: Dict[str, AdmissionController] = {
+    PUBLIC: AdmissionController(
+        lane=PUBLIC,
+        max_concurrent=settings.ADMISSION_PUBLIC_MAX_CONCURRENT,
+        max_queue=settings.ADMISSION_PUBLIC_MAX_QUEUE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+    ADMIN: AdmissionController(
+        lane=ADMIN,
+        max_concurrent=settings.ADMISSION_ADMIN_MAX_CONCURRENT,
+        max_queue=settings.ADMISSION_ADMIN_MAX_QUEUE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    ),
+}
@@ -0,0 +1,242 @@
+"""
+Request batching: several GET requests to existing routes in one HTTP request.
+
+POST /api/v1/batch (and /api/v1/admin/batch for admin routes, so admin work
+stays on the admin lane) takes a list of paths and runs each through the
+route's own handler, skipping the HTTP round trip, the middleware stack and
+per-request authentication:
+- the principal is resolved once from the batch's Authorization header and
+  handed to every sub-request (get_current_user returns it from the scope
+  state instead of loading the user again)
+- every sub-request uses the batch's database session (get_db yields it
+  from the scope state and leaves closing it to the batch), so the whole
+  batch is one connection checkout and, on MariaDB, one consistent snapshot
+- sub-requests run concurrently, at most BATCH_MAX_CONCURRENCY at a time.
+  A Session is not thread-safe, so routes that depend on get_db take turns
+  on it; routes without database work (catalog, cached team roster) overlap
+
+Each sub-request keeps its route's behaviour: dependencies, time budget
+(capped at what is left of the batch's own), response_model serialization, conditional GET (If-None-Match and
+If-Modified-Since may be passed per sub-request) and error mapping. Errors
+are returned as that sub-request's status and {"detail": ...} body; they do
+not fail the batch. Each sub-request is traced separately and checked
+against its route's @query_budget.
+
+Routes marked @not_batchable (streamed exports and file downloads, whose
+bodies would be read into memory whole) are rejected with 400.
+"""
+import json
+import logging
+import time
+from contextlib import AsyncExitStack, nullcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import anyio
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+from starlette.routing import Match
+from starlette.types import Message, Scope
+
+from app.core import tracing
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.lanes import current_lane, lane_for_path
+from app.core.query_budget import get_query_budget
+from app.middleware.request_middleware import map_exception
+from app.models.user import User
+from app.schemas.batch_schemas import BatchSubRequest, BatchSubResponse
+
+logger = logging.getLogger(__name__)
+
+# Request headers a sub-request may set; everything else comes from the batch
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+# Response headers not passed back (framing of the sub-response, not part of it)
+_DROPPED_HEADERS = {"content-length", "server-timing"}
+
+_NOT_BATCHABLE_ATTRIBUTE = "__not_batchable__"
+
+
+def not_batchable(endpoint: Callable) -> Callable:
+    """Mark a GET route as not allowed in batches (its response is streamed)"""
+    # Copied onto wrappers by functools.wraps (e.g. TracedRoute), so the route still sees it
+    setattr(endpoint, _NOT_BATCHABLE_ATTRIBUTE, True)
+    return endpoint
+
+
+def resolve_route(request: Request, path: str) -> Tuple[APIRoute, Scope]:
+    """
+    Find the GET route serving a sub-request path.
+
+    Args:
+        request: The batch request (its app's routes are searched)
+        path: Path of the sub-request, as served (e.g. /api/v1/admin/dashboard/stats?limit=5)
+
+    Returns:
+        The route, and a scope for the sub-request (path parameters filled in)
+
+    Raises:
+        ValueError: If the path is not a GET route, is on a different lane
+            than the batch or is marked @not_batchable (maps to 400)
+    """
+    url = urlsplit(path)
+    if url.scheme or url.netloc or not url.path.startswith("/api/"):
+        raise ValueError(f"Batch paths must be API paths, e.g. /api/v1/quotes/: {path}")
+    if lane_for_path(url.path) != current_lane():
+        raise ValueError(f"{url.path} is on the {lane_for_path(url.path)} lane; send it to that lane's batch endpoint")
+
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": [],
+        "app": request.scope.get("app"),
+    }
+    for route in request.app.router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        match, child_scope = route.matches(scope)
+        # The batch route itself is POST, so it never matches: batches do not nest
+        if match == Match.FULL:
+            if getattr(route.endpoint, _NOT_BATCHABLE_ATTRIBUTE, False):
+                raise ValueError(f"{url.path} streams its response and cannot be batched; request it directly")
+            scope.update(child_scope)
+            return route, scope
+    raise ValueError(f"No GET route for batch path: {path}")
+
+
+def _uses_db(route: APIRoute) -> bool:
+    pending = list(route.dependant.dependencies)
+    while pending:
+        dependant = pending.pop()
+        if dependant.call is get_db:
+            return True
+        pending.extend(dependant.dependencies)
+    return False
+
+
+async def run_batch(
+    request: Request,
+    sub_requests: List[BatchSubRequest],
+    db: Session,
+    principal: Optional[User],
+) -> List[BatchSubResponse]:
+    """
+    Run the sub-requests of a batch and collect their responses, in request order.
+
+    All paths are resolved before any runs, so an invalid path fails the
+    whole batch (400) instead of leaving it half done.
+
+    Args:
+        request: The batch request (supplies the app, client and Authorization header)
+        sub_requests: Paths and conditional headers to run
+        db: The batch's session, shared by every sub-request
+        principal: The batch's authenticated user, or None for a guest batch
+
+    Returns:
+        One response per sub-request
+
+    Raises:
+        ValueError: If there are too many sub-requests or a path is invalid (maps to 400)
+    """
+    if len(sub_requests) > settings.BATCH_MAX_REQUESTS:
+        raise ValueError(f"A batch may contain at most {settings.BATCH_MAX_REQUESTS} requests")
+    resolved = [resolve_route(request, sub.path) for sub in sub_requests]
+
+    authorization = request.headers.get("authorization")
+    limiter = anyio.CapacityLimiter(settings.BATCH_MAX_CONCURRENCY)
+    session_lock = anyio.Lock()
+    responses: List[Optional[BatchSubResponse]] = [None] * len(sub_requests)
+
+    async def run_one(index: int):
+        route, scope = resolved[index]
+        headers = [
+            (name.lower().encode(), value.encode())
+            for name, value in sub_requests[index].headers.items()
+            if name.lower() in CONDITIONAL_HEADERS
+        ]
+        if authorization:
+            headers.append((b"authorization", authorization.encode()))
+        scope["headers"] = headers
+        scope["state"] = {"db": db, "user": principal}
+
+        # Waiting for the session does not hold a slot that a database-free route could use
+        async with session_lock if _uses_db(route) else nullcontext():
+            async with limiter:
+                responses[index] = await _dispatch(route, scope)
+
+    async with anyio.create_task_group() as task_group:
+        for index in range(len(sub_requests)):
+            task_group.start_soon(run_one, index)
+    return responses
+
+
+async def _dispatch(route: APIRoute, scope: Scope) -> BatchSubResponse:
+    # Own trace (statements and budget per sub-request), own exit stack (dependency teardown)
+    parent = tracing.current_trace()
+    start = time.perf_counter()
+    trace_token = tracing.start_trace("GET", scope["path"])
+    status_code = 500
+    headers: Dict[str, str] = {}
+    body = bytearray()
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for name, value in message.get("headers", []):
+                name = name.decode().lower()
+                if name not in _DROPPED_HEADERS:
+                    headers[name] = value.decode()
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    try:
+        async with AsyncExitStack() as stack:
+            scope["fastapi_astack"] = stack
+            await route.handle(scope, receive, send)
+    except RequestValidationError as exc:
+        status_code = 422
+        return BatchSubResponse(status=status_code, headers={}, body={"detail": jsonable_encoder(exc.errors())})
+    except Exception as exc:
+        status_code, detail = map_exception(exc)
+        if status_code >= 500:
+            logger.exception(f"Batched GET {scope['path']} failed")
+        return BatchSubResponse(status=status_code, headers={}, body={"detail": detail})
+    finally:
+        trace = tracing.current_trace()
+        budget = get_query_budget(route.endpoint)
+        if trace is not None and budget is not None and len(trace.statements) > budget:
+            logger.warning(
+                f"Query budget exceeded: batched GET {route.path} "
+                f"executed {len(trace.statements)} statements (budget {budget})"
+            )
+        tracing.finish_trace(trace_token, status_code)
+        if parent is not None:
+            parent.add_span("batch", start, time.perf_counter(), f"GET {route.path}")
+
+    return BatchSubResponse(status=status_code, headers=headers, body=_decode_body(headers, bytes(body)))
+
+
+def _decode_body(headers: Dict[str, str], body: bytes) -> Any:
+    if not body:
+        return None
+    if headers.get("content-type", "").startswith("application/json"):
+        return json.loads(body)
+    # CSV exports and other non-JSON bodies are passed back as text
+    return body.decode(errors="replace")
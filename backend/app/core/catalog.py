@@ -0,0 +1,120 @@
+"""
+Insurance category catalog: the one copy of the category/subcategory taxonomy.
+
+Quote and claim validation read it here, and clients get it from
+GET /api/v1/catalog instead of hardcoding it. Everything is computed once at
+import: the lookup tables are frozensets, and the response body is serialized
+up front with a content-hash version, so serving the catalog is a dictionary
+read. The version only changes when this file does (i.e. with a deploy),
+which is what lets /api/v1/catalog/{version} be cached as immutable.
+
+The keys match docs/architecture/CATEGORIES.md and what the quote and claim
+forms post.
+"""
+import hashlib
+import json
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# (key, label, [(subcategory key, label), ...] or None when the category has no subcategories)
+CATEGORIES: List[Tuple[str, str, Optional[List[Tuple[str, str]]]]] = [
+    ("vehicle", "Vehicle", [
+        ("auto", "Auto"),
+        ("motorcycle", "Motorcycle"),
+        ("atv", "ATV/Off-Road"),
+        ("roadside", "Roadside Assistance"),
+        ("snowmobile", "Snowmobile"),
+        ("boat", "Boat"),
+        ("rv", "RV"),
+        ("vehicle_protection", "Vehicle Protection"),
+    ]),
+    ("property", "Property", [
+        ("homeowners", "Homeowners"),
+        ("renters", "Renters"),
+        ("condo", "Condo"),
+        ("landlord", "Landlord"),
+        ("mobile_home", "Mobile Home"),
+    ]),
+    ("life", "Life", None),
+    ("business", "Business", None),
+    ("identity_protection", "Identity Protection", None),
+    ("other", "Other", [
+        ("umbrella", "Personal Umbrella Policy"),
+        ("individual_health", "Individual Health"),
+        ("pet", "Pet"),
+        ("event", "Event"),
+        ("travel", "Travel"),
+        ("jewelry", "Jewelry"),
+        ("collectibles", "Collectibles"),
+    ]),
+]
+
+# Older subcategory keys still accepted by the API, stored under the current key
+SUBCATEGORY_ALIASES: Dict[Tuple[str, str], str] = {
+    ("vehicle", "atv_off_road"): "atv",
+    ("other", "personal_umbrella_policy"): "umbrella",
+}
+
+# category -> subcategory keys in display order (None: no subcategories)
+SUBCATEGORIES: Dict[str, Optional[Tuple[str, ...]]] = {
+    key: tuple(sub_key for sub_key, _ in subcategories) if subcategories is not None else None
+    for key, _, subcategories in CATEGORIES
+}
+
+CATEGORY_KEYS: FrozenSet[str] = frozenset(SUBCATEGORIES)
+_SUBCATEGORY_KEYS: Dict[str, Optional[FrozenSet[str]]] = {
+    key: frozenset(keys) if keys is not None else None for key, keys in SUBCATEGORIES.items()
+}
+
+
+def validate_category(category: str, subcategory: Optional[str]) -> Optional[str]:
+    """
+    Check a (category, subcategory) pair against the catalog.
+
+    Args:
+        category: Category key
+        subcategory: Subcategory key, or None
+
+    Returns:
+        The subcategory to store (aliases resolved to the current key)
+
+    Raises:
+        ValueError: If the pair is not in the catalog (invalid input - maps to 400)
+    """
+    if category not in CATEGORY_KEYS:
+        raise ValueError(f"Invalid category. Must be one of: {', '.join(SUBCATEGORIES)}")
+
+    valid_subcats = _SUBCATEGORY_KEYS[category]
+    if subcategory:
+        if valid_subcats is None:
+            raise ValueError(f"Category '{category}' does not have subcategories")
+        subcategory = SUBCATEGORY_ALIASES.get((category, subcategory), subcategory)
+        if subcategory not in valid_subcats:
+            raise ValueError(f"Invalid subcategory for {category}. Must be one of: {', '.join(SUBCATEGORIES[category])}")
+        return subcategory
+    if valid_subcats is not None:
+        # Category requires a subcategory but none provided
+        raise ValueError(f"Category '{category}' requires a subcategory. Must be one of: {', '.join(SUBCATEGORIES[category])}")
+    return None
+
+
+def _serialize() -> Tuple[bytes, str]:
+    categories = [
+        {
+            "key": key,
+            "label": label,
+            "subcategories": [
+                {"key": sub_key, "label": sub_label} for sub_key, sub_label in subcategories
+            ] if subcategories is not None else None,
+        }
+        for key, label, subcategories in CATEGORIES
+    ]
+    version = hashlib.sha256(
+        json.dumps(categories, separators=(",", ":"), sort_keys=True).encode()
+    ).hexdigest()[:16]
+    body = json.dumps({"version": version, "categories": categories}, separators=(",", ":")).encode()
+    return body, version
+
+
+# Response body and its content hash (also the ETag)
+CATALOG_BODY, CATALOG_VERSION = _serialize()
+CATALOG_ETAG = f'"{CATALOG_VERSION}"'
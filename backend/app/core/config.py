@@ -24,6 +24,65 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: str = "http://localhost:3003,http://localhost:8082"
 
+    # Metrics (set METRICS_MULTIPROC_DIR to a shared directory when running several workers)
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # Tracing (Server-Timing header; optional OTLP/JSON export, one trace per line).
+    # Server-Timing names internal services and SQL timings: sent on the admin lane only, or on every lane in DEBUG
+    TRACING_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = True
+    TRACE_EXPORT_PATH: Optional[str] = None
+
+    # Profiler (requires tracing; keeps slow or sampled request profiles in a bounded ring of files)
+    PROFILER_ENABLED: bool = False
+    PROFILER_SLOW_REQUEST_MS: float = 1000.0
+    PROFILER_SAMPLE_RATE: float = 0.0
+    PROFILER_INTERVAL_MS: float = 5.0
+    PROFILER_DIR: str = "/tmp/whittaker-profiles"
+    PROFILER_RING_SIZE: int = 100
+
+    # Database connection pools per lane (app/core/lanes.py): public, admin, background
+    DB_POOL_PUBLIC_SIZE: int = 10
+    DB_POOL_PUBLIC_MAX_OVERFLOW: int = 5
+    DB_POOL_ADMIN_SIZE: int = 4
+    DB_POOL_ADMIN_MAX_OVERFLOW: int = 2
+    DB_POOL_BACKGROUND_SIZE: int = 2
+    DB_POOL_BACKGROUND_MAX_OVERFLOW: int = 2
+
+    # Admission control per lane (app/core/admission.py): concurrent requests, bounded wait queue, 503 beyond.
+    # Keep each lane's MAX_CONCURRENT <= its pool capacity, and their sum <= the sync threadpool (40)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_PUBLIC_MAX_CONCURRENT: int = 15
+    ADMISSION_PUBLIC_MAX_QUEUE: int = 50
+    ADMISSION_ADMIN_MAX_CONCURRENT: int = 6
+    ADMISSION_ADMIN_MAX_QUEUE: int = 20
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 2
+
+    # Request time budgets per lane (app/core/deadlines.py; routes may override with @time_budget).
+    # Propagated to MariaDB as max_statement_time, timed-out requests get 504
+    TIME_BUDGET_PUBLIC_SECONDS: float = 10.0
+    TIME_BUDGET_ADMIN_SECONDS: float = 30.0
+
+    # Public team roster (app/services/team_service.py): in-memory snapshot, invalidated by admin edits.
+    # Max age 0 = rebuild only on invalidation; set it when running several workers
+    TEAM_SNAPSHOT_MAX_AGE_SECONDS: float = 0
+    TEAM_CACHE_MAX_AGE_SECONDS: int = 3600
+
+    # Request batching (app/core/batch.py): GET sub-requests per batch, and how many run at once.
+    # Sub-requests share one session, so only those without database work actually overlap
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_MAX_CONCURRENCY: int = 4
+
+    # Admin change feeds (app/services/sync_service.py): changes younger than this are returned by a later
+    # request, so a transaction still committing cannot land behind a client's cursor. Keep it above the
+    # longest write transaction (writes commit right after their UPDATE/DELETE)
+    SYNC_LAG_SECONDS: int = 10
+
+    # Analytics snapshots (app/jobs/snapshot.py writes Parquet files here, on the uploads volume)
+    SNAPSHOT_DIR: str = "/app/uploads/snapshots"
+
     class Config:
         env_file = ".env"
         case_sensitive = True
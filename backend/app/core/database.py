@@ -1,24 +1,102 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.core.deadlines import instrument_engine_deadlines
+from app.core.lanes import ADMIN, BACKGROUND, PUBLIC, current_lane
+from app.core.tracing import instrument_engine
+
+
+def _create_engine(pool_size: int, max_overflow: int) -> Engine:
+    lane_engine = create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        echo=settings.DEBUG
+    )
+    instrument_engine(lane_engine)
+    instrument_engine_deadlines(lane_engine)
+    return lane_engine
+
+
+# One connection pool per lane (see app/core/lanes.py), so admin queries
+# can only exhaust their own connections
+engines: Dict[str, Engine] = {
+    PUBLIC: _create_engine(settings.DB_POOL_PUBLIC_SIZE, settings.DB_POOL_PUBLIC_MAX_OVERFLOW),
+    ADMIN: _create_engine(settings.DB_POOL_ADMIN_SIZE, settings.DB_POOL_ADMIN_MAX_OVERFLOW),
+    BACKGROUND: _create_engine(settings.DB_POOL_BACKGROUND_SIZE, settings.DB_POOL_BACKGROUND_MAX_OVERFLOW),
+}
+
+# Most connections each lane's pool hands out (pool_size + max_overflow)
+pool_capacity: Dict[str, int] = {
+    PUBLIC: settings.DB_POOL_PUBLIC_SIZE + settings.DB_POOL_PUBLIC_MAX_OVERFLOW,
+    ADMIN: settings.DB_POOL_ADMIN_SIZE + settings.DB_POOL_ADMIN_MAX_OVERFLOW,
+    BACKGROUND: settings.DB_POOL_BACKGROUND_SIZE + settings.DB_POOL_BACKGROUND_MAX_OVERFLOW,
+}
+
+# Engine for jobs and scripts
+engine = engines[BACKGROUND]
+
+
+class LaneSession(Session):
+    """Session bound to the connection pool of the lane it was created in"""
+
+    def __init__(self, bind=None, **kwargs):
+        super().__init__(bind=bind or engines[current_lane()], **kwargs)
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=settings.DEBUG
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=LaneSession, autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
 
-def get_db():
-    """Database session dependency"""
+def get_db(request: Request):
+    """Database session dependency (on the current request's lane pool)"""
+    batch_db = getattr(request.state, "db", None)
+    if batch_db is not None:
+        # Batch sub-request (app/core/batch.py): the batch's session, closed by the batch
+        yield batch_db
+        return
+
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    Commit everything added to the request's session inside the block once.
+
+    Services add the entity, flush it to get its id and add the rows that
+    reference it (audit log), all in one transaction with a single commit;
+    any exception rolls the whole unit back. Objects are not expired by the
+    commit, so the values loaded by the INSERT (server defaults come back
+    through RETURNING, see eager_defaults on the models) can be serialized
+    without a follow-up SELECT.
+
+    Args:
+        db: Request-scoped database session (get_db)
+
+    Yields:
+        The same session
+    """
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.expire_on_commit = expire_on_commit
@@ -0,0 +1,136 @@
+"""
+Per-route time budgets, propagated to the database.
+
+Every request gets a deadline when its route handler starts: the route's
+@time_budget(seconds) if it declares one, otherwise the default of its lane
+(TIME_BUDGET_PUBLIC_SECONDS / TIME_BUDGET_ADMIN_SECONDS):
+
+    @router.get("/users/export")
+    @query_budget(2)
+    @time_budget(300)
+    def export_users(...):
+
+The deadline lives in a context variable (copied into the threadpool that
+runs sync routes) and is enforced on every SQL statement:
+- a statement issued after the deadline is not sent at all
+- on MariaDB each SELECT runs as SET STATEMENT max_statement_time=<time left>
+  FOR SELECT ..., so the server aborts a runaway query (error 1969) instead
+  of holding the connection long after the client has given up
+
+Both raise DeadlineExceeded, which RequestMiddleware maps to 504, and are
+counted in db_statement_timeouts_total. Writes are only checked before they
+are sent, never interrupted halfway. Statements outside a request (jobs,
+scripts) and the body of streamed responses have no deadline.
+"""
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.lanes import ADMIN, current_lane
+from app.core.tracing import TracedRoute
+
+_BUDGET_ATTRIBUTE = "__time_budget__"
+
+# MariaDB: "Query execution was interrupted (max_statement_time exceeded)"
+ER_STATEMENT_TIMEOUT = 1969
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The request ran out of its time budget (maps to 504)"""
+
+
+def time_budget(seconds: float) -> Callable:
+    """
+    Declare how long one request to a route may take, overriding its lane's default.
+
+    Args:
+        seconds: Time budget, measured from the start of the route handler
+
+    Returns:
+        Decorator that records the budget on the endpoint function
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        # Copied onto wrappers by functools.wraps (e.g. TracedRoute), so the route still sees it
+        setattr(endpoint, _BUDGET_ATTRIBUTE, seconds)
+        return endpoint
+    return decorator
+
+
+def get_time_budget(endpoint: Callable) -> Optional[float]:
+    """Time budget declared for an endpoint, or None if it uses its lane's default"""
+    return getattr(endpoint, _BUDGET_ATTRIBUTE, None)
+
+
+def default_time_budget(lane: str) -> float:
+    """Time budget of routes in a lane that declare none"""
+    if lane == ADMIN:
+        return settings.TIME_BUDGET_ADMIN_SECONDS
+    return settings.TIME_BUDGET_PUBLIC_SECONDS
+
+
+def time_left() -> Optional[float]:
+    """Seconds until the current request's deadline, or None outside a request"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.perf_counter()
+
+
+class DeadlineRoute(TracedRoute):
+    """
+    TracedRoute that starts the request's deadline before dependencies and
+    the endpoint run. Use as APIRouter(route_class=DeadlineRoute).
+
+    A route run inside another request (a batch sub-request, app/core/batch.py)
+    keeps the outer deadline when that comes first, so its sub-requests
+    cannot outlast the batch.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        budget = get_time_budget(self.endpoint)
+
+        async def deadline_handler(request):
+            seconds = budget if budget is not None else default_time_budget(current_lane())
+            deadline = time.perf_counter() + seconds
+            outer = _deadline.get()
+            if outer is not None:
+                deadline = min(deadline, outer)
+            token = _deadline.set(deadline)
+            try:
+                return await handler(request)
+            finally:
+                _deadline.reset(token)
+
+        return deadline_handler
+
+
+def instrument_engine_deadlines(engine: Engine):
+    """Enforce the current request's deadline on every statement executed on the engine"""
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        left = time_left()
+        if left is None:
+            return statement, parameters
+        if left <= 0:
+            metrics.db_statement_timeouts_total.inc(lane=current_lane(), stage="before_execute")
+            raise DeadlineExceeded("Request time budget exceeded")
+        if getattr(conn.dialect, "is_mariadb", False) and statement.lstrip()[:6].upper() == "SELECT":
+            # At least 1ms: max_statement_time=0 (what a shorter time would round to) means no limit
+            statement = f"SET STATEMENT max_statement_time={max(left, 0.001):.3f} FOR {statement}"
+        return statement, parameters
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        original = exception_context.original_exception
+        if getattr(original, "args", None) and original.args[0] == ER_STATEMENT_TIMEOUT:
+            metrics.db_statement_timeouts_total.inc(lane=current_lane(), stage="database")
+            raise DeadlineExceeded("Request time budget exceeded: query interrupted") from original
@@ -1,24 +1,36 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import decode_access_token
+from app.core.tracing import span
 from app.models.user import User
 
 security = HTTPBearer()
 
 
-async def get_current_user(
+def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
-    Dependency to get the current authenticated user from JWT token
+    Dependency to get the current authenticated user from JWT token.
+
+    Deliberately sync: the user lookup blocks on the connection pool, so it
+    must run in the threadpool rather than on the event loop. Batch
+    sub-requests (app/core/batch.py) reuse the principal the batch resolved
+    from the same token.
     """
+    batch_user = getattr(request.state, "user", None)
+    if batch_user is not None:
+        return batch_user
+
     token = credentials.credentials
 
     # Decode and verify token
-    payload = decode_access_token(token)
+    with span("jwt"):
+        payload = decode_access_token(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -36,7 +48,8 @@ async def get_current_user(
         )
 
     # Get user from database
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    with span("principal"):
+        user = db.query(User).filter(User.id == int(user_id)).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
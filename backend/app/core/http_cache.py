@@ -0,0 +1,102 @@
+"""
+HTTP validator helpers for conditional GETs (ETag / If-None-Match, Last-Modified / If-Modified-Since).
+
+Per-user responses (customer lists and details) are cached by the browser
+only, and always revalidated: PRIVATE_CACHE_HEADERS plus an ETag built from
+row versions, which every write bumps (see the version columns, migration
+003). The browser sends If-None-Match by itself and turns a 304 back into
+the cached body, so clients need no changes.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+# Browser cache only (responses differ per Authorization), revalidated on every use
+PRIVATE_CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag (weak comparison, as for GET).
+
+    Args:
+        if_none_match: If-None-Match header value, or None if absent
+        etag: Current ETag of the resource, quoted
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive UTC datetime for Last-Modified"""
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Whether the request's validators show the client's cached copy is current.
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        last_modified: Naive UTC modification time, if the resource has one
+
+    Returns:
+        True if a 304 should be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= since
+    return False
+
+
+def version_etag(version: int) -> str:
+    """ETag of a single row: its version (the same ETag the admin detail routes send)"""
+    return f'"{version}"'
+
+
+def rows_etag(rows: Iterable[Tuple[int, int]]) -> str:
+    """
+    ETag of a list of rows from their (id, version) pairs.
+
+    Any insert, delete or update among the rows changes it, and it can be
+    computed either from loaded objects or from an index-only query.
+
+    Args:
+        rows: (id, version) of each row in the list
+
+    Returns:
+        Quoted ETag
+    """
+    digest = hashlib.sha256(",".join(f"{row_id}:{version}" for row_id, version in sorted(rows)).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def set_private_etag(response: Response, etag: str):
+    """Send an ETag with the private, always-revalidate caching headers"""
+    response.headers["ETag"] = etag
+    response.headers.update(PRIVATE_CACHE_HEADERS)
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 for a per-user resource whose ETag matched"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **PRIVATE_CACHE_HEADERS})
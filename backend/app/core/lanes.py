@@ -0,0 +1,47 @@
+"""
+Priority lanes.
+
+Requests are split by route class so that expensive admin views cannot
+starve customer submissions:
+- public: everything customers and guests call (auth, quotes, claims, contact)
+- admin: /api/v1/admin/* (dashboards, lists, exports, user search)
+- background: code running outside a request (jobs, scripts, benchmarks,
+  and the middleware's own error logging)
+
+Each lane has its own admission limits (app/core/admission.py) and its own
+connection pool (app/core/database.py), configured in Settings. The lane of
+the current request is kept in a context variable, set by AdmissionMiddleware
+and copied into the threadpool that runs sync routes.
+"""
+from contextvars import ContextVar
+
+PUBLIC = "public"
+ADMIN = "admin"
+BACKGROUND = "background"
+
+LANES = (PUBLIC, ADMIN, BACKGROUND)
+
+ADMIN_PATH_PREFIX = "/api/v1/admin"
+
+_current_lane: ContextVar[str] = ContextVar("current_lane", default=BACKGROUND)
+
+
+def lane_for_path(path: str) -> str:
+    """Lane serving a request path"""
+    if path == ADMIN_PATH_PREFIX or path.startswith(ADMIN_PATH_PREFIX + "/"):
+        return ADMIN
+    return PUBLIC
+
+
+def current_lane() -> str:
+    """Lane of the request being handled (background outside a request)"""
+    return _current_lane.get()
+
+
+def set_lane(lane: str):
+    """Set the lane for the current request. Returns a token for reset_lane()."""
+    return _current_lane.set(lane)
+
+
+def reset_lane(token):
+    _current_lane.reset(token)
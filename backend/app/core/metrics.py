@@ -0,0 +1,466 @@
+"""
+In-process metrics registry with Prometheus text exposition.
+
+Counters, gauges and histograms live in plain dictionaries keyed by label
+values. When several uvicorn workers run, set METRICS_MULTIPROC_DIR to a
+directory shared by all workers: each worker periodically writes a JSON
+snapshot of its values there, and /metrics merges every worker's snapshot
+(counters and histograms are summed; gauges of dead workers are dropped).
+"""
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+LabelValues = Tuple[str, ...]
+
+# Latency buckets (seconds) sized for an API whose requests take 1ms - 10s
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0
+)
+
+# Response size buckets (bytes)
+DEFAULT_SIZE_BUCKETS = (
+    100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: Iterable[str], values: Iterable[str]) -> str:
+    """Render a {name="value",...} label set"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """Base class for all metric types"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def snapshot(self) -> dict:
+        raise NotImplementedError
+
+    @staticmethod
+    def merge(snapshots: List[dict]) -> dict:
+        raise NotImplementedError
+
+    def render(self, data: dict) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing value"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"values": [[list(key), value] for key, value in self._values.items()]}
+
+    @staticmethod
+    def merge(snapshots: List[dict]) -> dict:
+        merged: Dict[LabelValues, float] = {}
+        for snap in snapshots:
+            for key, value in snap.get("values", []):
+                merged[tuple(key)] = merged.get(tuple(key), 0.0) + value
+        return {"values": [[list(key), value] for key, value in merged.items()]}
+
+    def render(self, data: dict) -> List[str]:
+        return [
+            f"{self.name}{_label_str(self.labelnames, key)} {_format_value(value)}"
+            for key, value in data.get("values", [])
+        ]
+
+
+class Gauge(Counter):
+    """
+    Value that can go up and down.
+
+    A gauge may be backed by a callback evaluated at scrape time, returning
+    either a single number or a mapping of label tuples to numbers.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        callback: Optional[Callable[[], object]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def set(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1.0, **labels: str):
+        self.inc(-amount, **labels)
+
+    def snapshot(self) -> dict:
+        if self._callback is not None:
+            try:
+                result = self._callback()
+            except Exception:
+                # A broken collector must never break the scrape
+                return {"values": []}
+            if isinstance(result, dict):
+                return {"values": [[list(key), value] for key, value in result.items()]}
+            return {"values": [[[], result]]}
+        return super().snapshot()
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed buckets"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"values": [[list(key), list(series)] for key, series in self._values.items()]}
+
+    @staticmethod
+    def merge(snapshots: List[dict]) -> dict:
+        merged: Dict[LabelValues, List[float]] = {}
+        for snap in snapshots:
+            for key, series in snap.get("values", []):
+                current = merged.get(tuple(key))
+                if current is None:
+                    merged[tuple(key)] = list(series)
+                else:
+                    merged[tuple(key)] = [a + b for a, b in zip(current, series)]
+        return {"values": [[list(key), series] for key, series in merged.items()]}
+
+    def render(self, data: dict) -> List[str]:
+        lines = []
+        bounds = list(self.buckets) + [float("inf")]
+        for key, series in data.get("values", []):
+            cumulative = 0.0
+            for bound, count in zip(bounds, series[:-1]):
+                cumulative += count
+                labels = _label_str(self.labelnames + ("le",), list(key) + [_format_value(bound)])
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _label_str(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together by /metrics"""
+
+    def __init__(self, multiproc_dir: Optional[str] = None, flush_interval: float = 5.0):
+        self._metrics: Dict[str, Metric] = {}
+        self._multiproc_dir = multiproc_dir
+        self._flush_interval = flush_interval
+        self._last_flush = 0.0
+        self._flush_lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        callback: Optional[Callable[[], object]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> dict:
+        """Current values of every metric in this process"""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    # ===== Multi-worker aggregation =====
+
+    def _snapshot_path(self, pid: int) -> str:
+        return os.path.join(self._multiproc_dir, f"metrics-{pid}.json")
+
+    def flush(self, force: bool = False):
+        """
+        Write this worker's snapshot to the shared directory.
+        Throttled to once per flush interval unless forced.
+        """
+        if not self._multiproc_dir:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_flush < self._flush_interval:
+            return
+        if not self._flush_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._last_flush = now
+            os.makedirs(self._multiproc_dir, exist_ok=True)
+            path = self._snapshot_path(os.getpid())
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, path)
+        finally:
+            self._flush_lock.release()
+
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _collect(self) -> Dict[str, dict]:
+        """Merge snapshots of all workers (or just this one in single-process mode)"""
+        if not self._multiproc_dir:
+            return self.snapshot()
+
+        self.flush(force=True)
+
+        per_metric: Dict[str, List[dict]] = {name: [] for name in self._metrics}
+        for filename in os.listdir(self._multiproc_dir):
+            if not (filename.startswith("metrics-") and filename.endswith(".json")):
+                continue
+            pid = int(filename[len("metrics-"):-len(".json")])
+            alive = self._pid_alive(pid)
+            try:
+                with open(os.path.join(self._multiproc_dir, filename)) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, snap in data.items():
+                metric = self._metrics.get(name)
+                if metric is None:
+                    continue
+                # Counters of exited workers still count; their gauges do not
+                if isinstance(metric, Gauge) and not alive:
+                    continue
+                per_metric[name].append(snap)
+
+        return {
+            name: type(self._metrics[name]).merge(snaps)
+            for name, snaps in per_metric.items()
+        }
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)"""
+        data = self._collect()
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type_name}")
+            lines.extend(metric.render(data.get(name, {})))
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(
+    multiproc_dir=settings.METRICS_MULTIPROC_DIR,
+    flush_interval=settings.METRICS_FLUSH_INTERVAL_SECONDS,
+)
+
+
+# ===== HTTP metrics =====
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "Total HTTP requests by method, route template and status code",
+    ("method", "route", "status"),
+)
+
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status code",
+    ("method", "route", "status"),
+)
+
+http_response_size_bytes = registry.histogram(
+    "http_response_size_bytes",
+    "HTTP response body size by method and route template",
+    ("method", "route"),
+    buckets=DEFAULT_SIZE_BUCKETS,
+)
+
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+)
+
+http_exceptions_total = registry.counter(
+    "http_exceptions_total",
+    "Unhandled exceptions mapped to error responses, by exception type",
+    ("exception",),
+)
+
+
+# ===== Admission control =====
+
+admission_queue_seconds = registry.histogram(
+    "admission_queue_seconds",
+    "Time admitted requests waited for a concurrency slot, by lane",
+    ("lane",),
+)
+
+admission_rejected_total = registry.counter(
+    "admission_rejected_total",
+    "Requests rejected with 503 by admission control, by lane and reason (queue_full, queue_timeout, db_pool)",
+    ("lane", "reason"),
+)
+
+
+# ===== Deadlines =====
+
+db_statement_timeouts_total = registry.counter(
+    "db_statement_timeouts_total",
+    "Statements stopped by the request time budget, by lane and stage (before_execute, database)",
+    ("lane", "stage"),
+)
+
+
+# ===== Resource gauges =====
+
+def _db_pool_stats() -> Dict[LabelValues, float]:
+    """Connection pool usage of each lane's engine"""
+    from app.core.database import engines
+
+    stats = {}
+    for lane, lane_engine in engines.items():
+        pool = lane_engine.pool
+        for state, getter in (
+            ("size", "size"),
+            ("checked_out", "checkedout"),
+            ("checked_in", "checkedin"),
+            ("overflow", "overflow"),
+        ):
+            if hasattr(pool, getter):
+                stats[(lane, state)] = getattr(pool, getter)()
+    return stats
+
+
+def _threadpool_stats() -> Dict[LabelValues, float]:
+    """
+    Usage of the worker threadpool that runs sync routes.
+    `waiting` is the queue of requests blocked on a free thread.
+    """
+    import anyio.to_thread
+
+    statistics = anyio.to_thread.current_default_thread_limiter().statistics()
+    return {
+        ("total",): statistics.total_tokens,
+        ("busy",): statistics.borrowed_tokens,
+        ("waiting",): statistics.tasks_waiting,
+    }
+
+
+db_pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Database connection pool state per lane (size, checked_out, checked_in, overflow)",
+    ("lane", "state"),
+    callback=_db_pool_stats,
+)
+
+threadpool_threads = registry.gauge(
+    "threadpool_threads",
+    "Sync route threadpool state (total, busy, waiting)",
+    ("state",),
+    callback=_threadpool_stats,
+)
+
+
+def _admission_stats() -> Dict[LabelValues, float]:
+    """Slots in use and requests queued by admission control, per lane"""
+    from app.core.admission import admission_controllers
+
+    stats = {}
+    for lane, controller in admission_controllers.items():
+        stats[(lane, "limit")] = controller.max_concurrent
+        stats[(lane, "active")] = controller.active
+        stats[(lane, "waiting")] = controller.waiting
+    return stats
+
+
+admission_requests = registry.gauge(
+    "admission_requests",
+    "Admission control state per lane (limit, active, waiting)",
+    ("lane", "state"),
+    callback=_admission_stats,
+)
@@ -0,0 +1,78 @@
+"""
+Keyset (cursor) pagination over a (timestamp, id) ordering.
+
+A cursor is the opaque, URL-safe encoding of the last row's timestamp and
+id. The next page is everything strictly after that position in the
+ordering, so a page costs one index range read no matter how deep the
+client has scrolled, and rows inserted meanwhile do not shift the pages
+(unlike skip/limit).
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """
+    Cursor pointing just past a row.
+
+    Args:
+        timestamp: Row's value of the ordering timestamp column
+        row_id: Row's id (tie-breaker)
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Position encoded in a cursor.
+
+    Args:
+        cursor: Cursor from encode_cursor
+
+    Returns:
+        (timestamp, id) of the row the cursor points past
+
+    Raises:
+        ValueError: If the cursor is malformed (maps to 400)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise ValueError("Invalid cursor") from None
+
+
+def after_cursor(timestamp_column, id_column, cursor: str, descending: bool = False) -> ColumnElement:
+    """
+    Filter selecting the rows after a cursor in ORDER BY timestamp, id (both
+    ascending, or both descending).
+
+    Written as OR/AND rather than a row-value comparison so MariaDB uses a
+    range on the (…, timestamp, id) index.
+
+    Args:
+        timestamp_column: Ordering timestamp column
+        id_column: Primary key column
+        cursor: Cursor from encode_cursor
+        descending: Whether the ordering is newest first
+
+    Returns:
+        SQL filter clause
+
+    Raises:
+        ValueError: If the cursor is malformed (maps to 400)
+    """
+    timestamp, row_id = decode_cursor(cursor)
+    if descending:
+        return or_(timestamp_column < timestamp, and_(timestamp_column == timestamp, id_column < row_id))
+    return or_(timestamp_column > timestamp, and_(timestamp_column == timestamp, id_column > row_id))
@@ -0,0 +1,285 @@
+"""
+Slow-request profiler.
+
+While PROFILER_ENABLED is set, a background thread samples the Python stack
+of every thread currently executing a traced request (see RequestTrace.
+active_threads) every PROFILER_INTERVAL_MS. Sampling all in-flight requests
+is what lets a request be captured *after* it turned out to be slow:
+
+- requests slower than PROFILER_SLOW_REQUEST_MS are saved, and
+- a PROFILER_SAMPLE_RATE fraction of all requests is saved regardless of latency.
+
+Each saved profile holds the sampled call tree (also as folded stacks, which
+flamegraph.pl and speedscope import directly), the request's spans and its SQL
+statements. Profiles are kept in a bounded on-disk ring of PROFILER_RING_SIZE
+files under PROFILER_DIR, listed and downloaded through the admin API.
+
+Async handlers share the event loop thread, so while one awaits, samples of
+that thread can belong to another request; sync routes (the majority here)
+run on their own worker thread and are attributed exactly.
+"""
+import json
+import os
+import random
+import re
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.tracing import RequestTrace
+
+# Frames of an idle event loop thread are not attributed to any request
+_IDLE_FUNCTIONS = {"select", "poll", "epoll", "_run_once", "run_forever"}
+
+_STDLIB_DIR = sysconfig.get_paths()["stdlib"] + os.sep
+
+_PROFILE_ID_PATTERN = re.compile(r"^[0-9TZ]+-\d+-\d+$")
+
+
+class StackSampler:
+    """Background thread sampling the stacks of threads serving active requests"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._active: Dict[int, "ActiveProfile"] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, profile: "ActiveProfile"):
+        with self._lock:
+            self._active[id(profile)] = profile
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def unregister(self, profile: "ActiveProfile"):
+        with self._lock:
+            self._active.pop(id(profile), None)
+
+    def _run(self):
+        own_thread = threading.get_ident()
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                active = list(self._active.values())
+            if not active:
+                continue
+
+            frames = sys._current_frames()
+            collected = []
+            for profile in active:
+                for thread_id in tuple(profile.trace.active_threads):
+                    if thread_id == own_thread:
+                        continue
+                    frame = frames.get(thread_id)
+                    if frame is None:
+                        continue
+                    stack = _collapse(frame)
+                    if stack:
+                        collected.append((profile, stack))
+
+            # Counted under the lock, and only for profiles still registered: once
+            # unregister() returns, finish() reads samples without them changing
+            with self._lock:
+                for profile, stack in collected:
+                    if id(profile) in self._active:
+                        profile.samples[stack] += 1
+
+
+def _frame_label(frame) -> str:
+    """Short label for a frame: function (path:line), path relative to app/, site-packages or stdlib"""
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_STDLIB_DIR):
+        return f"{code.co_name} ({filename[len(_STDLIB_DIR):]}:{code.co_firstlineno})"
+    site_packages = filename.rfind("site-packages" + os.sep)
+    app_dir = filename.rfind(os.sep + "app" + os.sep)
+    if site_packages != -1:
+        filename = filename[site_packages + len("site-packages" + os.sep):]
+    elif app_dir != -1:
+        filename = filename[app_dir + 1:]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _collapse(frame, max_depth: int = 128) -> Optional[str]:
+    """Collapse a frame chain into a root-first folded stack, or None if the thread is idle"""
+    if frame.f_code.co_name in _IDLE_FUNCTIONS:
+        return None
+
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class ActiveProfile:
+    """Samples collected for one in-flight request"""
+
+    def __init__(self, trace: RequestTrace, sampled: bool):
+        self.trace = trace
+        self.sampled = sampled
+        self.samples: Counter = Counter()
+
+
+def _build_call_tree(samples: Counter) -> dict:
+    """Turn folded stacks into a nested call tree with sample counts"""
+    root = {"name": "<root>", "samples": 0, "children": {}}
+    for stack, count in samples.items():
+        root["samples"] += count
+        node = root
+        for label in stack.split(";"):
+            child = node["children"].get(label)
+            if child is None:
+                child = node["children"][label] = {"name": label, "samples": 0, "children": {}}
+            child["samples"] += count
+            node = child
+
+    def finalize(node: dict) -> dict:
+        children = sorted(node["children"].values(), key=lambda c: c["samples"], reverse=True)
+        return {
+            "name": node["name"],
+            "samples": node["samples"],
+            "children": [finalize(child) for child in children],
+        }
+
+    return finalize(root)
+
+
+class ProfileStore:
+    """Bounded ring of profile files in a directory (oldest files are deleted first)"""
+
+    def __init__(self, directory: str, ring_size: int):
+        self.directory = directory
+        self.ring_size = ring_size
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def save(self, profile: dict) -> str:
+        """Write a profile and trim the ring. Returns the profile ID."""
+        with self._lock:
+            self._sequence += 1
+            profile_id = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%fZ')}-{os.getpid()}-{self._sequence}"
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{profile_id}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"id": profile_id, **profile}, f)
+        os.replace(tmp_path, path)
+
+        self._trim()
+        return profile_id
+
+    def _files(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        # IDs start with a UTC timestamp, so name order is capture order
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".json"))
+
+    def _trim(self):
+        files = self._files()
+        for name in files[:max(0, len(files) - self.ring_size)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                # Another worker trimmed it first
+                pass
+
+    def list_profiles(self) -> List[dict]:
+        """Summaries of stored profiles, newest first"""
+        summaries = []
+        for name in reversed(self._files()):
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            summaries.append({
+                "id": data["id"],
+                "captured_at": data["captured_at"],
+                "method": data["method"],
+                "path": data["path"],
+                "route": data.get("route"),
+                "status_code": data["status_code"],
+                "duration_ms": data["duration_ms"],
+                "reason": data["reason"],
+                "sample_count": data["sample_count"],
+                "statement_count": len(data.get("sql", [])),
+                "size_bytes": os.path.getsize(path),
+            })
+        return summaries
+
+    def get_profile_path(self, profile_id: str) -> Optional[str]:
+        """Path of a stored profile, or None if it does not exist (or the ID is malformed)"""
+        if not _PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = os.path.join(self.directory, f"{profile_id}.json")
+        return path if os.path.isfile(path) else None
+
+
+sampler = StackSampler(interval=settings.PROFILER_INTERVAL_MS / 1000)
+profile_store = ProfileStore(settings.PROFILER_DIR, settings.PROFILER_RING_SIZE)
+
+
+def begin(trace: Optional[RequestTrace]) -> Optional[ActiveProfile]:
+    """Start sampling a request (no-op unless the profiler is enabled)"""
+    if not settings.PROFILER_ENABLED or trace is None:
+        return None
+    profile = ActiveProfile(trace, sampled=random.random() < settings.PROFILER_SAMPLE_RATE)
+    sampler.register(profile)
+    return profile
+
+
+def finish(profile: Optional[ActiveProfile], status_code: int, duration: float) -> Optional[dict]:
+    """
+    Stop sampling a request.
+
+    Returns:
+        Profile document to store if the request was slow or sampled, otherwise None
+    """
+    if profile is None:
+        return None
+    sampler.unregister(profile)
+
+    duration_ms = duration * 1000
+    if duration_ms >= settings.PROFILER_SLOW_REQUEST_MS:
+        reason = "slow"
+    elif profile.sampled:
+        reason = "sampled"
+    else:
+        return None
+
+    trace = profile.trace
+
+    def offset_ms(t: float) -> float:
+        return round((t - trace.start) * 1000, 3)
+
+    return {
+        "captured_at": datetime.utcnow().isoformat() + "Z",
+        "reason": reason,
+        "method": trace.method,
+        "path": trace.path,
+        "route": trace.route,
+        "status_code": status_code,
+        "duration_ms": round(duration_ms, 3),
+        "interval_ms": settings.PROFILER_INTERVAL_MS,
+        "sample_count": sum(profile.samples.values()),
+        "spans": [
+            {"name": name, "start_ms": offset_ms(start), "duration_ms": round((end - start) * 1000, 3), "description": description}
+            for name, start, end, description in trace.spans
+        ],
+        "sql": [
+            {"statement": statement, "start_ms": offset_ms(start), "duration_ms": round((end - start) * 1000, 3)}
+            for statement, start, end in trace.statements
+        ],
+        "call_tree": _build_call_tree(profile.samples),
+        "folded_stacks": [f"{stack} {count}" for stack, count in profile.samples.most_common()],
+    }
@@ -0,0 +1,40 @@
+"""
+Per-route SQL statement budgets.
+
+Each route in app/routers declares how many SQL statements a single request
+may execute, below the router decorator:
+
+    @router.get("/dashboard/stats", response_model=DashboardStatsResponse)
+    @query_budget(9)
+    def get_dashboard_stats(...):
+
+benchmarks/query_budget.py exercises every route against a fixture dataset
+and fails (non-zero exit) when a route exceeds its budget or declares none,
+printing the offending statements. At runtime RequestMiddleware logs a
+warning when a traced request goes over budget.
+"""
+from typing import Callable, Optional
+
+_BUDGET_ATTRIBUTE = "__query_budget__"
+
+
+def query_budget(max_statements: int) -> Callable:
+    """
+    Declare the maximum number of SQL statements one request to a route may execute.
+
+    Args:
+        max_statements: Statement budget, including authentication lookups
+
+    Returns:
+        Decorator that records the budget on the endpoint function
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        # Copied onto wrappers by functools.wraps (e.g. TracedRoute), so the route still sees it
+        setattr(endpoint, _BUDGET_ATTRIBUTE, max_statements)
+        return endpoint
+    return decorator
+
+
+def get_query_budget(endpoint: Callable) -> Optional[int]:
+    """Statement budget declared for an endpoint, or None if it has none"""
+    return getattr(endpoint, _BUDGET_ATTRIBUTE, None)
@@ -0,0 +1,347 @@
+"""
+Lightweight request-scoped tracing.
+
+RequestMiddleware starts a RequestTrace per request and keeps it in a
+context variable, which is copied into the threadpool that runs sync routes.
+Spans are recorded for:
+- JWT decode and principal load (app/core/dependencies.py)
+- dependency resolution, the endpoint body and response serialization
+  (TracedRoute, used by every APIRouter)
+- each public service call (@traced_service on the service classes)
+- every SQL statement (cursor execute hooks on the engine)
+
+The spans are returned to the browser as a Server-Timing header and can
+optionally be appended to a local file as OTLP-compatible JSON.
+"""
+import asyncio
+import functools
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar("current_trace", default=None)
+
+_export_lock = threading.Lock()
+
+
+class RequestTrace:
+    """Spans and SQL statements recorded for a single request"""
+
+    def __init__(self, method: str, path: str):
+        self.trace_id = secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.start = time.perf_counter()
+        self.start_unix_ns = time.time_ns()
+        # (name, start, end, description)
+        self.spans: List[Tuple[str, float, float, Optional[str]]] = []
+        # (statement, start, end)
+        self.statements: List[Tuple[str, float, float]] = []
+        self.handler_start: Optional[float] = None
+        self.endpoint_start: Optional[float] = None
+        self.endpoint_end: Optional[float] = None
+        # Threads currently executing this request (read by the sampling profiler)
+        self.active_threads: Set[int] = set()
+        self.loop_thread: Optional[int] = None
+
+    def add_span(self, name: str, start: float, end: float, description: Optional[str] = None):
+        self.spans.append((name, start, end, description))
+
+    def add_statement(self, statement: str, start: float, end: float):
+        self.statements.append((statement, start, end))
+
+    @property
+    def db_time(self) -> float:
+        return sum(end - start for _, start, end in self.statements)
+
+    def server_timing(self) -> str:
+        """
+        Render the Server-Timing header value.
+        Spans sharing a name (e.g. repeated service calls) are summed.
+        """
+        totals: Dict[str, float] = {}
+        descriptions: Dict[str, Optional[str]] = {}
+        for name, start, end, description in self.spans:
+            totals[name] = totals.get(name, 0.0) + (end - start)
+            descriptions.setdefault(name, description)
+
+        if self.statements:
+            totals["db"] = self.db_time
+            descriptions["db"] = f"{len(self.statements)} queries"
+
+        totals["total"] = time.perf_counter() - self.start
+        descriptions.setdefault("total", None)
+
+        entries = []
+        for name, duration in totals.items():
+            entry = f"{name};dur={duration * 1000:.1f}"
+            if descriptions.get(name):
+                entry += f';desc="{descriptions[name]}"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+    def _unix_ns(self, perf_time: float) -> str:
+        return str(self.start_unix_ns + int((perf_time - self.start) * 1_000_000_000))
+
+    def to_otlp(self, status_code: int) -> dict:
+        """Render the trace as an OTLP/JSON ExportTraceServiceRequest"""
+        end = time.perf_counter()
+
+        def attribute(key: str, value) -> dict:
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        def child(name: str, start: float, stop: float, attributes: List[dict]) -> dict:
+            return {
+                "traceId": self.trace_id,
+                "spanId": secrets.token_hex(8),
+                "parentSpanId": self.span_id,
+                "name": name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": self._unix_ns(start),
+                "endTimeUnixNano": self._unix_ns(stop),
+                "attributes": attributes,
+            }
+
+        route = self.route or self.path
+        spans = [{
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": f"{self.method} {route}",
+            "kind": 2,  # SPAN_KIND_SERVER
+            "startTimeUnixNano": self._unix_ns(self.start),
+            "endTimeUnixNano": self._unix_ns(end),
+            "attributes": [
+                attribute("http.method", self.method),
+                attribute("http.route", route),
+                attribute("http.target", self.path),
+                attribute("http.status_code", status_code),
+            ],
+            "status": {"code": 2 if status_code >= 500 else 1},
+        }]
+        for name, start, stop, description in self.spans:
+            attributes = [attribute("description", description)] if description else []
+            spans.append(child(name, start, stop, attributes))
+        for statement, start, stop in self.statements:
+            spans.append(child("db.query", start, stop, [
+                attribute("db.system", "mysql"),
+                attribute("db.statement", statement[:2000]),
+            ]))
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [attribute("service.name", "whittaker-api")]},
+                "scopeSpans": [{
+                    "scope": {"name": "app.core.tracing"},
+                    "spans": spans,
+                }],
+            }]
+        }
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Trace of the request being handled, or None outside a request"""
+    return _current_trace.get()
+
+
+def start_trace(method: str, path: str):
+    """Start a trace for the current request. Returns a token for finish_trace()."""
+    if not settings.TRACING_ENABLED:
+        return None
+    return _current_trace.set(RequestTrace(method, path))
+
+
+def finish_trace(token, status_code: int):
+    """End the current request's trace, exporting it if configured"""
+    if token is None:
+        return
+    trace = _current_trace.get()
+    _current_trace.reset(token)
+
+    if trace is not None and settings.TRACE_EXPORT_PATH:
+        export_otlp(trace, status_code)
+
+
+def export_otlp(trace: RequestTrace, status_code: int):
+    """Append the trace as one line of OTLP/JSON to TRACE_EXPORT_PATH"""
+    line = json.dumps(trace.to_otlp(status_code))
+    directory = os.path.dirname(settings.TRACE_EXPORT_PATH)
+    with _export_lock:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(settings.TRACE_EXPORT_PATH, "a") as f:
+            f.write(line + "\n")
+
+
+@contextmanager
+def span(name: str, description: Optional[str] = None):
+    """Record a span around a block of code (no-op outside a traced request)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, start, time.perf_counter(), description)
+
+
+def _wrap_callable(func: Callable, name: str) -> Callable:
+    """Wrap a sync or async callable in a span, preserving its signature"""
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        # The span covers the whole iteration, e.g. a streamed export
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            with span(name):
+                yield from func(*args, **kwargs)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def traced_service(cls):
+    """
+    Class decorator recording a span for every public static method of a service.
+    Spans are named after the call, e.g. "AdminService.get_all_users".
+    """
+    for attr_name, attr in list(vars(cls).items()):
+        if attr_name.startswith("_") or not isinstance(attr, staticmethod):
+            continue
+        setattr(cls, attr_name, staticmethod(_wrap_callable(attr.__func__, f"{cls.__name__}.{attr_name}")))
+    return cls
+
+
+def _trace_endpoint(endpoint: Callable) -> Callable:
+    """
+    Wrap a route endpoint to mark where dependency resolution ends and
+    response serialization begins.
+    """
+    if getattr(endpoint, "__traced__", False):
+        return endpoint
+
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None:
+                return await endpoint(*args, **kwargs)
+            trace.endpoint_start = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                trace.endpoint_end = time.perf_counter()
+                trace.add_span("endpoint", trace.endpoint_start, trace.endpoint_end)
+        wrapper = async_wrapper
+    else:
+        @functools.wraps(endpoint)
+        def sync_wrapper(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None:
+                return endpoint(*args, **kwargs)
+            # The endpoint body runs on a worker thread while the loop serves others
+            thread_id = threading.get_ident()
+            trace.active_threads.discard(trace.loop_thread)
+            trace.active_threads.add(thread_id)
+            trace.endpoint_start = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                trace.endpoint_end = time.perf_counter()
+                trace.add_span("endpoint", trace.endpoint_start, trace.endpoint_end)
+                trace.active_threads.discard(thread_id)
+                if trace.loop_thread is not None:
+                    trace.active_threads.add(trace.loop_thread)
+        wrapper = sync_wrapper
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+class TracedRoute(APIRoute):
+    """
+    APIRoute that records dependency resolution ("deps"), the endpoint body
+    ("endpoint") and response_model validation plus JSON rendering ("serialize").
+    Use as APIRouter(route_class=TracedRoute).
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _trace_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route_path = self.path
+
+        async def traced_handler(request):
+            trace = _current_trace.get()
+            if trace is None:
+                return await handler(request)
+
+            trace.route = route_path
+            trace.loop_thread = threading.get_ident()
+            trace.active_threads.add(trace.loop_thread)
+            trace.handler_start = time.perf_counter()
+            try:
+                response = await handler(request)
+            finally:
+                trace.active_threads.discard(trace.loop_thread)
+                trace.loop_thread = None
+
+            if trace.endpoint_start is not None:
+                trace.add_span("deps", trace.handler_start, trace.endpoint_start, "auth + session + body")
+            if trace.endpoint_end is not None:
+                trace.add_span("serialize", trace.endpoint_end, time.perf_counter(), "response_model + JSON")
+            return response
+
+        return traced_handler
+
+
+def instrument_engine(engine: Engine):
+    """Record every SQL statement executed on the engine in the current trace"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("trace_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("trace_query_start")
+        if not starts:
+            return
+        start = starts.pop()
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add_statement(statement, start, time.perf_counter())
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("trace_query_start"):
+            conn.info["trace_query_start"].pop()
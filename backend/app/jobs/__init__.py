@@ -0,0 +1 @@
+# Scheduled jobs (run as python -m app.jobs.<name>)
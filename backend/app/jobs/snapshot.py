@@ -0,0 +1,285 @@
+"""
+Incremental Parquet snapshots for offline analytics.
+
+Exports quote_requests, claims, contact_messages, users and audit_logs to
+Parquet files under SNAPSHOT_DIR (on the uploads volume), so analysts can
+query the files instead of running ad-hoc queries against MariaDB.
+
+Layout (Hive-style partitions, readable by DuckDB, pandas, Spark, ...):
+
+    <SNAPSHOT_DIR>/<table>/[category=<category>/]created_month=<YYYY-MM>/part-<run>-<batch>.parquet
+    <SNAPSHOT_DIR>/_state.json        high-water marks per table
+
+Each run exports only rows past the table's high-water mark:
+- tables with updated_at: ordered by (updated_at, id), so edited rows are
+  exported again; keep the row with the latest updated_at per id
+- audit_logs (append-only): ordered by id
+
+Rows younger than LAG_SECONDS are left for the next run, so transactions
+still in flight when the job runs are not skipped by the high-water mark.
+
+quote_requests and claims are partitioned by category as well, and their
+quote_data / claim_data JSON is flattened into typed columns per category
+(nested objects become parent_child columns, lists stay JSON strings). The
+raw JSON is kept alongside. Flattened column types are inferred per file,
+so read partitions with union_by_name (DuckDB) or an equivalent schema
+merge. users.hashed_password is never exported.
+
+Usage (from backend/, e.g. nightly from cron):
+    python -m app.jobs.snapshot
+    python -m app.jobs.snapshot --tables claims users --full
+"""
+import argparse
+import json
+import logging
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, Date, Integer, JSON, Numeric, String, Text, TIMESTAMP, and_, func, or_, select, text
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.audit_log import AuditLog
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "_state.json"
+
+# Rows committed in the last LAG_SECONDS are exported by the next run
+LAG_SECONDS = 60
+
+# Rows read per round trip and written per Parquet file (per partition)
+BATCH_SIZE = 50_000
+
+
+class SnapshotTable:
+    """How one table is exported"""
+
+    def __init__(self, model, watermark: str, json_column: Optional[str] = None, exclude: Tuple[str, ...] = ()):
+        self.model = model
+        self.name = model.__tablename__
+        # "updated_at": (updated_at, id) high-water mark; "id": id high-water mark
+        self.watermark = watermark
+        # JSON column flattened per category (also partitions by category)
+        self.json_column = json_column
+        self.columns = [column for column in model.__table__.columns if column.name not in exclude]
+
+
+TABLES: Dict[str, SnapshotTable] = {
+    table.name: table for table in [
+        SnapshotTable(QuoteRequest, "updated_at", json_column="quote_data"),
+        SnapshotTable(Claim, "updated_at", json_column="claim_data"),
+        SnapshotTable(ContactMessage, "updated_at"),
+        SnapshotTable(User, "updated_at", exclude=("hashed_password",)),
+        SnapshotTable(AuditLog, "id"),
+    ]
+}
+
+
+def arrow_type(column) -> pa.DataType:
+    """Arrow type for a model column (explicit, so all-NULL batches keep the schema)"""
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision or 18, column_type.scale or 0)
+    if isinstance(column_type, TIMESTAMP):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, (String, Text, JSON)):
+        return pa.string()
+    raise TypeError(f"No Arrow type for column {column.table.name}.{column.name} ({column_type})")
+
+
+def flatten(data, prefix: str = "") -> Dict:
+    """Flatten nested dicts into {parent_child: value}; lists are kept as JSON strings"""
+    flat = {}
+    if not isinstance(data, dict):
+        return flat
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}_"))
+        elif isinstance(value, list):
+            flat[name] = json.dumps(value)
+        else:
+            flat[name] = value
+    return flat
+
+
+def infer_array(values: List) -> pa.Array:
+    """Typed array for flattened JSON values, falling back to strings for mixed or empty columns"""
+    if any(value is not None for value in values):
+        try:
+            array = pa.array(values)
+            if not pa.types.is_null(array.type):
+                return array
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+def build_table(table: SnapshotTable, rows: List) -> pa.Table:
+    """Arrow table for a batch of rows of one partition"""
+    arrays = {}
+    for index, column in enumerate(table.columns):
+        values = [row[index] for row in rows]
+        if column.name == table.json_column or isinstance(column.type, JSON):
+            values = [None if value is None else json.dumps(value, default=str) for value in values]
+        arrays[column.name] = pa.array(values, type=arrow_type(column))
+
+    if table.json_column:
+        json_index = [column.name for column in table.columns].index(table.json_column)
+        flattened = [flatten(row[json_index]) for row in rows]
+        keys = sorted({key for item in flattened for key in item})
+        for key in keys:
+            name = f"{table.json_column}_{key}"
+            if name not in arrays:
+                arrays[name] = infer_array([item.get(key) for item in flattened])
+
+    return pa.table(arrays)
+
+
+def partition_path(table: SnapshotTable, row) -> str:
+    """Partition directory (relative to the table directory) for a row"""
+    names = [column.name for column in table.columns]
+    created_at = row[names.index("created_at")]
+    parts = []
+    if table.json_column:
+        parts.append(f"category={row[names.index('category')]}")
+    parts.append(f"created_month={created_at:%Y-%m}")
+    return os.path.join(*parts)
+
+
+def load_state(directory: str) -> Dict:
+    path = os.path.join(directory, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(directory: str, state: Dict):
+    """Write the high-water marks atomically"""
+    path = os.path.join(directory, STATE_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def write_parquet(path: str, arrow_table: pa.Table):
+    """Write a Parquet file atomically (readers never see a partial file)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    pq.write_table(arrow_table, tmp_path, compression="zstd")
+    os.replace(tmp_path, path)
+
+
+def export_table(conn, table: SnapshotTable, mark: Optional[Dict], directory: str, run_id: str, state: Dict) -> int:
+    """
+    Export the rows of one table past its high-water mark.
+
+    Args:
+        conn: Database connection
+        table: Table to export
+        mark: High-water mark from the previous run, or None for a full export
+        directory: Snapshot root directory
+        run_id: Identifier of this run (part of the file names)
+        state: State dict, updated and saved after every batch
+
+    Returns:
+        Number of rows exported
+    """
+    model = table.model
+    # On the database clock, which stamped created_at and updated_at (the job host's may differ)
+    cutoff = func.current_timestamp() - text(f"INTERVAL {LAG_SECONDS} SECOND")
+    query = select(*table.columns)
+
+    if table.watermark == "updated_at":
+        query = query.where(model.updated_at <= cutoff).order_by(model.updated_at, model.id)
+        if mark:
+            mark_time = datetime.fromisoformat(mark["updated_at"])
+            query = query.where(or_(
+                model.updated_at > mark_time,
+                and_(model.updated_at == mark_time, model.id > mark["id"]),
+            ))
+    else:
+        query = query.where(model.created_at <= cutoff).order_by(model.id)
+        if mark:
+            query = query.where(model.id > mark["id"])
+
+    names = [column.name for column in table.columns]
+    result = conn.execution_options(stream_results=True, yield_per=BATCH_SIZE).execute(query)
+    exported = 0
+    for batch_number, rows in enumerate(result.partitions()):
+        partitions = defaultdict(list)
+        for row in rows:
+            partitions[partition_path(table, row)].append(row)
+        for partition, partition_rows in partitions.items():
+            path = os.path.join(directory, table.name, partition, f"part-{run_id}-{batch_number:05d}.parquet")
+            write_parquet(path, build_table(table, partition_rows))
+
+        last = rows[-1]
+        mark = {"id": last[names.index("id")]}
+        if table.watermark == "updated_at":
+            mark["updated_at"] = last[names.index("updated_at")].isoformat()
+        state[table.name] = mark
+        save_state(directory, state)
+        exported += len(rows)
+        logger.info(f"{table.name}: batch {batch_number} exported {len(rows)} rows into {len(partitions)} partitions")
+    return exported
+
+
+def run_snapshot(tables: List[str], full: bool = False, directory: Optional[str] = None) -> Dict[str, int]:
+    """
+    Export the given tables incrementally.
+
+    Args:
+        tables: Names of the tables to export (keys of TABLES)
+        full: Ignore the high-water marks and export every row again
+        directory: Snapshot root (defaults to SNAPSHOT_DIR)
+
+    Returns:
+        Dictionary mapping table name to the number of rows exported
+    """
+    directory = directory or settings.SNAPSHOT_DIR
+    os.makedirs(directory, exist_ok=True)
+    state = load_state(directory)
+    run_id = f"{datetime.utcnow():%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+
+    counts = {}
+    with engine.connect() as conn:
+        for name in tables:
+            mark = None if full else state.get(name)
+            counts[name] = export_table(conn, TABLES[name], mark, directory, run_id, state)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", nargs="+", choices=sorted(TABLES), default=list(TABLES), help="Tables to export")
+    parser.add_argument("--full", action="store_true", help="Ignore the high-water marks and export everything")
+    parser.add_argument("--dir", help=f"Snapshot directory (default: SNAPSHOT_DIR={settings.SNAPSHOT_DIR})")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    counts = run_snapshot(args.tables, full=args.full, directory=args.dir)
+    for name, count in counts.items():
+        print(f"{name:<20} {count:>10} rows")
+
+
+if __name__ == "__main__":
+    main()
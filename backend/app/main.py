@@ -1,9 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.core.config import settings
-from app.middleware.exception_handler import GlobalExceptionMiddleware
-from app.middleware.logging_middleware import LoggingMiddleware
-from app.routers import auth, quotes, claims, contact, admin
+from app.core.metrics import registry
+from app.middleware.admission_middleware import AdmissionMiddleware
+from app.middleware.request_middleware import RequestMiddleware
+from app.routers import auth, quotes, claims, contact, admin, team, catalog, me, batch
 
 app = FastAPI(
     title="Whittaker Agency API",
@@ -11,6 +13,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Lanes and admission control (innermost: rejected requests still get CORS headers and are logged)
+app.add_middleware(AdmissionMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -18,18 +23,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Admin detail versions, sent back as If-Match on updates
+    expose_headers=["ETag"],
 )
 
-# Custom middleware
-app.add_middleware(GlobalExceptionMiddleware)
-app.add_middleware(LoggingMiddleware)
+# Custom middleware (timing, logging and exception mapping in one ASGI pass)
+app.add_middleware(RequestMiddleware)
 
 # Routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(quotes.router, prefix="/api/v1/quotes", tags=["Quotes"])
 app.include_router(claims.router, prefix="/api/v1/claims", tags=["Claims"])
 app.include_router(contact.router, prefix="/api/v1/contact", tags=["Contact"])
+app.include_router(me.router, prefix="/api/v1/me", tags=["Me"])
+app.include_router(team.router, prefix="/api/v1/team", tags=["Team"])
+app.include_router(catalog.router, prefix="/api/v1/catalog", tags=["Catalog"])
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
+# Same batch endpoint per lane: admin routes are batched on the admin lane
+app.include_router(batch.router, prefix="/api/v1/batch", tags=["Batch"])
+app.include_router(batch.router, prefix="/api/v1/admin/batch", tags=["Batch"])
 
 
 @app.get("/")
@@ -44,3 +56,12 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus metrics (text exposition format).
+    Not proxied by nginx - scrape the API container directly.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,70 @@
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing import Dict, Optional
+import logging
+
+from app.core import lanes, metrics, tracing
+from app.core.admission import AdmissionController, Overloaded, admission_controllers
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cheap endpoints that must answer even under overload (probes, scrapes)
+EXEMPT_PATHS = {"/", "/health", "/metrics"}
+
+
+class AdmissionMiddleware:
+    """
+    Pure ASGI middleware that assigns each request to its lane
+    (app/core/lanes.py) and admits it through that lane's AdmissionController
+    (app/core/admission.py).
+
+    The lane is kept in a context variable for the whole request, so database
+    sessions use the lane's connection pool. A request holds its admission
+    slot until the response has been sent (including streamed exports).
+    Rejected requests get 503 with Retry-After without touching the
+    threadpool or the database. Queue time is recorded as an "admission" span
+    (Server-Timing) and in the admission_queue_seconds histogram. Installed
+    inside RequestMiddleware and CORSMiddleware, so 503s are logged, counted
+    and carry CORS headers like any other response.
+    """
+
+    def __init__(self, app: ASGIApp, controllers: Optional[Dict[str, AdmissionController]] = None):
+        self.app = app
+        self.controllers = admission_controllers if controllers is None else controllers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        lane = lanes.lane_for_path(scope["path"])
+        lane_token = lanes.set_lane(lane)
+        try:
+            controller = self.controllers.get(lane) if settings.ADMISSION_ENABLED else None
+            if controller is None:
+                await self.app(scope, receive, send)
+                return
+
+            try:
+                with tracing.span("admission", f"{lane} queue wait"):
+                    queued = await controller.acquire()
+            except Overloaded as exc:
+                metrics.admission_rejected_total.inc(lane=lane, reason=exc.reason)
+                logger.warning(f"Rejected {scope['method']} {scope['path']} ({lane} lane): {exc}")
+                response = JSONResponse(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    content={"detail": "The service is busy. Please retry shortly."},
+                    headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+                )
+                await response(scope, receive, send)
+                return
+
+            metrics.admission_queue_seconds.observe(queued, lane=lane)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                controller.release()
+        finally:
+            lanes.reset_lane(lane_token)
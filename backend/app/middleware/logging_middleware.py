@@ -1,32 +0,0 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-import time
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Logging middleware for request/response tracking
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-
-        # Log request
-        logger.info(f"Request: {request.method} {request.url.path}")
-
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration = time.time() - start_time
-
-        # Log response
-        logger.info(
-            f"Response: {request.method} {request.url.path} "
-            f"Status: {response.status_code} Duration: {duration:.3f}s"
-        )
-
-        return response
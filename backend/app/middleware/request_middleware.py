@@ -0,0 +1,211 @@
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core import metrics, profiler, tracing
+from app.core.deadlines import DeadlineExceeded
+from app.core.lanes import ADMIN, lane_for_path
+from app.core.query_budget import get_query_budget
+from app.services.system_log_service import SystemLogService
+from typing import Tuple
+import anyio
+import logging
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+
+def map_exception(exc: Exception) -> Tuple[int, str]:
+    """
+    Map an exception raised by a route or service to an HTTP status code and detail.
+
+    Args:
+        exc: Exception that escaped the route handler
+
+    Returns:
+        Tuple of (status code, detail message)
+    """
+    if isinstance(exc, ValueError):
+        # Validation errors -> 400 Bad Request
+        return status.HTTP_400_BAD_REQUEST, str(exc)
+    if isinstance(exc, PermissionError):
+        # Permission denied -> 403 Forbidden
+        return status.HTTP_403_FORBIDDEN, str(exc)
+    if isinstance(exc, KeyError):
+        # Not found -> 404 Not Found
+        return status.HTTP_404_NOT_FOUND, str(exc)
+    if isinstance(exc, StaleDataError):
+        # Optimistic concurrency conflict (If-Match / version mismatch) -> 409 Conflict
+        return status.HTTP_409_CONFLICT, str(exc)
+    if isinstance(exc, DeadlineExceeded):
+        # Request time budget ran out (statement not sent or interrupted) -> 504 Gateway Timeout
+        return status.HTTP_504_GATEWAY_TIMEOUT, str(exc)
+    if "HTTPException" in type(exc).__name__:
+        # FastAPI HTTPException
+        return (
+            getattr(exc, 'status_code', status.HTTP_500_INTERNAL_SERVER_ERROR),
+            getattr(exc, 'detail', str(exc)),
+        )
+    # All other exceptions -> 500 Internal Server Error
+    return status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error"
+
+
+class RequestMiddleware:
+    """
+    Pure ASGI middleware for request timing, logging and exception mapping.
+
+    Replaces the stacked LoggingMiddleware and GlobalExceptionMiddleware
+    (both BaseHTTPMiddleware), which each wrapped the request in an extra task
+    and response stream. Everything happens in a single pass here:
+    - logs the request and the response status/duration
+    - records request count, latency, response size and in-flight metrics
+      labelled by route template (see app/core/metrics.py)
+    - starts the request trace and returns its spans as a Server-Timing
+      header (see app/core/tracing.py)
+    - optionally profiles slow or sampled requests (see app/core/profiler.py)
+    - catches service exceptions, logs them to the SystemLog table and maps
+      them to HTTP status codes (ValueError=400, PermissionError=403, KeyError=404,
+      StaleDataError=409, DeadlineExceeded=504)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response_started = False
+        response_size = 0
+
+        # Log request
+        logger.info(f"Request: {method} {path}")
+        metrics.http_requests_in_flight.inc()
+        trace_token = tracing.start_trace(method, path)
+        profile = profiler.begin(tracing.current_trace())
+        # Internal breakdown for admin devtools; not exposed on public routes outside DEBUG
+        server_timing = settings.SERVER_TIMING_ENABLED and (settings.DEBUG or lane_for_path(path) == ADMIN)
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_started, response_size
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                trace = tracing.current_trace()
+                if trace is not None and server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", trace.server_timing())
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Headers already went out - nothing sensible left to send
+            if response_started:
+                raise
+
+            await self._log_exception(scope, exc)
+            metrics.http_exceptions_total.inc(exception=type(exc).__name__)
+
+            status_code, detail = map_exception(exc)
+            response = JSONResponse(
+                status_code=status_code,
+                content={"detail": detail}
+            )
+            await response(scope, receive, send_wrapper)
+        finally:
+            # Log response
+            duration = time.perf_counter() - start_time
+            logger.info(
+                f"Response: {method} {path} "
+                f"Status: {status_code} Duration: {duration:.3f}s"
+            )
+            self._record_metrics(scope, status_code, duration, response_size)
+            self._check_query_budget(scope)
+            captured = profiler.finish(profile, status_code, duration)
+            tracing.finish_trace(trace_token, status_code)
+            if captured is not None:
+                # The response is already sent; write the profile off the event loop,
+                # and only log a failure (there is no response left to report it on)
+                try:
+                    await anyio.to_thread.run_sync(profiler.profile_store.save, captured)
+                except Exception:
+                    logger.exception(f"Failed to save profile for {method} {path}")
+
+    @staticmethod
+    def _record_metrics(scope: Scope, status_code: int, duration: float, response_size: int):
+        """Record request metrics labelled by route template (not raw path, to bound cardinality)"""
+        route = scope.get("route")
+        route_template = getattr(route, "path", None) or "<unmatched>"
+        method = scope["method"]
+
+        metrics.http_requests_in_flight.dec()
+        metrics.http_requests_total.inc(method=method, route=route_template, status=str(status_code))
+        metrics.http_request_duration_seconds.observe(
+            duration, method=method, route=route_template, status=str(status_code)
+        )
+        metrics.http_response_size_bytes.observe(response_size, method=method, route=route_template)
+        metrics.registry.flush()
+
+    @staticmethod
+    def _check_query_budget(scope: Scope):
+        """Warn when a request executed more SQL statements than its route's @query_budget"""
+        trace = tracing.current_trace()
+        endpoint = getattr(scope.get("route"), "endpoint", None)
+        budget = get_query_budget(endpoint) if endpoint is not None else None
+        if trace is not None and budget is not None and len(trace.statements) > budget:
+            logger.warning(
+                f"Query budget exceeded: {scope['method']} {trace.route or scope['path']} "
+                f"executed {len(trace.statements)} statements (budget {budget})"
+            )
+
+    @staticmethod
+    async def _log_exception(scope: Scope, exc: Exception):
+        """Log the exception (with its traceback) and record it in the SystemLog table"""
+        method = scope["method"]
+        path = scope["path"]
+
+        logger.exception(f"Unhandled exception on {method} {path}: {type(exc).__name__}: {exc}")
+
+        # Get database session for logging
+        db: Session = SessionLocal()
+
+        try:
+            # Extract user info if available
+            user_id = None
+            user = scope.get("state", {}).get("user")
+            if user is not None:
+                user_id = user.id
+
+            client = scope.get("client")
+
+            # Log the exception to database
+            await SystemLogService.log_exception(
+                db=db,
+                level="ERROR",
+                message=f"Unhandled exception: {str(exc)}",
+                exception_type=type(exc).__name__,
+                exception_message=str(exc),
+                stack_trace=traceback.format_exc(),
+                request_method=method,
+                request_path=path,
+                request_ip=client[0] if client else None,
+                user_id=user_id
+            )
+
+        except Exception:
+            logger.exception(f"Failed to record the exception on {method} {path} in the system log")
+
+        finally:
+            db.close()
@@ -8,6 +8,7 @@ from app.models.contact_message import ContactMessage
 from app.models.system_log import SystemLog
 from app.models.team_member import TeamMember
 from app.models.attachment import Attachment
+from app.models.tombstone import Tombstone
 
 __all__ = [
     "User",
@@ -18,4 +19,5 @@ __all__ = [
     "SystemLog",
     "TeamMember",
     "Attachment",
+    "Tombstone",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey, Date, JSON
+from sqlalchemy import Column, Index, Integer, String, Text, TIMESTAMP, ForeignKey, Date, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -12,6 +12,17 @@ class Claim(Base):
     """
     __tablename__ = "claims"
 
+    # Composite indexes for the hot filter + ORDER BY created_at shapes (migration 002)
+    __table_args__ = (
+        Index("ix_claims_status_created_at", "status", "created_at"),
+        # Covers the customer list validators and keyset pages: (id, version) of a user's page (migration 004)
+        Index("ix_claims_user_id_created_at_id_version", "user_id", "created_at", "id", "version"),
+        # Admin change feed: rows after a cursor in (updated_at, id) order (migration 005)
+        Index("ix_claims_updated_at_id", "updated_at", "id"),
+        Index("ix_claims_category_subcategory_created_at", "category", "subcategory", "created_at"),
+        Index("ix_claims_appointment_requested", "appointment_requested"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     category = Column(String(30), nullable=False, index=True)
@@ -26,6 +37,7 @@ class Claim(Base):
     status = Column(String(20), default="submitted", nullable=False, index=True)  # submitted, contacted, closed
     admin_notes = Column(Text, nullable=True)  # Internal notes from admin, not visible to customer
     contacted_at = Column(TIMESTAMP, nullable=True)  # When agent reached out
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # Bumped on every update (ETag / If-Match)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False, index=True)
     updated_at = Column(
         TIMESTAMP,
@@ -34,5 +46,9 @@ class Claim(Base):
         nullable=False
     )
 
+    # ORM flushes also check and bump the version (StaleDataError on a concurrent change).
+    # eager_defaults loads created_at/updated_at with the INSERT (RETURNING on MariaDB 10.5+)
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="claims")
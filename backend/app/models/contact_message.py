@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey, Date
+from sqlalchemy import Column, Index, Integer, String, Text, TIMESTAMP, ForeignKey, Date
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,17 @@ class ContactMessage(Base):
     """Contact messages from users (authenticated or guest)"""
     __tablename__ = "contact_messages"
 
+    # Composite indexes for the hot filter + ORDER BY created_at shapes (migration 002)
+    __table_args__ = (
+        Index("ix_contact_messages_status_created_at", "status", "created_at"),
+        # Covers the customer list validators and keyset pages: (id, version) of a user's page (migration 004)
+        Index("ix_contact_messages_user_id_created_at_id_version", "user_id", "created_at", "id", "version"),
+        # Admin change feed: rows after a cursor in (updated_at, id) order (migration 005)
+        Index("ix_contact_messages_updated_at_id", "updated_at", "id"),
+        Index("ix_contact_messages_subject_created_at", "subject", "created_at"),
+        Index("ix_contact_messages_appointment_date", "appointment_date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     full_name = Column(String(200), nullable=False)
@@ -19,8 +30,13 @@ class ContactMessage(Base):
     admin_response = Column(Text, nullable=True)
     appointment_date = Column(Date, nullable=True)
     responded_at = Column(TIMESTAMP, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # Bumped on every update (ETag / If-Match)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False, index=True)
     updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp(), nullable=False)
 
+    # ORM flushes also check and bump the version (StaleDataError on a concurrent change).
+    # eager_defaults loads created_at/updated_at with the INSERT (RETURNING on MariaDB 10.5+)
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="contact_messages")
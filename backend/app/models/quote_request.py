@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey, JSON, Numeric, Date
+from sqlalchemy import Column, Index, Integer, String, Text, TIMESTAMP, ForeignKey, JSON, Numeric, Date
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -7,6 +7,17 @@ from app.core.database import Base
 class QuoteRequest(Base):
     __tablename__ = "quote_requests"
 
+    # Composite indexes for the hot filter + ORDER BY created_at shapes (migration 002)
+    __table_args__ = (
+        Index("ix_quote_requests_status_created_at", "status", "created_at"),
+        # Covers the customer list validators and keyset pages: (id, version) of a user's page (migration 004)
+        Index("ix_quote_requests_user_id_created_at_id_version", "user_id", "created_at", "id", "version"),
+        # Admin change feed: rows after a cursor in (updated_at, id) order (migration 005)
+        Index("ix_quote_requests_updated_at_id", "updated_at", "id"),
+        Index("ix_quote_requests_category_subcategory_created_at", "category", "subcategory", "created_at"),
+        Index("ix_quote_requests_appointment_date", "appointment_date"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     category = Column(String(30), nullable=False, index=True)
@@ -18,6 +29,7 @@ class QuoteRequest(Base):
     quote_amount = Column(Numeric(10, 2), nullable=True)
     appointment_date = Column(Date, nullable=True)
     quoted_at = Column(TIMESTAMP, nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # Bumped on every update (ETag / If-Match)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False, index=True)
     updated_at = Column(
         TIMESTAMP,
@@ -26,5 +38,9 @@ class QuoteRequest(Base):
         nullable=False
     )
 
+    # ORM flushes also check and bump the version (StaleDataError on a concurrent change).
+    # eager_defaults loads created_at/updated_at with the INSERT (RETURNING on MariaDB 10.5+)
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="quote_requests")
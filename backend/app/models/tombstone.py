@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Index, Integer, String, TIMESTAMP, event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# Tables whose deletes are recorded, for the admin change feeds (app/services/sync_service.py)
+TRACKED_TABLES = ("quote_requests", "claims", "contact_messages", "users")
+
+
+class Tombstone(Base):
+    """
+    Marker left behind by a deleted row, so clients syncing a table
+    incrementally learn that the row is gone.
+    """
+    __tablename__ = "tombstones"
+
+    # Change feed range reads: one entity type, in (deleted_at, entity_id) order (migration 005)
+    __table_args__ = (
+        Index("ix_tombstones_entity_type_deleted_at_entity_id", "entity_type", "deleted_at", "entity_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity_type = Column(String(50), nullable=False)  # Table name of the deleted row
+    entity_id = Column(Integer, nullable=False)
+    deleted_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False)
+
+
+@event.listens_for(Session, "before_flush")
+def record_tombstones(session, flush_context, instances):
+    """Add a tombstone for every tracked row deleted in this flush (cascaded deletes included)"""
+    for instance in session.deleted:
+        table = getattr(instance, "__tablename__", None)
+        if table in TRACKED_TABLES:
+            session.add(Tombstone(entity_type=table, entity_id=instance.id))
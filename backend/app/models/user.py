@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP
+from sqlalchemy import Column, Index, Integer, String, Boolean, TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -7,6 +7,11 @@ from app.core.database import Base
 class User(Base):
     __tablename__ = "users"
 
+    # Admin change feed: rows after a cursor in (updated_at, id) order (migration 005)
+    __table_args__ = (
+        Index("ix_users_updated_at_id", "updated_at", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -23,8 +28,9 @@ class User(Base):
         nullable=False
     )
 
-    # Relationships
-    quote_requests = relationship("QuoteRequest", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
-    claims = relationship("Claim", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
+    # Relationships (loaded on access only: every authenticated request loads its User,
+    # and eager "selectin" loading added two queries fetching all of the user's rows each time)
+    quote_requests = relationship("QuoteRequest", back_populates="user", cascade="all, delete-orphan", lazy="select")
+    claims = relationship("Claim", back_populates="user", cascade="all, delete-orphan", lazy="select")
     audit_logs = relationship("AuditLog", back_populates="user", lazy="dynamic")
     contact_messages = relationship("ContactMessage", back_populates="user", lazy="dynamic")
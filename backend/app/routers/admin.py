@@ -1,9 +1,18 @@
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+import itertools
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, status, Query, HTTPException, Header, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Iterator, Optional
 
+from app.core.batch import not_batchable
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.http_cache import version_etag
+from app.core.profiler import profile_store
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute, time_budget
 from app.models.user import User
 from app.schemas.admin_schemas import (
     DashboardStatsResponse,
@@ -22,12 +31,25 @@ from app.schemas.admin_schemas import (
     AdminUserDetail,
     AdminUserUpdate,
     AdminUserListResponse,
+    ProfileSummary,
+    AdminQuoteBulkStatusUpdate,
+    AdminClaimBulkStatusUpdate,
+    AdminMessageBulkStatusUpdate,
+    AdminBulkUpdateResponse,
+    AdminQuoteChanges,
+    AdminClaimChanges,
+    AdminMessageChanges,
+    AdminUserChanges,
 )
+from app.schemas.team_schemas import TeamMemberAdmin, TeamMemberCreate, TeamMemberUpdate
 from app.services.admin_service import AdminService
+from app.services.export_service import ExportService
+from app.services.sync_service import SyncService
+from app.services.team_service import TeamService
 from typing import List
 
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
@@ -48,9 +70,51 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+def _parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """
+    Version expected by an If-Match header (the ETag of a detail response).
+
+    Returns None when the header is absent or "*" (update unconditionally).
+
+    Raises:
+        ValueError: If the header is not a single version ETag (maps to 400)
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    if not tag.isdigit():
+        raise ValueError("Invalid If-Match header. Send the ETag of the last detail response")
+    return int(tag)
+
+
+def _set_etag(response: Response, version: int):
+    """Expose the row version as the ETag (sent back as If-Match on updates)"""
+    response.headers["ETag"] = version_etag(version)
+
+
+def _export_response(chunks: Iterator[str], format: str, name: str) -> StreamingResponse:
+    """
+    Stream an export as a file download.
+
+    The first chunk is produced here, inside the endpoint, so invalid filters
+    raise ValueError (400) before the response status has been sent.
+    """
+    first_chunk = next(chunks)
+    filename = f"{name}-{datetime.utcnow().strftime('%Y%m%d')}.{format}"
+    return StreamingResponse(
+        itertools.chain([first_chunk], chunks),
+        media_type=ExportService.FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # ===== Dashboard Endpoints =====
 
 @router.get("/dashboard/stats", response_model=DashboardStatsResponse)
+@query_budget(20)
 def get_dashboard_stats(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
@@ -63,6 +127,7 @@ def get_dashboard_stats(
 
 
 @router.get("/dashboard/recent-activity", response_model=List[RecentActivityItem])
+@query_budget(4)
 def get_recent_activity(
     limit: int = Query(10, ge=1, le=50, description="Maximum number of items to return"),
     db: Session = Depends(get_db),
@@ -76,6 +141,7 @@ def get_recent_activity(
 
 
 @router.get("/dashboard/attention-items", response_model=AttentionItemsResponse)
+@query_budget(9)
 def get_attention_items(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
@@ -90,6 +156,7 @@ def get_attention_items(
 # ===== Quote Management Endpoints =====
 
 @router.get("/quotes", response_model=dict)
+@query_budget(3)
 def get_all_quotes(
     category: Optional[str] = Query(None, description="Filter by category"),
     subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
@@ -123,9 +190,52 @@ def get_all_quotes(
     }
 
 
+@router.get("/quotes/export")
+@query_budget(2)
+@time_budget(300)
+@not_batchable
+def export_quotes(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format: csv or ndjson"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    search: Optional[str] = Query(None, description="Search by customer name or email"),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Export all quote requests matching the list filters as CSV or NDJSON (streamed).
+    Requires admin authentication.
+    """
+    chunks = ExportService.export_quotes(
+        fmt=format,
+        category=category,
+        subcategory=subcategory,
+        status=status,
+        search=search,
+    )
+    return _export_response(chunks, format, "quotes")
+
+
+@router.get("/quotes/changes", response_model=AdminQuoteChanges)
+@query_budget(3)
+def get_quote_changes(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous response; omit to start from the beginning"),
+    limit: int = Query(100, ge=1, le=500, description="Most changes per response"),
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Get quote requests created, updated or deleted after a cursor, for incremental refresh.
+    Requires admin authentication.
+    """
+    return SyncService.get_quote_changes(db=db, cursor=cursor, limit=limit)
+
+
 @router.get("/quotes/{quote_id}", response_model=AdminQuoteDetail)
+@query_budget(2)
 def get_quote_detail(
     quote_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ):
@@ -141,18 +251,24 @@ def get_quote_detail(
             detail=f"Quote {quote_id} not found"
         )
 
+    _set_etag(response, quote.version)
     return quote
 
 
 @router.put("/quotes/{quote_id}", response_model=AdminQuoteDetail)
+@query_budget(5)
 def update_quote(
     quote_id: int,
     update_data: AdminQuoteUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ):
     """
     Update a quote request (admin only).
+    Send the ETag of the detail as If-Match to get 409 instead of overwriting
+    a concurrent change to the quote.
     Requires admin authentication.
     """
     updated_quote = AdminService.update_quote(
@@ -160,6 +276,7 @@ def update_quote(
         quote_id=quote_id,
         update_data=update_data,
         admin_user_id=admin_user.id,
+        expected_version=_parse_if_match(if_match),
     )
 
     if updated_quote is None:
@@ -168,12 +285,35 @@ def update_quote(
             detail=f"Quote {quote_id} not found"
         )
 
+    _set_etag(response, updated_quote.version)
     return updated_quote
 
 
+@router.post("/quotes/bulk-status", response_model=AdminBulkUpdateResponse)
+@query_budget(4)
+def bulk_update_quote_status(
+    update_data: AdminQuoteBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Set the status of many quote requests at once, selected by ids or by the list filters.
+    Returns the outcome per id (updated, unchanged or not_found).
+    Requires admin authentication.
+    """
+    return AdminService.bulk_update_quote_status(
+        db=db,
+        new_status=update_data.status,
+        admin_user_id=admin_user.id,
+        ids=update_data.ids,
+        filters=update_data.filters,
+    )
+
+
 # ===== Claim Management Endpoints =====
 
 @router.get("/claims", response_model=dict)
+@query_budget(3)
 def get_all_claims(
     category: Optional[str] = Query(None, description="Filter by category"),
     subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
@@ -207,9 +347,52 @@ def get_all_claims(
     }
 
 
+@router.get("/claims/export")
+@query_budget(2)
+@time_budget(300)
+@not_batchable
+def export_claims(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format: csv or ndjson"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    search: Optional[str] = Query(None, description="Search by customer name or email"),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Export all claims matching the list filters as CSV or NDJSON (streamed).
+    Requires admin authentication.
+    """
+    chunks = ExportService.export_claims(
+        fmt=format,
+        category=category,
+        subcategory=subcategory,
+        status=status,
+        search=search,
+    )
+    return _export_response(chunks, format, "claims")
+
+
+@router.get("/claims/changes", response_model=AdminClaimChanges)
+@query_budget(3)
+def get_claim_changes(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous response; omit to start from the beginning"),
+    limit: int = Query(100, ge=1, le=500, description="Most changes per response"),
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Get claims created, updated or deleted after a cursor, for incremental refresh.
+    Requires admin authentication.
+    """
+    return SyncService.get_claim_changes(db=db, cursor=cursor, limit=limit)
+
+
 @router.get("/claims/{claim_id}", response_model=AdminClaimDetail)
+@query_budget(2)
 def get_claim_detail(
     claim_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ):
@@ -225,18 +408,24 @@ def get_claim_detail(
             detail=f"Claim {claim_id} not found"
         )
 
+    _set_etag(response, claim.version)
     return claim
 
 
 @router.put("/claims/{claim_id}", response_model=AdminClaimDetail)
+@query_budget(5)
 def update_claim(
     claim_id: int,
     update_data: AdminClaimUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ):
     """
     Update a claim (admin only).
+    Send the ETag of the detail as If-Match to get 409 instead of overwriting
+    a concurrent change to the claim.
     Requires admin authentication.
     """
     updated_claim = AdminService.update_claim(
@@ -244,6 +433,7 @@ def update_claim(
         claim_id=claim_id,
         update_data=update_data,
         admin_user_id=admin_user.id,
+        expected_version=_parse_if_match(if_match),
     )
 
     if updated_claim is None:
@@ -252,12 +442,35 @@ def update_claim(
             detail=f"Claim {claim_id} not found"
         )
 
+    _set_etag(response, updated_claim.version)
     return updated_claim
 
 
+@router.post("/claims/bulk-status", response_model=AdminBulkUpdateResponse)
+@query_budget(4)
+def bulk_update_claim_status(
+    update_data: AdminClaimBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Set the status of many claims at once, selected by ids or by the list filters.
+    Returns the outcome per id (updated, unchanged or not_found).
+    Requires admin authentication.
+    """
+    return AdminService.bulk_update_claim_status(
+        db=db,
+        new_status=update_data.status,
+        admin_user_id=admin_user.id,
+        ids=update_data.ids,
+        filters=update_data.filters,
+    )
+
+
 # ===== Contact Message Management Endpoints =====
 
 @router.get("/messages", response_model=dict)
+@query_budget(3)
 def get_all_messages(
     subject: Optional[str] = Query(None, description="Filter by subject"),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -291,9 +504,52 @@ def get_all_messages(
     }
 
 
+@router.get("/messages/export")
+@query_budget(2)
+@time_budget(300)
+@not_batchable
+def export_messages(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format: csv or ndjson"),
+    subject: Optional[str] = Query(None, description="Filter by subject"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    search: Optional[str] = Query(None, description="Search by sender name or email"),
+    include_guest: bool = Query(True, description="Include guest messages"),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Export all contact messages matching the list filters as CSV or NDJSON (streamed).
+    Requires admin authentication.
+    """
+    chunks = ExportService.export_messages(
+        fmt=format,
+        subject=subject,
+        status=status,
+        search=search,
+        include_guest=include_guest,
+    )
+    return _export_response(chunks, format, "messages")
+
+
+@router.get("/messages/changes", response_model=AdminMessageChanges)
+@query_budget(3)
+def get_message_changes(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous response; omit to start from the beginning"),
+    limit: int = Query(100, ge=1, le=500, description="Most changes per response"),
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Get contact messages created, updated or deleted after a cursor, for incremental refresh.
+    Requires admin authentication.
+    """
+    return SyncService.get_message_changes(db=db, cursor=cursor, limit=limit)
+
+
 @router.get("/messages/{message_id}", response_model=AdminMessageDetail)
+@query_budget(2)
 def get_message_detail(
     message_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ):
@@ -309,18 +565,24 @@ def get_message_detail(
             detail=f"Message {message_id} not found"
         )
 
+    _set_etag(response, message.version)
     return message
 
 
 @router.put("/messages/{message_id}", response_model=AdminMessageDetail)
+@query_budget(5)
 def update_message(
     message_id: int,
     update_data: AdminMessageUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ):
     """
     Update a contact message (admin only).
+    Send the ETag of the detail as If-Match to get 409 instead of overwriting
+    a concurrent change to the message.
     Requires admin authentication.
     """
     updated_message = AdminService.update_message(
@@ -328,6 +590,7 @@ def update_message(
         message_id=message_id,
         update_data=update_data,
         admin_user_id=admin_user.id,
+        expected_version=_parse_if_match(if_match),
     )
 
     if updated_message is None:
@@ -336,12 +599,35 @@ def update_message(
             detail=f"Message {message_id} not found"
         )
 
+    _set_etag(response, updated_message.version)
     return updated_message
 
 
+@router.post("/messages/bulk-status", response_model=AdminBulkUpdateResponse)
+@query_budget(4)
+def bulk_update_message_status(
+    update_data: AdminMessageBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Set the status of many contact messages at once, selected by ids or by the list filters.
+    Returns the outcome per id (updated, unchanged or not_found).
+    Requires admin authentication.
+    """
+    return AdminService.bulk_update_message_status(
+        db=db,
+        new_status=update_data.status,
+        admin_user_id=admin_user.id,
+        ids=update_data.ids,
+        filters=update_data.filters,
+    )
+
+
 # ===== User Management Endpoints =====
 
 @router.get("/users", response_model=AdminUserListResponse)
+@query_budget(4)
 def get_all_users(
     status: Optional[str] = Query(None, description="Filter by status: active or inactive"),
     search: Optional[str] = Query(None, description="Search by username, email, or full name"),
@@ -377,7 +663,51 @@ def get_all_users(
     )
 
 
+@router.get("/users/export")
+@query_budget(2)
+@time_budget(300)
+@not_batchable
+def export_users(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format: csv or ndjson"),
+    status: Optional[str] = Query(None, description="Filter by status: active or inactive"),
+    search: Optional[str] = Query(None, description="Search by username, email, or full name"),
+    recently_contacted: Optional[str] = Query(None, description="Filter by recent activity: 2weeks, 1month, 3months, 6months, 1year"),
+    sort_by: str = Query("activity", description="Sort field: activity, name, or status"),
+    sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Export all users matching the list filters as CSV or NDJSON (streamed).
+    Requires admin authentication.
+    """
+    chunks = ExportService.export_users(
+        fmt=format,
+        status=status,
+        search=search,
+        recently_contacted=recently_contacted,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+    return _export_response(chunks, format, "users")
+
+
+@router.get("/users/changes", response_model=AdminUserChanges)
+@query_budget(5)
+def get_user_changes(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous response; omit to start from the beginning"),
+    limit: int = Query(100, ge=1, le=500, description="Most changes per response"),
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Get users created, updated or deleted after a cursor, for incremental refresh.
+    Requires admin authentication.
+    """
+    return SyncService.get_user_changes(db=db, cursor=cursor, limit=limit)
+
+
 @router.get("/users/{user_id}", response_model=AdminUserDetail)
+@query_budget(6)
 def get_user_detail(
     user_id: int,
     date_range: Optional[str] = Query(None, description="Date range filter: 30days, 6months, ytd, last_year, all"),
@@ -401,6 +731,7 @@ def get_user_detail(
 
 
 @router.put("/users/{user_id}", response_model=AdminUserDetail)
+@query_budget(8)
 def update_user(
     user_id: int,
     update_data: AdminUserUpdate,
@@ -425,3 +756,122 @@ def update_user(
         )
 
     return updated_user
+
+
+# ===== Team Endpoints =====
+
+@router.get("/team", response_model=List[TeamMemberAdmin])
+@query_budget(2)
+def get_team_members(
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Get all team members, including inactive ones, in display order.
+    Requires admin authentication.
+    """
+    return TeamService.get_all_members(db=db)
+
+
+@router.post("/team", response_model=TeamMemberAdmin, status_code=status.HTTP_201_CREATED)
+@query_budget(4)
+def create_team_member(
+    member_data: TeamMemberCreate,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Add a team member (admin only).
+    The public team roster is rebuilt on its next request.
+    Requires admin authentication.
+    """
+    return TeamService.create_member(db=db, member_data=member_data, admin_user_id=admin_user.id)
+
+
+@router.put("/team/{member_id}", response_model=TeamMemberAdmin)
+@query_budget(5)
+def update_team_member(
+    member_id: int,
+    update_data: TeamMemberUpdate,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Update a team member (admin only).
+    The public team roster is rebuilt on its next request.
+    Requires admin authentication.
+    """
+    member = TeamService.update_member(
+        db=db,
+        member_id=member_id,
+        update_data=update_data,
+        admin_user_id=admin_user.id,
+    )
+
+    if member is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team member {member_id} not found"
+        )
+
+    return member
+
+
+@router.delete("/team/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(4)
+def delete_team_member(
+    member_id: int,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Remove a team member (admin only).
+    The public team roster is rebuilt on its next request.
+    Requires admin authentication.
+    """
+    deleted = TeamService.delete_member(db=db, member_id=member_id, admin_user_id=admin_user.id)
+
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team member {member_id} not found"
+        )
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# ===== Profiler Endpoints =====
+
+@router.get("/profiles", response_model=List[ProfileSummary])
+@query_budget(1)
+def get_profiles(
+    admin_user: User = Depends(require_admin),
+):
+    """
+    List captured request profiles, newest first.
+    Profiles are only captured while PROFILER_ENABLED is set.
+    Requires admin authentication.
+    """
+    return profile_store.list_profiles()
+
+
+@router.get("/profiles/{profile_id}")
+@query_budget(1)
+@not_batchable
+def download_profile(
+    profile_id: str,
+    admin_user: User = Depends(require_admin),
+):
+    """
+    Download a captured profile (call tree, folded stacks, spans and SQL statements) as JSON.
+    Requires admin authentication.
+    """
+    path = profile_store.get_profile_path(profile_id)
+
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {profile_id} not found"
+        )
+
+    return FileResponse(path, media_type="application/json", filename=f"profile-{profile_id}.json")
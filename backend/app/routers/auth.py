@@ -2,14 +2,17 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute
 from app.schemas.auth import UserRegister, UserLogin, Token, UserProfile
 from app.services.auth_service import AuthService
 from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.post("/register", response_model=UserProfile, status_code=status.HTTP_201_CREATED)
+@query_budget(6)
 async def register_user(
     user_data: UserRegister,
     db: Session = Depends(get_db)
@@ -24,6 +27,7 @@ async def register_user(
 
 
 @router.post("/login", response_model=Token)
+@query_budget(2)
 async def login_user(
     credentials: UserLogin,
     db: Session = Depends(get_db)
@@ -38,6 +42,7 @@ async def login_user(
 
 
 @router.get("/me", response_model=UserProfile)
+@query_budget(1)
 async def get_current_user_profile(
     current_user: User = Depends(get_current_user)
 ):
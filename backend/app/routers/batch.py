@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.core.batch import run_batch
+from app.core.database import get_db
+from app.core.dependencies import get_current_user
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute
+from app.models.user import User
+from app.schemas.batch_schemas import BatchRequest, BatchResponse
+
+router = APIRouter(route_class=DeadlineRoute)
+security = HTTPBearer(auto_error=False)
+
+
+def get_batch_principal(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: Session = Depends(get_db),
+) -> Optional[User]:
+    """
+    The batch's user, resolved once for all its sub-requests.
+    None for a guest batch (public routes only); an invalid token is a 401,
+    as it would be for the sub-requests themselves.
+    """
+    if credentials is None:
+        return None
+    return get_current_user(request=request, credentials=credentials, db=db)
+
+
+@router.post("/", response_model=BatchResponse)
+@query_budget(1)
+async def batch_requests(
+    batch: BatchRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    principal: Optional[User] = Depends(get_batch_principal),
+):
+    """
+    Run several GET requests to existing routes in one request.
+    Authentication is optional: sub-requests get the batch's user, and
+    routes requiring one answer 401/403 for a guest batch as usual.
+
+    Mounted at /api/v1/batch for public routes and /api/v1/admin/batch for
+    admin routes (each batch stays on its lane's pool and admission limits).
+    The budget covers the principal lookup; each sub-request is held to its
+    own route's @query_budget. See app/core/batch.py.
+    """
+    responses = await run_batch(request=request, sub_requests=batch.requests, db=db, principal=principal)
+    return BatchResponse(responses=responses)
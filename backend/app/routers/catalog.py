@@ -0,0 +1,48 @@
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.core.catalog import CATALOG_BODY, CATALOG_ETAG, CATALOG_VERSION
+from app.core.deadlines import DeadlineRoute
+from app.core.http_cache import not_modified
+from app.core.query_budget import query_budget
+
+router = APIRouter(route_class=DeadlineRoute)
+
+# The unversioned URL may change with a deploy, so clients revalidate it (cheap: 304 on the ETag)
+LATEST_CACHE_CONTROL = "public, max-age=3600, stale-while-revalidate=86400"
+# A versioned URL names one catalog body forever
+VERSIONED_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _catalog_response(request: Request, cache_control: str) -> Response:
+    headers = {"ETag": CATALOG_ETAG, "Cache-Control": cache_control}
+    if not_modified(request, CATALOG_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=CATALOG_BODY, media_type="application/json", headers=headers)
+
+
+@router.get("/")
+@query_budget(0)
+async def get_catalog(request: Request):
+    """
+    Get the insurance category catalog (categories, subcategories and labels).
+    No authentication required.
+
+    The body includes its version; /catalog/{version} serves the same body
+    as immutable, for clients that want to cache it indefinitely.
+    """
+    return _catalog_response(request, LATEST_CACHE_CONTROL)
+
+
+@router.get("/{version}")
+@query_budget(0)
+async def get_catalog_version(version: str, request: Request):
+    """
+    Get a specific version of the insurance category catalog, cached as immutable.
+    No authentication required. Only the current version is served.
+    """
+    if version != CATALOG_VERSION:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Catalog version {version} not found (current: {CATALOG_VERSION})"
+        )
+    return _catalog_response(request, VERSIONED_CACHE_CONTROL)
@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.http_cache import etag_matches, not_modified_response, rows_etag, set_private_etag, version_etag
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute
 from app.models.user import User
 from app.schemas.claim_schemas import ClaimCreate, ClaimResponse
 from app.services.claim_service import ClaimService
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.post("/", response_model=ClaimResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(3)
 def create_claim(
     claim_data: ClaimCreate,
     db: Session = Depends(get_db),
@@ -32,7 +36,10 @@ def create_claim(
 
 
 @router.get("/my-claims", response_model=List[ClaimResponse])
+@query_budget(3)
 def get_user_claims(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
     db: Session = Depends(get_db),
@@ -42,18 +49,30 @@ def get_user_claims(
     Get all claim reports for the current user.
     Requires authentication.
     Supports pagination via skip and limit parameters.
+    Supports If-None-Match: 304 after one index-only query when nothing changed.
     """
-    return ClaimService.get_user_claims(
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = ClaimService.get_user_claims_etag(db=db, user_id=current_user.id, skip=skip, limit=limit)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+    claims = ClaimService.get_user_claims(
         db=db,
         user_id=current_user.id,
         skip=skip,
         limit=limit
     )
+    set_private_etag(response, rows_etag((claim.id, claim.version) for claim in claims))
+    return claims
 
 
 @router.get("/{claim_id}", response_model=ClaimResponse)
+@query_budget(2)
 def get_claim(
     claim_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -61,6 +80,7 @@ def get_claim(
     Get a specific claim report by its ID.
     Requires authentication.
     User must own the claim.
+    Supports If-None-Match (ETag is the claim's version): 304 without serializing.
     """
     claim = ClaimService.get_claim_by_id(
         db=db,
@@ -70,10 +90,15 @@ def get_claim(
     if not claim:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Claim not found")
+    etag = version_etag(claim.version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+    set_private_etag(response, etag)
     return claim
 
 
 @router.delete("/{claim_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(4)
 def delete_claim(
     claim_id: int,
     db: Session = Depends(get_db),
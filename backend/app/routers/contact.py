@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.http_cache import etag_matches, not_modified_response, rows_etag, set_private_etag, version_etag
 from app.core.security import decode_access_token
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute
+from app.core.tracing import span
 from app.models.user import User
 from app.schemas.contact_schemas import (
     ContactMessageCreate,
@@ -15,11 +19,11 @@ from app.schemas.contact_schemas import (
 )
 from app.services.contact_service import ContactService
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user_optional(
+def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
@@ -31,7 +35,8 @@ async def get_current_user_optional(
         return None
 
     token = credentials.credentials
-    payload = decode_access_token(token)
+    with span("jwt"):
+        payload = decode_access_token(token)
 
     if payload is None:
         return None
@@ -40,7 +45,8 @@ async def get_current_user_optional(
     if user_id is None:
         return None
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    with span("principal"):
+        user = db.query(User).filter(User.id == int(user_id)).first()
     if user is None or not user.is_active:
         return None
 
@@ -48,6 +54,7 @@ async def get_current_user_optional(
 
 
 @router.post("/submit", response_model=ContactMessageCreateResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(3)
 def submit_contact_message(
     contact_data: ContactMessageCreate,
     db: Session = Depends(get_db),
@@ -74,7 +81,10 @@ def submit_contact_message(
 
 
 @router.get("/messages", response_model=List[ContactMessageResponse])
+@query_budget(3)
 def get_user_messages(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 10,
     db: Session = Depends(get_db),
@@ -83,20 +93,31 @@ def get_user_messages(
     """
     Get all contact messages for the current user.
     Requires authentication.
+    Supports If-None-Match: 304 after one index-only query when nothing changed.
     """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = ContactService.get_user_messages_etag(db=db, user_id=current_user.id, skip=skip, limit=limit)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
     messages = ContactService.get_user_messages(
         db=db,
         user_id=current_user.id,
         skip=skip,
         limit=limit
     )
+    set_private_etag(response, rows_etag((msg.id, msg.version) for msg in messages))
 
     return [ContactMessageResponse.from_orm(msg) for msg in messages]
 
 
 @router.get("/{message_id}", response_model=ContactMessageDetail)
+@query_budget(2)
 def get_message_detail(
     message_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -104,6 +125,7 @@ def get_message_detail(
     Get a specific contact message by its ID.
     Requires authentication.
     User must own the message.
+    Supports If-None-Match (ETag is the message's version): 304 without serializing.
     """
     message = ContactService.get_message_detail(
         db=db,
@@ -117,4 +139,8 @@ def get_message_detail(
             detail=f"Contact message {message_id} not found"
         )
 
+    etag = version_etag(message.version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+    set_private_etag(response, etag)
     return message
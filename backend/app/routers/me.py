@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.dependencies import get_current_user
+from app.core.http_cache import etag_matches, not_modified_response, set_private_etag
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute
+from app.models.user import User
+from app.schemas.dashboard_schemas import DashboardResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+@query_budget(5)
+def get_dashboard(
+    request: Request,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Items per section"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the current user's dashboard: newest quotes, claims and contact messages
+    as summaries, with the total count of each.
+    Requires authentication.
+    Replaces the three list calls of the dashboard page with one request.
+    Supports If-None-Match: 304 after one index-only query when nothing changed.
+    """
+    # One aggregate query gives the ETag and the section totals
+    stats = DashboardService.get_section_stats(db=db, user_id=current_user.id)
+    etag = DashboardService.dashboard_etag(stats, limit)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+
+    set_private_etag(response, etag)
+    return DashboardService.get_dashboard(db=db, user_id=current_user.id, stats=stats, limit=limit)
@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.http_cache import etag_matches, not_modified_response, set_private_etag, version_etag
+from app.core.query_budget import query_budget
+from app.core.deadlines import DeadlineRoute
 from app.models.user import User
-from app.schemas.quote_schemas import QuoteRequestCreate, QuoteRequestResponse
+from app.schemas.quote_schemas import QuoteRequestCreate, QuoteRequestListResponse, QuoteRequestResponse
 from app.services.quote_service import QuoteService
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.post("/", response_model=QuoteRequestResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(3)
 def create_quote_request(
     quote_data: QuoteRequestCreate,
     db: Session = Depends(get_db),
@@ -28,21 +32,39 @@ def create_quote_request(
     )
 
 
-@router.get("/", response_model=List[QuoteRequestResponse])
+@router.get("/", response_model=QuoteRequestListResponse)
+@query_budget(3)
 def get_user_quote_requests(
+    request: Request,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of quotes to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Get all quote requests for the current user.
+    Get the current user's quote requests, newest first, one page at a time.
     Requires authentication.
+    Items are summaries; GET /quotes/{quote_id} has the full quote.
+    Supports If-None-Match: 304 after one index-only query when nothing changed.
     """
-    return QuoteService.get_user_quote_requests(db=db, user_id=current_user.id)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = QuoteService.get_user_quote_requests_etag(db=db, user_id=current_user.id, limit=limit, cursor=cursor)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+    page, etag = QuoteService.get_user_quote_requests(db=db, user_id=current_user.id, limit=limit, cursor=cursor)
+    set_private_etag(response, etag)
+    return page
 
 
 @router.get("/{quote_id}", response_model=QuoteRequestResponse)
+@query_budget(2)
 def get_quote_request(
     quote_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -50,9 +72,15 @@ def get_quote_request(
     Get a specific quote request by its ID.
     Requires authentication.
     User must own the quote.
+    Supports If-None-Match (ETag is the quote's version): 304 without serializing.
     """
-    return QuoteService.get_quote_request_by_id(
+    quote = QuoteService.get_quote_request_by_id(
         db=db,
         quote_id=quote_id,
         user_id=current_user.id
     )
+    etag = version_etag(quote.version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+    set_private_etag(response, etag)
+    return quote
@@ -0,0 +1,36 @@
+import anyio
+from fastapi import APIRouter, Request, Response, status
+
+from app.core.config import settings
+from app.core.deadlines import DeadlineRoute
+from app.core.http_cache import http_date, not_modified
+from app.core.query_budget import query_budget
+from app.services.team_service import TeamService
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+@router.get("/")
+@query_budget(1)
+async def get_team(request: Request):
+    """
+    Get the active team members in display order.
+    No authentication required.
+
+    Served from an in-memory snapshot (no database access unless an admin
+    edit invalidated it), with ETag/Last-Modified validators and a long
+    public Cache-Control.
+    """
+    snapshot = TeamService.cached_public_snapshot()
+    if snapshot is None:
+        # Cold or invalidated: build it off the event loop
+        snapshot = await anyio.to_thread.run_sync(TeamService.get_public_snapshot)
+
+    headers = {
+        "ETag": snapshot.etag,
+        "Last-Modified": http_date(snapshot.last_modified),
+        "Cache-Control": f"public, max-age={settings.TEAM_CACHE_MAX_AGE_SECONDS}, stale-while-revalidate=86400",
+    }
+    if not_modified(request, snapshot.etag, snapshot.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from decimal import Decimal
@@ -102,6 +102,7 @@ class AdminQuoteDetail(BaseModel):
     quoted_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    version: int  # Sent as the ETag; pass it back as If-Match when updating
 
 
 class AdminQuoteUpdate(BaseModel):
@@ -150,6 +151,7 @@ class AdminClaimDetail(BaseModel):
     contacted_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    version: int  # Sent as the ETag; pass it back as If-Match when updating
 
 
 class AdminClaimUpdate(BaseModel):
@@ -192,6 +194,7 @@ class AdminMessageDetail(BaseModel):
     responded_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    version: int  # Sent as the ETag; pass it back as If-Match when updating
 
 
 class AdminMessageUpdate(BaseModel):
@@ -283,6 +286,115 @@ class AdminUserListResponse(BaseModel):
     pages: int
 
 
+# Bulk Status Update Schemas
+# Most rows a single bulk update may change (by ids or by filter)
+BULK_UPDATE_MAX_ROWS = 1000
+
+
+class AdminSubmissionFilter(BaseModel):
+    """Quote/claim list filters selecting the rows of a bulk update"""
+    category: Optional[str] = None
+    subcategory: Optional[str] = None
+    status: Optional[str] = None
+    search: Optional[str] = Field(None, description="Search by customer name or email")
+
+
+class AdminMessageFilter(BaseModel):
+    """Message list filters selecting the rows of a bulk update"""
+    subject: Optional[str] = None
+    status: Optional[str] = None
+    search: Optional[str] = Field(None, description="Search by sender name or email")
+    include_guest: bool = True
+
+
+class AdminBulkStatusUpdate(BaseModel):
+    """Bulk status change: either explicit ids or list filters, plus the target status"""
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=BULK_UPDATE_MAX_ROWS)
+    status: str = Field(..., description="New status for every selected row")
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (getattr(self, "filters", None) is None):
+            raise ValueError("Provide either ids or filters")
+        return self
+
+
+class AdminQuoteBulkStatusUpdate(AdminBulkStatusUpdate):
+    """Bulk status change for quote requests"""
+    filters: Optional[AdminSubmissionFilter] = None
+
+
+class AdminClaimBulkStatusUpdate(AdminBulkStatusUpdate):
+    """Bulk status change for claims"""
+    filters: Optional[AdminSubmissionFilter] = None
+
+
+class AdminMessageBulkStatusUpdate(AdminBulkStatusUpdate):
+    """Bulk status change for contact messages"""
+    filters: Optional[AdminMessageFilter] = None
+
+
+class AdminBulkUpdateResult(BaseModel):
+    """Outcome for one id of a bulk update"""
+    id: int
+    result: str = Field(..., description="updated, unchanged (already in the status) or not_found")
+    old_status: Optional[str] = None
+
+
+class AdminBulkUpdateResponse(BaseModel):
+    """Result of a bulk status update"""
+    status: str
+    matched: int = Field(..., description="Rows selected by the ids or filters")
+    updated: int = Field(..., description="Rows whose status changed")
+    results: List[AdminBulkUpdateResult]
+
+
+# Change Feed Schemas
+class AdminChanges(BaseModel):
+    """Page of a change feed: rows created or updated, and rows deleted, after the cursor"""
+    deleted: List[int] = Field(..., description="Ids of rows deleted after the cursor")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next request (the one sent, if nothing changed; None while the feed is empty)"
+    )
+    has_more: bool = Field(..., description="Whether more changes are ready now (fetch again with next_cursor)")
+
+
+class AdminQuoteChanges(AdminChanges):
+    """Change feed page for quote requests"""
+    items: List[AdminQuoteListItem]
+
+
+class AdminClaimChanges(AdminChanges):
+    """Change feed page for claims"""
+    items: List[AdminClaimListItem]
+
+
+class AdminMessageChanges(AdminChanges):
+    """Change feed page for contact messages"""
+    items: List[AdminMessageListItem]
+
+
+class AdminUserChanges(AdminChanges):
+    """Change feed page for users"""
+    items: List[AdminUserListItem]
+
+
+# Profiler Schemas
+class ProfileSummary(BaseModel):
+    """Stored request profile (see app/core/profiler.py)"""
+    id: str
+    captured_at: datetime
+    method: str
+    path: str
+    route: Optional[str]
+    status_code: int
+    duration_ms: float
+    reason: str = Field(..., description="Why it was captured: slow or sampled")
+    sample_count: int
+    statement_count: int
+    size_bytes: int
+
+
 # Pagination Helper
 class PaginatedResponse(BaseModel):
     """Generic paginated response wrapper"""
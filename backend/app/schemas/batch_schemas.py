@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List
+
+
+class BatchSubRequest(BaseModel):
+    """One GET request inside a batch"""
+    path: str = Field(..., description="Path and query string as served, e.g. /api/v1/admin/dashboard/stats")
+    headers: Dict[str, str] = Field(default_factory=dict, description="Only If-None-Match and If-Modified-Since are used")
+
+
+class BatchRequest(BaseModel):
+    """GET requests to run together"""
+    requests: List[BatchSubRequest] = Field(..., min_length=1)
+
+
+class BatchSubResponse(BaseModel):
+    """Response to one sub-request"""
+    status: int
+    headers: Dict[str, str]
+    body: Any = Field(None, description="Decoded JSON body (text for other content types); null when empty")
+
+
+class BatchResponse(BaseModel):
+    """Responses in the order of the requests"""
+    responses: List[BatchSubResponse]
@@ -60,3 +60,17 @@ class ClaimResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ClaimSummary(BaseModel):
+    """Claim as listed on the customer dashboard (no incident summary, notes or form data)"""
+    id: int
+    category: str
+    subcategory: Optional[str] = None
+    incident_type: Optional[str] = Field(None, description="claim_data.incident_type, when the form has one")
+    incident_date: date
+    status: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.schemas.claim_schemas import ClaimSummary
+from app.schemas.contact_schemas import ContactMessageResponse
+from app.schemas.quote_schemas import QuoteRequestSummary
+
+
+class DashboardQuotes(BaseModel):
+    """Newest quote requests and the total count"""
+    items: List[QuoteRequestSummary]
+    total: int
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to GET /quotes/ for the next page; null if none")
+
+
+class DashboardClaims(BaseModel):
+    """Newest claim reports and the total count"""
+    items: List[ClaimSummary]
+    total: int
+
+
+class DashboardMessages(BaseModel):
+    """Newest contact messages and the total count"""
+    items: List[ContactMessageResponse]
+    total: int
+
+
+class DashboardResponse(BaseModel):
+    """Everything the customer dashboard shows, in one response"""
+    quotes: DashboardQuotes
+    claims: DashboardClaims
+    messages: DashboardMessages
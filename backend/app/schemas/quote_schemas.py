@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -35,3 +35,22 @@ class QuoteRequestResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class QuoteRequestSummary(BaseModel):
+    """Quote request as listed on the customer dashboard (no form data or notes)"""
+    id: int
+    category: str
+    subcategory: Optional[str] = None
+    status: str
+    quote_amount: Optional[float] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class QuoteRequestListResponse(BaseModel):
+    """One page of the customer's quote requests, newest first"""
+    items: List[QuoteRequestSummary]
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to get the next page; null on the last page")
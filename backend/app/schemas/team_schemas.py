@@ -0,0 +1,50 @@
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from datetime import datetime
+from typing import Optional
+
+
+class TeamMemberPublic(BaseModel):
+    """Team member as shown on the public team page"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    title: str
+    bio: Optional[str]
+    photo_url: Optional[str]
+    display_order: int
+
+
+class TeamMemberAdmin(TeamMemberPublic):
+    """Team member with the fields only admins see"""
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class TeamMemberCreate(BaseModel):
+    """Create request for a team member (admin only)"""
+    name: str = Field(..., min_length=1, max_length=255, description="Full name")
+    title: str = Field(..., min_length=1, max_length=255, description="Role shown under the name")
+    bio: Optional[str] = Field(None, description="Short biography")
+    photo_url: Optional[str] = Field(None, max_length=500, description="Photo URL")
+    display_order: int = Field(0, description="Position on the team page (ascending)")
+    is_active: bool = Field(True, description="Shown on the public team page")
+
+
+class TeamMemberUpdate(BaseModel):
+    """Update request for a team member (admin only)"""
+    name: Optional[str] = Field(None, min_length=1, max_length=255, description="Full name")
+    title: Optional[str] = Field(None, min_length=1, max_length=255, description="Role shown under the name")
+    bio: Optional[str] = Field(None, description="Short biography")
+    photo_url: Optional[str] = Field(None, max_length=500, description="Photo URL")
+    display_order: Optional[int] = Field(None, description="Position on the team page (ascending)")
+    is_active: Optional[bool] = Field(None, description="Shown on the public team page")
+
+    @field_validator('name', 'title', 'display_order', 'is_active')
+    @classmethod
+    def reject_null(cls, v, info: ValidationInfo):
+        """These columns are NOT NULL: omit the field to leave it unchanged"""
+        if v is None:
+            raise ValueError(f"{info.field_name} cannot be null")
+        return v
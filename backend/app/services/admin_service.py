@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_, desc
-from typing import List, Optional, Tuple
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import func, or_, and_, desc, update
+from typing import Callable, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 
 from app.models.quote_request import QuoteRequest
@@ -30,13 +31,63 @@ from app.schemas.admin_schemas import (
     AdminUserDetail,
     AdminUserUpdate,
     UserActivitySummary,
+    AdminSubmissionFilter,
+    AdminMessageFilter,
+    AdminBulkUpdateResult,
+    AdminBulkUpdateResponse,
+    BULK_UPDATE_MAX_ROWS,
 )
+from app.core.tracing import traced_service
 from app.services.audit_log_service import AuditLogService
 
 
+@traced_service
 class AdminService:
     """Business logic for admin dashboard and management"""
 
+    # Valid workflow statuses per entity (validated by the update_* methods)
+    QUOTE_STATUSES = ["pending", "in_review", "quoted", "accepted", "declined"]
+    CLAIM_STATUSES = ["submitted", "contacted", "closed"]
+    MESSAGE_STATUSES = ["new", "read", "responded", "closed"]
+
+    # Columns the list views (and their exports) render, in Admin*ListItem field order.
+    # The list queries select only these: no quote_data/claim_data JSON, incident
+    # summaries, notes or message bodies are read for a list page.
+    QUOTE_LIST_COLUMNS = (
+        QuoteRequest.id,
+        User.full_name.label("customer_name"),
+        User.email.label("customer_email"),
+        QuoteRequest.category,
+        QuoteRequest.subcategory,
+        QuoteRequest.status,
+        QuoteRequest.quote_amount,
+        QuoteRequest.created_at,
+        QuoteRequest.updated_at,
+    )
+    CLAIM_LIST_COLUMNS = (
+        Claim.id,
+        User.full_name.label("customer_name"),
+        User.email.label("customer_email"),
+        Claim.category,
+        Claim.subcategory,
+        Claim.incident_date,
+        Claim.status,
+        Claim.created_at,
+        Claim.updated_at,
+    )
+    # is_guest is derived from user_id
+    MESSAGE_LIST_COLUMNS = (
+        ContactMessage.id,
+        ContactMessage.full_name.label("sender_name"),
+        ContactMessage.email.label("sender_email"),
+        ContactMessage.subject,
+        ContactMessage.status,
+        ContactMessage.user_id,
+        ContactMessage.admin_response,
+        ContactMessage.created_at,
+        ContactMessage.updated_at,
+    )
+
     # ===== Dashboard Methods =====
 
     @staticmethod
@@ -544,7 +595,46 @@ class AdminService:
         Returns:
             Tuple of (list of quotes, total count)
         """
-        query = db.query(QuoteRequest, User.full_name, User.email).join(User)
+        query = AdminService._quotes_query(db, category, subcategory, status, search)
+
+        # Get total count
+        total = query.count()
+
+        # Apply pagination
+        offset = (page - 1) * limit
+        results = query.order_by(QuoteRequest.created_at.desc()).offset(offset).limit(limit).all()
+
+        # Build response items
+        items = [AdminQuoteListItem(**row._mapping) for row in results]
+
+        return items, total
+
+    @staticmethod
+    def _quotes_query(
+        db: Session,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ):
+        """
+        Filtered query over QUOTE_LIST_COLUMNS, shared by the list, export and bulk update.
+
+        Args:
+            db: Database session
+            category: Filter by category
+            subcategory: Filter by subcategory
+            status: Filter by status
+            search: Search by customer name or email
+
+        Returns:
+            Unordered query
+        """
+        query = (
+            db.query(*AdminService.QUOTE_LIST_COLUMNS)
+            .select_from(QuoteRequest)
+            .join(User, QuoteRequest.user_id == User.id)
+        )
 
         # Apply filters
         if category:
@@ -561,31 +651,7 @@ class AdminService:
                     User.email.ilike(search_term)
                 )
             )
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        results = query.order_by(QuoteRequest.created_at.desc()).offset(offset).limit(limit).all()
-
-        # Build response items
-        items = [
-            AdminQuoteListItem(
-                id=quote.id,
-                customer_name=customer_name,
-                customer_email=customer_email,
-                category=quote.category,
-                subcategory=quote.subcategory,
-                status=quote.status,
-                quote_amount=quote.quote_amount,
-                created_at=quote.created_at,
-                updated_at=quote.updated_at,
-            )
-            for quote, customer_name, customer_email in results
-        ]
-
-        return items, total
+        return query
 
     @staticmethod
     def get_quote_detail(db: Session, quote_id: int) -> Optional[AdminQuoteDetail]:
@@ -625,6 +691,7 @@ class AdminService:
             agent_notes=quote.agent_notes,
             quote_amount=quote.quote_amount,
             quoted_at=quote.quoted_at,
+            version=quote.version,
             created_at=quote.created_at,
             updated_at=quote.updated_at,
         )
@@ -635,6 +702,7 @@ class AdminService:
         quote_id: int,
         update_data: AdminQuoteUpdate,
         admin_user_id: int,
+        expected_version: Optional[int] = None,
     ) -> Optional[AdminQuoteDetail]:
         """
         Update a quote request (admin only).
@@ -644,61 +712,55 @@ class AdminService:
             quote_id: ID of the quote to update
             update_data: Update data
             admin_user_id: ID of the admin user making the update
+            expected_version: Version the admin last saw (If-Match), or None to update unconditionally
 
         Returns:
             Updated quote detail or None if not found
 
         Raises:
             ValueError: If status is invalid
+            StaleDataError: If the quote was changed since expected_version
         """
-        quote = db.query(QuoteRequest).filter(QuoteRequest.id == quote_id).first()
-
-        if not quote:
-            return None
-
         # Validate status if provided
-        valid_statuses = ["pending", "in_review", "quoted", "accepted", "declined"]
-        if update_data.status and update_data.status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+        if update_data.status and update_data.status not in AdminService.QUOTE_STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(AdminService.QUOTE_STATUSES)}")
 
-        # Track changes for audit log
-        changes = {}
+        def build_update(old) -> Tuple[dict, dict]:
+            values = {}
+            changes = {}
 
-        # Update fields
-        if update_data.status is not None:
-            if quote.status != update_data.status:
-                changes["status"] = {"old": quote.status, "new": update_data.status}
-                quote.status = update_data.status
+            if update_data.status is not None and update_data.status != old.status:
+                values[QuoteRequest.status] = update_data.status
+                changes["status"] = {"old": old.status, "new": update_data.status}
                 if update_data.status == "quoted":
-                    quote.quoted_at = datetime.utcnow()
+                    values[QuoteRequest.quoted_at] = datetime.utcnow()
 
-        if update_data.quote_amount is not None:
-            if quote.quote_amount != update_data.quote_amount:
-                changes["quote_amount"] = {"old": float(quote.quote_amount) if quote.quote_amount else None, "new": float(update_data.quote_amount)}
-                quote.quote_amount = update_data.quote_amount
+            if update_data.quote_amount is not None and update_data.quote_amount != old.quote_amount:
+                values[QuoteRequest.quote_amount] = update_data.quote_amount
+                changes["quote_amount"] = {
+                    "old": float(old.quote_amount) if old.quote_amount is not None else None,
+                    "new": float(update_data.quote_amount),
+                }
 
-        if update_data.agent_notes is not None:
-            if quote.agent_notes != update_data.agent_notes:
+            if update_data.agent_notes is not None and update_data.agent_notes != old.agent_notes:
+                values[QuoteRequest.agent_notes] = update_data.agent_notes
                 changes["agent_notes"] = {"updated": True}
-                quote.agent_notes = update_data.agent_notes
-
-        # Commit changes
-        db.commit()
-        db.refresh(quote)
-
-        # Audit logging
-        if changes:
-            AuditLogService.log_user_action(
-                db=db,
-                user_id=admin_user_id,
-                action="QUOTE_UPDATED_BY_ADMIN",
-                entity_type="QuoteRequest",
-                entity_id=quote.id,
-                details=f"Admin updated quote request: {changes}",
-            )
 
-        # Return updated detail
-        return AdminService.get_quote_detail(db, quote_id)
+            return values, changes
+
+        return AdminService._apply_update(
+            db=db,
+            model=QuoteRequest,
+            entity_id=quote_id,
+            columns=(QuoteRequest.status, QuoteRequest.quote_amount, QuoteRequest.agent_notes),
+            build_update=build_update,
+            expected_version=expected_version,
+            get_detail=AdminService.get_quote_detail,
+            action="QUOTE_UPDATED_BY_ADMIN",
+            entity_type="QuoteRequest",
+            label="quote request",
+            admin_user_id=admin_user_id,
+        )
 
     # ===== Claim Management Methods =====
 
@@ -727,7 +789,46 @@ class AdminService:
         Returns:
             Tuple of (list of claims, total count)
         """
-        query = db.query(Claim, User.full_name, User.email).join(User)
+        query = AdminService._claims_query(db, category, subcategory, status, search)
+
+        # Get total count
+        total = query.count()
+
+        # Apply pagination
+        offset = (page - 1) * limit
+        results = query.order_by(Claim.created_at.desc()).offset(offset).limit(limit).all()
+
+        # Build response items
+        items = [AdminClaimListItem(**row._mapping) for row in results]
+
+        return items, total
+
+    @staticmethod
+    def _claims_query(
+        db: Session,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ):
+        """
+        Filtered query over CLAIM_LIST_COLUMNS, shared by the list, export and bulk update.
+
+        Args:
+            db: Database session
+            category: Filter by category
+            subcategory: Filter by subcategory
+            status: Filter by status
+            search: Search by customer name or email
+
+        Returns:
+            Unordered query
+        """
+        query = (
+            db.query(*AdminService.CLAIM_LIST_COLUMNS)
+            .select_from(Claim)
+            .join(User, Claim.user_id == User.id)
+        )
 
         # Apply filters
         if category:
@@ -744,31 +845,7 @@ class AdminService:
                     User.email.ilike(search_term)
                 )
             )
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        results = query.order_by(Claim.created_at.desc()).offset(offset).limit(limit).all()
-
-        # Build response items
-        items = [
-            AdminClaimListItem(
-                id=claim.id,
-                customer_name=customer_name,
-                customer_email=customer_email,
-                category=claim.category,
-                subcategory=claim.subcategory,
-                incident_date=claim.incident_date,
-                status=claim.status,
-                created_at=claim.created_at,
-                updated_at=claim.updated_at,
-            )
-            for claim, customer_name, customer_email in results
-        ]
-
-        return items, total
+        return query
 
     @staticmethod
     def get_claim_detail(db: Session, claim_id: int) -> Optional[AdminClaimDetail]:
@@ -812,6 +889,7 @@ class AdminService:
             status=claim.status,
             admin_notes=claim.admin_notes,
             contacted_at=claim.contacted_at,
+            version=claim.version,
             created_at=claim.created_at,
             updated_at=claim.updated_at,
         )
@@ -822,6 +900,7 @@ class AdminService:
         claim_id: int,
         update_data: AdminClaimUpdate,
         admin_user_id: int,
+        expected_version: Optional[int] = None,
     ) -> Optional[AdminClaimDetail]:
         """
         Update a claim (admin only).
@@ -831,64 +910,58 @@ class AdminService:
             claim_id: ID of the claim to update
             update_data: Update data
             admin_user_id: ID of the admin user making the update
+            expected_version: Version the admin last saw (If-Match), or None to update unconditionally
 
         Returns:
             Updated claim detail or None if not found
 
         Raises:
             ValueError: If status is invalid
+            StaleDataError: If the claim was changed since expected_version
         """
-        claim = db.query(Claim).filter(Claim.id == claim_id).first()
-
-        if not claim:
-            return None
-
         # Validate status if provided
-        valid_statuses = ["submitted", "contacted", "closed"]
-        if update_data.status and update_data.status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+        if update_data.status and update_data.status not in AdminService.CLAIM_STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(AdminService.CLAIM_STATUSES)}")
 
-        # Track changes for audit log
-        changes = {}
+        def build_update(old) -> Tuple[dict, dict]:
+            values = {}
+            changes = {}
 
-        # Update fields
-        if update_data.status is not None:
-            if claim.status != update_data.status:
-                changes["status"] = {"old": claim.status, "new": update_data.status}
-                claim.status = update_data.status
+            if update_data.status is not None and update_data.status != old.status:
+                values[Claim.status] = update_data.status
+                changes["status"] = {"old": old.status, "new": update_data.status}
                 if update_data.status == "contacted":
-                    claim.contacted_at = datetime.utcnow()
+                    values[Claim.contacted_at] = datetime.utcnow()
 
-        if update_data.admin_notes is not None:
-            if claim.admin_notes != update_data.admin_notes:
+            if update_data.admin_notes is not None and update_data.admin_notes != old.admin_notes:
+                values[Claim.admin_notes] = update_data.admin_notes
                 changes["admin_notes"] = {"updated": True}
-                claim.admin_notes = update_data.admin_notes
 
-        if update_data.appointment_requested is not None:
-            if claim.appointment_requested != update_data.appointment_requested:
+            if (
+                update_data.appointment_requested is not None
+                and update_data.appointment_requested != old.appointment_requested
+            ):
+                values[Claim.appointment_requested] = update_data.appointment_requested
                 changes["appointment_requested"] = {
-                    "old": str(claim.appointment_requested) if claim.appointment_requested else None,
-                    "new": str(update_data.appointment_requested)
+                    "old": str(old.appointment_requested) if old.appointment_requested else None,
+                    "new": str(update_data.appointment_requested),
                 }
-                claim.appointment_requested = update_data.appointment_requested
 
-        # Commit changes
-        db.commit()
-        db.refresh(claim)
-
-        # Audit logging
-        if changes:
-            AuditLogService.log_user_action(
-                db=db,
-                user_id=admin_user_id,
-                action="CLAIM_UPDATED_BY_ADMIN",
-                entity_type="Claim",
-                entity_id=claim.id,
-                details=f"Admin updated claim: {changes}",
-            )
-
-        # Return updated detail
-        return AdminService.get_claim_detail(db, claim_id)
+            return values, changes
+
+        return AdminService._apply_update(
+            db=db,
+            model=Claim,
+            entity_id=claim_id,
+            columns=(Claim.status, Claim.admin_notes, Claim.appointment_requested),
+            build_update=build_update,
+            expected_version=expected_version,
+            get_detail=AdminService.get_claim_detail,
+            action="CLAIM_UPDATED_BY_ADMIN",
+            entity_type="Claim",
+            label="claim",
+            admin_user_id=admin_user_id,
+        )
 
     # ===== Contact Message Management Methods =====
 
@@ -917,7 +990,57 @@ class AdminService:
         Returns:
             Tuple of (list of messages, total count)
         """
-        query = db.query(ContactMessage)
+        query = AdminService._messages_query(db, subject, status, search, include_guest)
+
+        # Get total count
+        total = query.count()
+
+        # Apply pagination
+        offset = (page - 1) * limit
+        results = query.order_by(ContactMessage.created_at.desc()).offset(offset).limit(limit).all()
+
+        # Build response items
+        items = [AdminService._message_list_item(message) for message in results]
+
+        return items, total
+
+    @staticmethod
+    def _message_list_item(message) -> AdminMessageListItem:
+        """List item from a MESSAGE_LIST_COLUMNS row"""
+        return AdminMessageListItem(
+            id=message.id,
+            sender_name=message.sender_name,
+            sender_email=message.sender_email,
+            subject=message.subject,
+            status=message.status,
+            is_guest=(message.user_id is None),
+            admin_response=message.admin_response,
+            created_at=message.created_at,
+            updated_at=message.updated_at,
+        )
+
+    @staticmethod
+    def _messages_query(
+        db: Session,
+        subject: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        include_guest: bool = True,
+    ):
+        """
+        Filtered query over MESSAGE_LIST_COLUMNS, shared by the list, export and bulk update.
+
+        Args:
+            db: Database session
+            subject: Filter by subject
+            status: Filter by status
+            search: Search by sender name or email
+            include_guest: Whether to include guest messages
+
+        Returns:
+            Unordered query
+        """
+        query = db.query(*AdminService.MESSAGE_LIST_COLUMNS).select_from(ContactMessage)
 
         # Apply filters
         if subject:
@@ -934,31 +1057,7 @@ class AdminService:
                     ContactMessage.email.ilike(search_term)
                 )
             )
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        results = query.order_by(ContactMessage.created_at.desc()).offset(offset).limit(limit).all()
-
-        # Build response items
-        items = [
-            AdminMessageListItem(
-                id=message.id,
-                sender_name=message.full_name,
-                sender_email=message.email,
-                subject=message.subject,
-                status=message.status,
-                is_guest=(message.user_id is None),
-                admin_response=message.admin_response,
-                created_at=message.created_at,
-                updated_at=message.updated_at,
-            )
-            for message in results
-        ]
-
-        return items, total
+        return query
 
     @staticmethod
     def get_message_detail(db: Session, message_id: int) -> Optional[AdminMessageDetail]:
@@ -989,6 +1088,7 @@ class AdminService:
             is_guest=(message.user_id is None),
             admin_response=message.admin_response,
             responded_at=message.responded_at,
+            version=message.version,
             created_at=message.created_at,
             updated_at=message.updated_at,
         )
@@ -999,6 +1099,7 @@ class AdminService:
         message_id: int,
         update_data: AdminMessageUpdate,
         admin_user_id: int,
+        expected_version: Optional[int] = None,
     ) -> Optional[AdminMessageDetail]:
         """
         Update a contact message (admin only).
@@ -1008,59 +1109,354 @@ class AdminService:
             message_id: ID of the message to update
             update_data: Update data
             admin_user_id: ID of the admin user making the update
+            expected_version: Version the admin last saw (If-Match), or None to update unconditionally
 
         Returns:
             Updated message detail or None if not found
 
         Raises:
             ValueError: If status is invalid
+            StaleDataError: If the message was changed since expected_version
         """
-        message = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
-
-        if not message:
-            return None
-
         # Validate status if provided
-        valid_statuses = ["new", "read", "responded", "closed"]
-        if update_data.status and update_data.status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+        if update_data.status and update_data.status not in AdminService.MESSAGE_STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(AdminService.MESSAGE_STATUSES)}")
 
-        # Track changes for audit log
-        changes = {}
+        def build_update(old) -> Tuple[dict, dict]:
+            values = {}
+            changes = {}
+            status = old.status
 
-        # Update fields
-        if update_data.status is not None:
-            if message.status != update_data.status:
-                changes["status"] = {"old": message.status, "new": update_data.status}
-                message.status = update_data.status
+            if update_data.status is not None and update_data.status != old.status:
+                values[ContactMessage.status] = status = update_data.status
+                changes["status"] = {"old": old.status, "new": update_data.status}
 
-        if update_data.admin_response is not None:
-            if message.admin_response != update_data.admin_response:
+            if update_data.admin_response is not None and update_data.admin_response != old.admin_response:
+                values[ContactMessage.admin_response] = update_data.admin_response
+                values[ContactMessage.responded_at] = datetime.utcnow()
                 changes["admin_response"] = {"updated": True}
-                message.admin_response = update_data.admin_response
-                message.responded_at = datetime.utcnow()
                 # Auto-update status to responded if not already
-                if message.status == "new" or message.status == "read":
-                    message.status = "responded"
-                    changes["status"] = {"auto_updated": "responded"}
+                if status in ("new", "read"):
+                    values[ContactMessage.status] = "responded"
+                    changes["status"] = {"old": old.status, "new": "responded", "auto_updated": True}
+
+            return values, changes
+
+        return AdminService._apply_update(
+            db=db,
+            model=ContactMessage,
+            entity_id=message_id,
+            columns=(ContactMessage.status, ContactMessage.admin_response),
+            build_update=build_update,
+            expected_version=expected_version,
+            get_detail=AdminService.get_message_detail,
+            action="MESSAGE_UPDATED_BY_ADMIN",
+            entity_type="ContactMessage",
+            label="message",
+            admin_user_id=admin_user_id,
+        )
 
-        # Commit changes
+    @staticmethod
+    def _apply_update(
+        db: Session,
+        model,
+        entity_id: int,
+        columns: tuple,
+        build_update: Callable,
+        expected_version: Optional[int],
+        get_detail,
+        action: str,
+        entity_type: str,
+        label: str,
+        admin_user_id: int,
+    ):
+        """
+        Apply an admin update: lock the row and read the columns it may change,
+        write only the columns whose values differ, read the updated detail and
+        write the audit row, all in one transaction (four statements in total).
+
+        The locking read checks expected_version and gives the audit row the old
+        values, like _bulk_update_status. Saving unchanged values writes nothing:
+        no version bump, no audit row, so customer ETags and the change feeds see
+        no change. The row stays locked until the commit, so the detail read
+        returns exactly this update's version.
+
+        Args:
+            db: Database session
+            model: QuoteRequest, Claim or ContactMessage
+            entity_id: ID of the row to update
+            columns: Columns build_update compares (read with the row lock)
+            build_update: Called with the locked row (version and columns); returns
+                ({column: new value} for the columns that change, audit changes)
+            expected_version: Version the admin last saw, or None to update unconditionally
+            get_detail: Detail builder, e.g. AdminService.get_quote_detail
+            action: Audit log action
+            entity_type: Audit log entity type
+            label: Entity name used in the audit details
+            admin_user_id: ID of the admin user making the update
+
+        Returns:
+            Updated detail or None if the row does not exist
+
+        Raises:
+            StaleDataError: If the row's version is not expected_version
+        """
+        old = (
+            db.query(model.version, *columns)
+            .filter(model.id == entity_id)
+            .with_for_update()
+            .first()
+        )
+        if old is None:
+            db.rollback()
+            return None
+        if expected_version is not None and old.version != expected_version:
+            db.rollback()
+            raise StaleDataError(f"This {label} was changed by someone else. Reload it and try again")
+
+        values, changes = build_update(old)
+        if not values:
+            # Nothing differs: release the lock without writing
+            detail = get_detail(db, entity_id)
+            db.rollback()
+            return detail
+
+        db.execute(
+            update(model)
+            .where(model.id == entity_id)
+            .values({**values, model.version: old.version + 1})
+            .execution_options(synchronize_session=False)
+        )
+        detail = get_detail(db, entity_id)
+
+        changes["version"] = {"old": old.version, "new": old.version + 1}
+        AuditLogService.log_user_actions(db, [{
+            "user_id": admin_user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "details": f"Admin updated {label}: {changes}",
+            "ip_address": None,
+        }])
         db.commit()
-        db.refresh(message)
 
-        # Audit logging
-        if changes:
-            AuditLogService.log_user_action(
-                db=db,
-                user_id=admin_user_id,
-                action="MESSAGE_UPDATED_BY_ADMIN",
-                entity_type="ContactMessage",
-                entity_id=message.id,
-                details=f"Admin updated message: {changes}",
+        return detail
+
+    # ===== Bulk Status Methods =====
+
+    @staticmethod
+    def bulk_update_quote_status(
+        db: Session,
+        new_status: str,
+        admin_user_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[AdminSubmissionFilter] = None,
+    ) -> AdminBulkUpdateResponse:
+        """
+        Set the status of many quote requests at once.
+
+        Args:
+            db: Database session
+            new_status: Target status
+            admin_user_id: ID of the admin user making the update
+            ids: Quote IDs to update (alternative to filters)
+            filters: List filters selecting the quotes to update
+
+        Returns:
+            Per-id results of the bulk update
+
+        Raises:
+            ValueError: If the status is invalid or the filters match too many rows
+        """
+        if ids is not None:
+            query = db.query(QuoteRequest).filter(QuoteRequest.id.in_(ids))
+        else:
+            query = AdminService._quotes_query(
+                db, filters.category, filters.subcategory, filters.status, filters.search
             )
+        return AdminService._bulk_update_status(
+            db, QuoteRequest, query, ids, new_status, AdminService.QUOTE_STATUSES,
+            timestamps={"quoted": "quoted_at"},
+            action="QUOTE_UPDATED_BY_ADMIN",
+            entity_type="QuoteRequest",
+            label="quote request",
+            admin_user_id=admin_user_id,
+        )
 
-        # Return updated detail
-        return AdminService.get_message_detail(db, message_id)
+    @staticmethod
+    def bulk_update_claim_status(
+        db: Session,
+        new_status: str,
+        admin_user_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[AdminSubmissionFilter] = None,
+    ) -> AdminBulkUpdateResponse:
+        """
+        Set the status of many claims at once.
+
+        Args:
+            db: Database session
+            new_status: Target status
+            admin_user_id: ID of the admin user making the update
+            ids: Claim IDs to update (alternative to filters)
+            filters: List filters selecting the claims to update
+
+        Returns:
+            Per-id results of the bulk update
+
+        Raises:
+            ValueError: If the status is invalid or the filters match too many rows
+        """
+        if ids is not None:
+            query = db.query(Claim).filter(Claim.id.in_(ids))
+        else:
+            query = AdminService._claims_query(
+                db, filters.category, filters.subcategory, filters.status, filters.search
+            )
+        return AdminService._bulk_update_status(
+            db, Claim, query, ids, new_status, AdminService.CLAIM_STATUSES,
+            timestamps={"contacted": "contacted_at"},
+            action="CLAIM_UPDATED_BY_ADMIN",
+            entity_type="Claim",
+            label="claim",
+            admin_user_id=admin_user_id,
+        )
+
+    @staticmethod
+    def bulk_update_message_status(
+        db: Session,
+        new_status: str,
+        admin_user_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[AdminMessageFilter] = None,
+    ) -> AdminBulkUpdateResponse:
+        """
+        Set the status of many contact messages at once.
+
+        Args:
+            db: Database session
+            new_status: Target status
+            admin_user_id: ID of the admin user making the update
+            ids: Message IDs to update (alternative to filters)
+            filters: List filters selecting the messages to update
+
+        Returns:
+            Per-id results of the bulk update
+
+        Raises:
+            ValueError: If the status is invalid or the filters match too many rows
+        """
+        if ids is not None:
+            query = db.query(ContactMessage).filter(ContactMessage.id.in_(ids))
+        else:
+            query = AdminService._messages_query(
+                db, filters.subject, filters.status, filters.search, filters.include_guest
+            )
+        return AdminService._bulk_update_status(
+            db, ContactMessage, query, ids, new_status, AdminService.MESSAGE_STATUSES,
+            timestamps={},
+            action="MESSAGE_UPDATED_BY_ADMIN",
+            entity_type="ContactMessage",
+            label="message",
+            admin_user_id=admin_user_id,
+        )
+
+    @staticmethod
+    def _bulk_update_status(
+        db: Session,
+        model,
+        query,
+        ids: Optional[List[int]],
+        new_status: str,
+        valid_statuses: List[str],
+        timestamps: dict,
+        action: str,
+        entity_type: str,
+        label: str,
+        admin_user_id: int,
+    ) -> AdminBulkUpdateResponse:
+        """
+        Apply a status change to the rows selected by query with one UPDATE and
+        one multi-row audit INSERT, committed together (three statements in total).
+
+        Args:
+            db: Database session
+            model: QuoteRequest, Claim or ContactMessage
+            query: Query selecting the rows (by ids or list filters)
+            ids: Requested ids, or None when selecting by filters
+            new_status: Target status
+            valid_statuses: Allowed statuses for the model
+            timestamps: Column to stamp with the current time per target status (e.g. quoted -> quoted_at)
+            action: Audit log action
+            entity_type: Audit log entity type
+            label: Entity name used in the audit details
+            admin_user_id: ID of the admin user making the update
+
+        Returns:
+            Per-id results of the bulk update
+
+        Raises:
+            ValueError: If the status is invalid or the filters match too many rows
+        """
+        if new_status not in valid_statuses:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+
+        # Lock the selected rows so the old statuses recorded in the audit log stay accurate.
+        # Only the model's rows: the list queries join users, whose rows must stay unlocked. MariaDB
+        # has no FOR UPDATE OF, so the locking read selects from the model alone and the selection
+        # runs as a subquery, which a locking read does not lock
+        rows = (
+            db.query(model.id, model.status)
+            .filter(model.id.in_(query.with_entities(model.id).scalar_subquery()))
+            .order_by(model.id)
+            .limit(BULK_UPDATE_MAX_ROWS + 1)
+            .with_for_update(of=model)
+            .all()
+        )
+        if len(rows) > BULK_UPDATE_MAX_ROWS:
+            db.rollback()
+            raise ValueError(f"Filters match more than {BULK_UPDATE_MAX_ROWS} rows. Narrow them down or pass ids")
+
+        old_statuses = dict(rows)
+        changed_ids = [row_id for row_id, old_status in rows if old_status != new_status]
+
+        if changed_ids:
+            values = {model.status: new_status, model.version: model.version + 1}
+            if new_status in timestamps:
+                values[getattr(model, timestamps[new_status])] = datetime.utcnow()
+            db.query(model).filter(model.id.in_(changed_ids)).update(values, synchronize_session=False)
+
+            AuditLogService.log_user_actions(db, [
+                {
+                    "user_id": admin_user_id,
+                    "action": action,
+                    "entity_type": entity_type,
+                    "entity_id": row_id,
+                    "details": f"Admin updated {label}: " + str({"status": {"old": old_statuses[row_id], "new": new_status}}),
+                    "ip_address": None,
+                }
+                for row_id in changed_ids
+            ])
+        db.commit()
+
+        results = []
+        requested_ids = list(dict.fromkeys(ids)) if ids is not None else list(old_statuses)
+        for row_id in requested_ids:
+            old_status = old_statuses.get(row_id)
+            if old_status is None:
+                result = "not_found"
+            elif old_status == new_status:
+                result = "unchanged"
+            else:
+                result = "updated"
+            results.append(AdminBulkUpdateResult(id=row_id, result=result, old_status=old_status))
+
+        return AdminBulkUpdateResponse(
+            status=new_status,
+            matched=len(rows),
+            updated=len(changed_ids),
+            results=results,
+        )
 
     # ===== User Management Methods =====
 
@@ -1094,6 +1490,79 @@ class AdminService:
         Raises:
             ValueError: If sort_by or sort_order is invalid
         """
+        query = AdminService._users_query(db, status, search, recently_contacted, sort_by, sort_order)
+
+        # Get total count (before pagination)
+        total = query.count()
+
+        # Apply pagination
+        offset = (page - 1) * limit
+        results = query.offset(offset).limit(limit).all()
+
+        return AdminService._user_list_items(db, results), total
+
+    @staticmethod
+    def _user_list_items(db: Session, results) -> List[AdminUserListItem]:
+        """
+        List items from rows of _users_query, with last logins (one more query).
+
+        Args:
+            db: Database session
+            results: (User, quotes_count, claims_count, messages_count, last_activity) rows
+
+        Returns:
+            List items, in the order of the rows
+        """
+        # Get last login info from audit logs
+        user_ids = [user.id for user, _, _, _, _ in results]
+        last_logins = AdminService._get_last_logins(db, user_ids)
+
+        # Build response items
+        return [
+            AdminUserListItem(
+                id=user.id,
+                username=user.username,
+                full_name=user.full_name,
+                email=user.email,
+                phone=user.phone,
+                is_active=user.is_active,
+                is_admin=user.is_admin,
+                created_at=user.created_at,
+                last_login_at=last_logins.get(user.id),
+                quotes_count=quotes_count,
+                claims_count=claims_count,
+                messages_count=messages_count,
+            )
+            for user, quotes_count, claims_count, messages_count, _ in results
+        ]
+
+    @staticmethod
+    def _users_query(
+        db: Session,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        recently_contacted: Optional[str] = None,
+        sort_by: str = "activity",
+        sort_order: str = "desc",
+    ):
+        """
+        Filtered and sorted (User, quotes_count, claims_count, messages_count, last_activity)
+        query shared by the list and export.
+
+        Args:
+            db: Database session
+            status: Filter by account status ("active" or "inactive")
+            search: Search by username, email, or full name
+            recently_contacted: Filter by recent activity ("2weeks", "1month", "3months", "6months", "1year")
+            sort_by: Sort field ("activity", "name", "status")
+            sort_order: Sort order ("asc" or "desc")
+
+        Returns:
+            Ordered query
+
+        Raises:
+            ValueError: If a filter or sort parameter is invalid
+        """
         # Validate sort parameters
         valid_sort_by = ["activity", "name", "status"]
         if sort_by not in valid_sort_by:
@@ -1196,37 +1665,7 @@ class AdminService:
             else:
                 query = query.order_by(last_activity.desc())
 
-        # Get total count (before pagination)
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * limit
-        results = query.offset(offset).limit(limit).all()
-
-        # Get last login info from audit logs
-        user_ids = [user.id for user, _, _, _, _ in results]
-        last_logins = AdminService._get_last_logins(db, user_ids)
-
-        # Build response items
-        items = [
-            AdminUserListItem(
-                id=user.id,
-                username=user.username,
-                full_name=user.full_name,
-                email=user.email,
-                phone=user.phone,
-                is_active=user.is_active,
-                is_admin=user.is_admin,
-                created_at=user.created_at,
-                last_login_at=last_logins.get(user.id),
-                quotes_count=quotes_count,
-                claims_count=claims_count,
-                messages_count=messages_count,
-            )
-            for user, quotes_count, claims_count, messages_count, _ in results
-        ]
-
-        return items, total
+        return query
 
     @staticmethod
     def _get_last_logins(db: Session, user_ids: List[int]) -> dict:
@@ -1,6 +1,7 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.audit_log import AuditLog
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class AuditLogService:
@@ -28,3 +29,42 @@ class AuditLogService:
 
         db.add(audit_entry)
         db.commit()
+
+    @staticmethod
+    def add_user_action(
+        db: Session,
+        user_id: Optional[int],
+        action: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        details: Optional[str] = None,
+        ip_address: Optional[str] = None
+    ):
+        """
+        Add an audit row to the caller's transaction (see unit_of_work).
+
+        Does not commit: the row is written with the entity it describes.
+        """
+        AuditLogService.log_user_actions(db, [{
+            "user_id": user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "details": details,
+            "ip_address": ip_address,
+        }])
+
+    @staticmethod
+    def log_user_actions(db: Session, entries: List[Dict]):
+        """
+        Add a batch of audit rows in one multi-row INSERT.
+
+        Does not commit: the rows belong to the caller's transaction, so a
+        bulk change and its audit trail are committed (or rolled back) together.
+
+        Args:
+            db: Database session
+            entries: AuditLog column values per row (user_id, action, entity_type, entity_id, details, ip_address)
+        """
+        if entries:
+            db.execute(insert(AuditLog), entries)
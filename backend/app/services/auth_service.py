@@ -3,9 +3,11 @@ from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserLogin, Token, UserProfile
 from app.core.security import hash_password, verify_password, create_access_token
+from app.core.tracing import traced_service
 from app.services.audit_log_service import AuditLogService
 
 
+@traced_service
 class AuthService:
     """Business logic for authentication"""
 
@@ -1,27 +1,22 @@
 from sqlalchemy.orm import Session
 from app.models.claim import Claim
 from app.schemas.claim_schemas import ClaimCreate
+from app.core.catalog import validate_category
+from app.core.database import unit_of_work
+from app.core.http_cache import rows_etag
+from app.core.tracing import traced_service
 from app.services.audit_log_service import AuditLogService
 from typing import List, Optional
 from datetime import date
 
 
+@traced_service
 class ClaimService:
     """
     Business logic for lightweight claim reporting system.
     This is NOT a full claim processing system - just basic incident info for agent preparation.
     """
 
-    # Valid insurance categories and their subcategories (from CATEGORIES.md)
-    VALID_CATEGORIES = {
-        'vehicle': ['auto', 'motorcycle', 'atv_off_road', 'roadside', 'snowmobile', 'boat', 'rv', 'vehicle_protection'],
-        'property': ['homeowners', 'renters', 'condo', 'landlord', 'mobile_home'],
-        'life': None,  # No subcategories
-        'business': None,  # No subcategories
-        'identity_protection': None,  # No subcategories
-        'other': ['personal_umbrella_policy', 'individual_health', 'pet', 'event', 'travel', 'jewelry', 'collectibles']
-    }
-
     @staticmethod
     def create_claim(db: Session, user_id: int, claim_data: ClaimCreate) -> Claim:
         """
@@ -38,21 +33,8 @@ class ClaimService:
         Raises:
             ValueError: If validation fails (invalid input - maps to 400)
         """
-        # Validate category (throw ValueError for invalid input)
-        if claim_data.category not in ClaimService.VALID_CATEGORIES:
-            valid_cats = ', '.join(ClaimService.VALID_CATEGORIES.keys())
-            raise ValueError(f"Invalid category. Must be one of: {valid_cats}")
-
-        # Validate subcategory if provided
-        valid_subcats = ClaimService.VALID_CATEGORIES[claim_data.category]
-        if claim_data.subcategory:
-            if valid_subcats is None:
-                raise ValueError(f"Category '{claim_data.category}' does not have subcategories")
-            if claim_data.subcategory not in valid_subcats:
-                raise ValueError(f"Invalid subcategory for {claim_data.category}. Must be one of: {', '.join(valid_subcats)}")
-        elif valid_subcats is not None:
-            # Category requires a subcategory but none provided
-            raise ValueError(f"Category '{claim_data.category}' requires a subcategory. Must be one of: {', '.join(valid_subcats)}")
+        # Validate category and subcategory against the catalog (ValueError for invalid input)
+        subcategory = validate_category(claim_data.category, claim_data.subcategory)
 
         # Validate incident summary length (50-500 chars) - already validated by Pydantic but double-check
         if len(claim_data.incident_summary) < 10:
@@ -73,7 +55,7 @@ class ClaimService:
         new_claim = Claim(
             user_id=user_id,
             category=claim_data.category,
-            subcategory=claim_data.subcategory,
+            subcategory=subcategory,
             incident_date=claim_data.incident_date,
             incident_summary=claim_data.incident_summary,
             claim_data=claim_data.claim_data,
@@ -84,23 +66,24 @@ class ClaimService:
             status="submitted"
         )
 
-        db.add(new_claim)
-        db.commit()  # Let database exceptions bubble
-        db.refresh(new_claim)
-
-        # Log the action
-        insurance_description = f"{new_claim.category}"
-        if new_claim.subcategory:
-            insurance_description += f" - {new_claim.subcategory}"
-
-        AuditLogService.log_user_action(
-            db=db,
-            user_id=user_id,
-            action="CLAIM_SUBMITTED",
-            entity_type="Claim",
-            entity_id=new_claim.id,
-            details=f"User submitted a {insurance_description} insurance claim report"
-        )
+        # Claim and audit row are committed together (database exceptions bubble)
+        with unit_of_work(db):
+            db.add(new_claim)
+            db.flush()  # INSERT ... RETURNING: id and server defaults, no refresh
+
+            # Log the action
+            insurance_description = f"{new_claim.category}"
+            if new_claim.subcategory:
+                insurance_description += f" - {new_claim.subcategory}"
+
+            AuditLogService.add_user_action(
+                db=db,
+                user_id=user_id,
+                action="CLAIM_SUBMITTED",
+                entity_type="Claim",
+                entity_id=new_claim.id,
+                details=f"User submitted a {insurance_description} insurance claim report"
+            )
 
         # TODO: Send email notification to admin (Slice 7: Email & Notifications)
 
@@ -120,9 +103,32 @@ class ClaimService:
         Returns:
             List of Claim objects
         """
-        return db.query(Claim).filter(
-            Claim.user_id == user_id
-        ).order_by(Claim.created_at.desc()).offset(skip).limit(limit).all()
+        return ClaimService._user_claims_query(db, user_id).offset(skip).limit(limit).all()
+
+    @staticmethod
+    def get_user_claims_etag(db: Session, user_id: int, skip: int = 0, limit: int = 50) -> str:
+        """
+        ETag of the page get_user_claims would return, without loading it.
+
+        Reads only (id, version) of the page, from the (user_id, created_at,
+        id, version) index.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+            skip: Number of records to skip (for pagination)
+            limit: Maximum number of records to return
+
+        Returns:
+            Quoted ETag (see rows_etag)
+        """
+        query = ClaimService._user_claims_query(db, user_id)
+        return rows_etag(query.with_entities(Claim.id, Claim.version).offset(skip).limit(limit).all())
+
+    @staticmethod
+    def _user_claims_query(db: Session, user_id: int):
+        # id breaks created_at ties (one-second TIMESTAMP), so the ETag query and the page see the same rows
+        return db.query(Claim).filter(Claim.user_id == user_id).order_by(Claim.created_at.desc(), Claim.id.desc())
 
     @staticmethod
     def get_claim_by_id(db: Session, claim_id: int, user_id: int) -> Optional[Claim]:
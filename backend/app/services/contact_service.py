@@ -1,10 +1,14 @@
 from sqlalchemy.orm import Session
 from app.models.contact_message import ContactMessage
 from app.schemas.contact_schemas import ContactMessageCreate
+from app.core.database import unit_of_work
+from app.core.http_cache import rows_etag
+from app.core.tracing import traced_service
 from app.services.audit_log_service import AuditLogService
 from typing import List, Optional
 
 
+@traced_service
 class ContactService:
     """Business logic for contact messages"""
 
@@ -41,20 +45,21 @@ class ContactService:
             status="new"
         )
 
-        db.add(new_message)
-        db.commit()
-        db.refresh(new_message)
-
-        # Audit logging
-        message_type = "Guest" if user_id is None else "User"
-        AuditLogService.log_user_action(
-            db=db,
-            user_id=user_id,
-            action="CONTACT_MESSAGE_CREATED",
-            entity_type="ContactMessage",
-            entity_id=new_message.id,
-            details=f"{message_type} submitted contact message: {contact_data.subject}"
-        )
+        # Message and audit row are committed together
+        with unit_of_work(db):
+            db.add(new_message)
+            db.flush()  # INSERT ... RETURNING: id and server defaults, no refresh
+
+            # Audit logging
+            message_type = "Guest" if user_id is None else "User"
+            AuditLogService.add_user_action(
+                db=db,
+                user_id=user_id,
+                action="CONTACT_MESSAGE_CREATED",
+                entity_type="ContactMessage",
+                entity_id=new_message.id,
+                details=f"{message_type} submitted contact message: {contact_data.subject}"
+            )
 
         # TODO: Send email notification to admin (Slice 7: Email & Notifications)
 
@@ -79,11 +84,37 @@ class ContactService:
         Returns:
             List of ContactMessage objects
         """
+        return ContactService._user_messages_query(db, user_id).offset(skip).limit(limit).all()
+
+    @staticmethod
+    def get_user_messages_etag(db: Session, user_id: int, skip: int = 0, limit: int = 10) -> str:
+        """
+        ETag of the page get_user_messages would return, without loading it.
+
+        Reads only (id, version) of the page, from the (user_id, created_at,
+        id, version) index.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+            skip: Number of records to skip (pagination)
+            limit: Maximum number of records to return
+
+        Returns:
+            Quoted ETag (see rows_etag)
+        """
+        query = ContactService._user_messages_query(db, user_id)
+        return rows_etag(query.with_entities(ContactMessage.id, ContactMessage.version).offset(skip).limit(limit).all())
+
+    @staticmethod
+    def _user_messages_query(db: Session, user_id: int):
+        # id breaks created_at ties (one-second TIMESTAMP), so the ETag query and the page see the same rows
         return db.query(ContactMessage).filter(
             ContactMessage.user_id == user_id
         ).order_by(
-            ContactMessage.created_at.desc()
-        ).offset(skip).limit(limit).all()
+            ContactMessage.created_at.desc(),
+            ContactMessage.id.desc()
+        )
 
     @staticmethod
     def get_message_detail(
@@ -0,0 +1,143 @@
+import hashlib
+from typing import Dict, Tuple
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced_service
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.schemas.claim_schemas import ClaimSummary
+from app.schemas.contact_schemas import ContactMessageResponse
+from app.schemas.dashboard_schemas import DashboardClaims, DashboardMessages, DashboardQuotes, DashboardResponse
+from app.services.quote_service import QuoteService
+
+# Section name -> model; every section is the current user's rows, newest first
+SECTIONS = {
+    "quotes": QuoteRequest,
+    "claims": Claim,
+    "messages": ContactMessage,
+}
+
+# Section name -> (count, sum of versions, max id)
+SectionStats = Dict[str, Tuple[int, int, int]]
+
+
+@traced_service
+class DashboardService:
+    """
+    The customer dashboard in one call: the newest quotes, claims and contact
+    messages as summaries, with a total count for each section.
+
+    Counts and the ETag come from one aggregate query over the (user_id,
+    created_at, id, version) indexes. Per section, (count, sum of versions,
+    max id) changes with every insert (ids only grow), delete (count) and
+    update (versions only grow), so it stands in for every row's version
+    without reading the rows.
+    """
+
+    # Columns of the claim list (ClaimSummary)
+    CLAIM_SUMMARY_COLUMNS = (
+        Claim.id,
+        Claim.category,
+        Claim.subcategory,
+        Claim.claim_data["incident_type"].as_string().label("incident_type"),
+        Claim.incident_date,
+        Claim.status,
+        Claim.created_at,
+    )
+
+    # Columns of the message list (ContactMessageResponse)
+    MESSAGE_SUMMARY_COLUMNS = (
+        ContactMessage.id,
+        ContactMessage.subject,
+        ContactMessage.status,
+        ContactMessage.created_at,
+        ContactMessage.admin_response.isnot(None).label("has_response"),
+    )
+
+    @staticmethod
+    def get_section_stats(db: Session, user_id: int) -> SectionStats:
+        """
+        Count and fingerprint the user's rows in each section, in one index-only query.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+
+        Returns:
+            Section name -> (count, sum of versions, max id)
+        """
+        # One round trip: a (count, sum(version), max(id)) row per section
+        statement = union_all(*(
+            select(
+                literal(name).label("section"),
+                func.count().label("total"),
+                func.coalesce(func.sum(model.version), 0).label("versions"),
+                func.coalesce(func.max(model.id), 0).label("max_id"),
+            ).where(model.user_id == user_id)
+            for name, model in SECTIONS.items()
+        ))
+        return {
+            row.section: (int(row.total), int(row.versions), int(row.max_id))
+            for row in db.execute(statement)
+        }
+
+    @staticmethod
+    def dashboard_etag(stats: SectionStats, limit: int) -> str:
+        """
+        ETag of the dashboard for the given section stats and page size.
+
+        Args:
+            stats: Result of get_section_stats
+            limit: Items per section
+
+        Returns:
+            Quoted ETag
+        """
+        fingerprint = ";".join(f"{name}:{total}:{versions}:{max_id}" for name, (total, versions, max_id) in sorted(stats.items()))
+        return f'"{hashlib.sha256(f"{limit};{fingerprint}".encode()).hexdigest()[:32]}"'
+
+    @staticmethod
+    def get_dashboard(db: Session, user_id: int, stats: SectionStats, limit: int = 20) -> DashboardResponse:
+        """
+        Get the dashboard sections for a user.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+            stats: Result of get_section_stats (read first, for the ETag; supplies the totals)
+            limit: Items per section
+
+        Returns:
+            The dashboard
+        """
+        # The quotes section is the first page of GET /quotes/, so "load more" continues from its cursor
+        quotes, _ = QuoteService.get_user_quote_requests(db=db, user_id=user_id, limit=limit)
+        claims = (
+            db.query(*DashboardService.CLAIM_SUMMARY_COLUMNS)
+            .filter(Claim.user_id == user_id)
+            .order_by(Claim.created_at.desc(), Claim.id.desc())
+            .limit(limit)
+            .all()
+        )
+        messages = (
+            db.query(*DashboardService.MESSAGE_SUMMARY_COLUMNS)
+            .filter(ContactMessage.user_id == user_id)
+            .order_by(ContactMessage.created_at.desc(), ContactMessage.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+        return DashboardResponse(
+            quotes=DashboardQuotes(items=quotes.items, total=stats["quotes"][0], next_cursor=quotes.next_cursor),
+            claims=DashboardClaims(
+                items=[ClaimSummary.model_validate(row) for row in claims],
+                total=stats["claims"][0],
+            ),
+            messages=DashboardMessages(
+                items=[ContactMessageResponse.model_validate(row) for row in messages],
+                total=stats["messages"][0],
+            ),
+        )
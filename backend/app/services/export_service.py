@@ -0,0 +1,238 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Iterator, List, Optional
+
+from sqlalchemy import func
+
+from app.core.database import SessionLocal
+from app.core.tracing import traced_service
+from app.models.audit_log import AuditLog
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.user import User
+from app.schemas.admin_schemas import (
+    AdminQuoteListItem,
+    AdminClaimListItem,
+    AdminMessageListItem,
+    AdminUserListItem,
+)
+from app.services.admin_service import AdminService
+
+
+@traced_service
+class ExportService:
+    """
+    Streaming CSV/NDJSON exports of the admin lists.
+
+    Each export is a generator that opens its own database session (the
+    response body is produced after the endpoint has returned) and reads the
+    rows through a server-side cursor with yield_per, so memory stays flat no
+    matter how many rows match. Filters are the same as AdminService.get_all_*
+    and the columns are those of the corresponding list item schema.
+    """
+
+    FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+    # Rows fetched per round trip and written per response chunk
+    BATCH_SIZE = 1000
+
+    @staticmethod
+    def export_quotes(
+        fmt: str,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream quote requests matching the admin list filters, newest first.
+
+        Args:
+            fmt: "csv" or "ndjson"
+            category: Filter by category
+            subcategory: Filter by subcategory
+            status: Filter by status
+            search: Search by customer name or email
+
+        Yields:
+            Chunks of the export document
+        """
+        db = SessionLocal()
+        try:
+            query = (
+                AdminService._quotes_query(db, category, subcategory, status, search)
+                .order_by(QuoteRequest.created_at.desc())
+            )
+            # QUOTE_LIST_COLUMNS are in AdminQuoteListItem field order
+            rows = query.yield_per(ExportService.BATCH_SIZE)
+            yield from ExportService._encode(fmt, list(AdminQuoteListItem.model_fields), rows)
+        finally:
+            db.close()
+
+    @staticmethod
+    def export_claims(
+        fmt: str,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream claims matching the admin list filters, newest first.
+
+        Args:
+            fmt: "csv" or "ndjson"
+            category: Filter by category
+            subcategory: Filter by subcategory
+            status: Filter by status
+            search: Search by customer name or email
+
+        Yields:
+            Chunks of the export document
+        """
+        db = SessionLocal()
+        try:
+            query = (
+                AdminService._claims_query(db, category, subcategory, status, search)
+                .order_by(Claim.created_at.desc())
+            )
+            # CLAIM_LIST_COLUMNS are in AdminClaimListItem field order
+            rows = query.yield_per(ExportService.BATCH_SIZE)
+            yield from ExportService._encode(fmt, list(AdminClaimListItem.model_fields), rows)
+        finally:
+            db.close()
+
+    @staticmethod
+    def export_messages(
+        fmt: str,
+        subject: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        include_guest: bool = True,
+    ) -> Iterator[str]:
+        """
+        Stream contact messages matching the admin list filters, newest first.
+
+        Args:
+            fmt: "csv" or "ndjson"
+            subject: Filter by subject
+            status: Filter by status
+            search: Search by sender name or email
+            include_guest: Whether to include guest messages
+
+        Yields:
+            Chunks of the export document
+        """
+        db = SessionLocal()
+        try:
+            query = (
+                AdminService._messages_query(db, subject, status, search, include_guest)
+                .order_by(ContactMessage.created_at.desc())
+            )
+            rows = (
+                (message.id, message.sender_name, message.sender_email, message.subject, message.status,
+                 message.user_id is None, message.admin_response, message.created_at, message.updated_at)
+                for message in query.yield_per(ExportService.BATCH_SIZE)
+            )
+            yield from ExportService._encode(fmt, list(AdminMessageListItem.model_fields), rows)
+        finally:
+            db.close()
+
+    @staticmethod
+    def export_users(
+        fmt: str,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        recently_contacted: Optional[str] = None,
+        sort_by: str = "activity",
+        sort_order: str = "desc",
+    ) -> Iterator[str]:
+        """
+        Stream users matching the admin list filters, in the list's sort order.
+
+        Args:
+            fmt: "csv" or "ndjson"
+            status: Filter by account status ("active" or "inactive")
+            search: Search by username, email, or full name
+            recently_contacted: Filter by recent activity ("2weeks", "1month", "3months", "6months", "1year")
+            sort_by: Sort field ("activity", "name", "status")
+            sort_order: Sort order ("asc" or "desc")
+
+        Yields:
+            Chunks of the export document
+
+        Raises:
+            ValueError: If a filter or sort parameter is invalid (before anything is yielded)
+        """
+        db = SessionLocal()
+        try:
+            # Last logins are joined in rather than looked up per page as the list does
+            last_logins = (
+                db.query(AuditLog.user_id, func.max(AuditLog.created_at).label("last_login"))
+                .filter(AuditLog.action == "LOGIN")
+                .group_by(AuditLog.user_id)
+                .subquery()
+            )
+            query = (
+                AdminService._users_query(db, status, search, recently_contacted, sort_by, sort_order)
+                .outerjoin(last_logins, last_logins.c.user_id == User.id)
+                .add_columns(func.max(last_logins.c.last_login))
+            )
+            rows = (
+                (user.id, user.username, user.full_name, user.email, user.phone, user.is_active, user.is_admin,
+                 user.created_at, last_login_at, quotes_count, claims_count, messages_count)
+                for user, quotes_count, claims_count, messages_count, _, last_login_at
+                in query.yield_per(ExportService.BATCH_SIZE)
+            )
+            yield from ExportService._encode(fmt, list(AdminUserListItem.model_fields), rows)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _encode(fmt: str, columns: List[str], rows: Iterator[tuple]) -> Iterator[str]:
+        """
+        Encode rows as CSV (with a header line) or NDJSON, one chunk per BATCH_SIZE rows.
+
+        Raises:
+            ValueError: If fmt is not a supported format
+        """
+        if fmt not in ExportService.FORMATS:
+            raise ValueError(f"Invalid format. Must be one of: {', '.join(ExportService.FORMATS)}")
+
+        buffer = io.StringIO()
+        if fmt == "csv":
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            write: Callable[[tuple], None] = lambda row: writer.writerow([ExportService._csv_value(v) for v in row])
+        else:
+            write = lambda row: buffer.write(json.dumps(dict(zip(columns, row)), default=ExportService._json_value) + "\n")
+
+        count = 0
+        for row in rows:
+            write(row)
+            count += 1
+            if count % ExportService.BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    @staticmethod
+    def _csv_value(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if value is None:
+            return ""
+        return value
+
+    @staticmethod
+    def _json_value(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
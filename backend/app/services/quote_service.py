@@ -1,13 +1,30 @@
 from sqlalchemy.orm import Session
 from app.models.quote_request import QuoteRequest
-from app.schemas.quote_schemas import QuoteRequestCreate
+from app.schemas.quote_schemas import QuoteRequestCreate, QuoteRequestListResponse, QuoteRequestSummary
+from app.core.catalog import validate_category
+from app.core.database import unit_of_work
+from app.core.http_cache import rows_etag
+from app.core.pagination import after_cursor, encode_cursor
+from app.core.tracing import traced_service
 from app.services.audit_log_service import AuditLogService
-from typing import List
+from typing import Optional, Tuple
 
 
+@traced_service
 class QuoteService:
     """Business logic for quote requests"""
 
+    # Columns of the customer list (QuoteRequestSummary), plus the version for its ETag
+    SUMMARY_COLUMNS = (
+        QuoteRequest.id,
+        QuoteRequest.category,
+        QuoteRequest.subcategory,
+        QuoteRequest.status,
+        QuoteRequest.quote_amount,
+        QuoteRequest.created_at,
+        QuoteRequest.version,
+    )
+
     @staticmethod
     def create_quote_request(db: Session, user_id: int, quote_data: QuoteRequestCreate) -> QuoteRequest:
         """
@@ -20,53 +37,111 @@ class QuoteService:
 
         Returns:
             Created QuoteRequest object
+
+        Raises:
+            ValueError: If the category or subcategory is not in the catalog (maps to 400)
         """
+        subcategory = validate_category(quote_data.category, quote_data.subcategory)
+
         new_quote = QuoteRequest(
             user_id=user_id,
             category=quote_data.category,
-            subcategory=quote_data.subcategory,
+            subcategory=subcategory,
             quote_data=quote_data.quote_data,
             customer_notes=quote_data.customer_notes,
             status="pending"
         )
 
-        db.add(new_quote)
-        db.commit()
-        db.refresh(new_quote)
-
-        # Log the action
-        insurance_description = f"{new_quote.category}"
-        if new_quote.subcategory:
-            insurance_description += f" - {new_quote.subcategory}"
-
-        AuditLogService.log_user_action(
-            db=db,
-            user_id=user_id,
-            action="QUOTE_REQUEST_CREATED",
-            entity_type="QuoteRequest",
-            entity_id=new_quote.id,
-            details=f"User requested a {insurance_description} insurance quote"
-        )
+        # Quote and audit row are committed together
+        with unit_of_work(db):
+            db.add(new_quote)
+            db.flush()  # INSERT ... RETURNING: id and server defaults, no refresh
+
+            # Log the action
+            insurance_description = f"{new_quote.category}"
+            if new_quote.subcategory:
+                insurance_description += f" - {new_quote.subcategory}"
+
+            AuditLogService.add_user_action(
+                db=db,
+                user_id=user_id,
+                action="QUOTE_REQUEST_CREATED",
+                entity_type="QuoteRequest",
+                entity_id=new_quote.id,
+                details=f"User requested a {insurance_description} insurance quote"
+            )
 
         # TODO: Send email notification to admin (Slice 7: Email & Notifications)
 
         return new_quote
 
     @staticmethod
-    def get_user_quote_requests(db: Session, user_id: int) -> List[QuoteRequest]:
+    def get_user_quote_requests(
+        db: Session,
+        user_id: int,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[QuoteRequestListResponse, str]:
         """
-        Get all quote requests for a specific user.
+        Get one page of a user's quote requests, newest first.
+
+        Selects only the columns the dashboard lists (no quote_data or
+        notes; the detail route has those), one keyset page at a time.
 
         Args:
             db: Database session
             user_id: ID of the user
+            limit: Page size
+            cursor: next_cursor of the previous page, or None for the first page
 
         Returns:
-            List of QuoteRequest objects
+            The page, and its ETag
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return db.query(QuoteRequest).filter(
-            QuoteRequest.user_id == user_id
-        ).order_by(QuoteRequest.created_at.desc()).all()
+        rows = QuoteService._user_quotes_page(db, user_id, limit, cursor, QuoteService.SUMMARY_COLUMNS)
+        page = QuoteRequestListResponse(
+            items=[QuoteRequestSummary.model_validate(row) for row in rows[:limit]],
+            next_cursor=encode_cursor(rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None,
+        )
+        return page, rows_etag((row.id, row.version) for row in rows)
+
+    @staticmethod
+    def get_user_quote_requests_etag(
+        db: Session,
+        user_id: int,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> str:
+        """
+        ETag of the page get_user_quote_requests would return, without loading it.
+
+        Reads only (id, version) of the page, from the (user_id, created_at,
+        id, version) index.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+            limit: Page size
+            cursor: next_cursor of the previous page, or None for the first page
+
+        Returns:
+            Quoted ETag (see rows_etag)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        rows = QuoteService._user_quotes_page(db, user_id, limit, cursor, (QuoteRequest.id, QuoteRequest.version))
+        return rows_etag((row.id, row.version) for row in rows)
+
+    @staticmethod
+    def _user_quotes_page(db: Session, user_id: int, limit: int, cursor: Optional[str], columns) -> list:
+        # One row past the page: tells whether there is a next page, and is part of the ETag
+        query = db.query(*columns).filter(QuoteRequest.user_id == user_id)
+        if cursor:
+            query = query.filter(after_cursor(QuoteRequest.created_at, QuoteRequest.id, cursor, descending=True))
+        return query.order_by(QuoteRequest.created_at.desc(), QuoteRequest.id.desc()).limit(limit + 1).all()
 
     @staticmethod
     def get_quote_request_by_id(db: Session, quote_id: int, user_id: int) -> QuoteRequest:
@@ -0,0 +1,212 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.core.pagination import after_cursor, encode_cursor
+from app.core.tracing import traced_service
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.tombstone import Tombstone
+from app.models.user import User
+from app.schemas.admin_schemas import (
+    AdminQuoteListItem,
+    AdminClaimListItem,
+    AdminQuoteChanges,
+    AdminClaimChanges,
+    AdminMessageChanges,
+    AdminUserChanges,
+)
+from app.services.admin_service import AdminService
+
+# (rows changed, ids deleted, next cursor, has more)
+ChangePage = Tuple[list, List[int], Optional[str], bool]
+
+
+@traced_service
+class SyncService:
+    """
+    Change feeds for the admin lists: the rows of a table created or updated
+    after a client's cursor, plus the ids of rows deleted after it.
+
+    A feed is the table's rows in (updated_at, id) order merged with its
+    tombstones in (deleted_at, id) order; the cursor is the position of the
+    last change returned (app/core/pagination.py), so a client that keeps
+    sending next_cursor sees every change once its lag has passed. A row
+    updated again moves to the end of the feed and is returned again. Each
+    page is one range read on the (updated_at, id) index and one on the
+    tombstones index.
+
+    Changes younger than SYNC_LAG_SECONDS are left for a later request: a
+    transaction that stamped updated_at before the cursor's position but had
+    not committed yet would otherwise be skipped for good.
+
+    Items are those of the list endpoints, unfiltered; clients apply their
+    list filters to the rows they receive. User counts are as of the user's
+    last change (a new quote does not change the user's updated_at).
+    """
+
+    @staticmethod
+    def get_quote_changes(db: Session, cursor: Optional[str] = None, limit: int = 100) -> AdminQuoteChanges:
+        """
+        Quote requests changed after a cursor.
+
+        Args:
+            db: Database session
+            cursor: next_cursor of the previous page, or None to start from the beginning
+            limit: Most changes (updated rows and deletes) to return
+
+        Returns:
+            Changed rows as list items, deleted ids and the next cursor
+
+        Raises:
+            ValueError: If the cursor is malformed (maps to 400)
+        """
+        rows, deleted, next_cursor, has_more = SyncService._changes(
+            db, AdminService._quotes_query(db), QuoteRequest, cursor, limit
+        )
+        return AdminQuoteChanges(
+            items=[AdminQuoteListItem(**row._mapping) for row in rows],
+            deleted=deleted,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def get_claim_changes(db: Session, cursor: Optional[str] = None, limit: int = 100) -> AdminClaimChanges:
+        """
+        Claims changed after a cursor.
+
+        Args:
+            db: Database session
+            cursor: next_cursor of the previous page, or None to start from the beginning
+            limit: Most changes (updated rows and deletes) to return
+
+        Returns:
+            Changed rows as list items, deleted ids and the next cursor
+
+        Raises:
+            ValueError: If the cursor is malformed (maps to 400)
+        """
+        rows, deleted, next_cursor, has_more = SyncService._changes(
+            db, AdminService._claims_query(db), Claim, cursor, limit
+        )
+        return AdminClaimChanges(
+            items=[AdminClaimListItem(**row._mapping) for row in rows],
+            deleted=deleted,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def get_message_changes(db: Session, cursor: Optional[str] = None, limit: int = 100) -> AdminMessageChanges:
+        """
+        Contact messages changed after a cursor.
+
+        Args:
+            db: Database session
+            cursor: next_cursor of the previous page, or None to start from the beginning
+            limit: Most changes (updated rows and deletes) to return
+
+        Returns:
+            Changed rows as list items, deleted ids and the next cursor
+
+        Raises:
+            ValueError: If the cursor is malformed (maps to 400)
+        """
+        rows, deleted, next_cursor, has_more = SyncService._changes(
+            db, AdminService._messages_query(db), ContactMessage, cursor, limit
+        )
+        return AdminMessageChanges(
+            items=[AdminService._message_list_item(row) for row in rows],
+            deleted=deleted,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def get_user_changes(db: Session, cursor: Optional[str] = None, limit: int = 100) -> AdminUserChanges:
+        """
+        Users changed after a cursor.
+
+        The feed reads only ids from the index; counts and last logins are
+        loaded for the changed users alone (two more queries, none when
+        nothing changed).
+
+        Args:
+            db: Database session
+            cursor: next_cursor of the previous page, or None to start from the beginning
+            limit: Most changes (updated rows and deletes) to return
+
+        Returns:
+            Changed users as list items, deleted ids and the next cursor
+
+        Raises:
+            ValueError: If the cursor is malformed (maps to 400)
+        """
+        rows, deleted, next_cursor, has_more = SyncService._changes(
+            db, db.query(User.id, User.updated_at), User, cursor, limit
+        )
+        items = []
+        if rows:
+            user_ids = [row.id for row in rows]
+            results = AdminService._users_query(db).filter(User.id.in_(user_ids)).all()
+            # Back into feed order
+            position = {user_id: index for index, user_id in enumerate(user_ids)}
+            results.sort(key=lambda result: position[result[0].id])
+            items = AdminService._user_list_items(db, results)
+        return AdminUserChanges(items=items, deleted=deleted, next_cursor=next_cursor, has_more=has_more)
+
+    @staticmethod
+    def _changes(db: Session, query: Query, model, cursor: Optional[str], limit: int) -> ChangePage:
+        """
+        One page of a feed.
+
+        Args:
+            db: Database session
+            query: Unordered query over the model's rows (selecting id and updated_at)
+            model: QuoteRequest, Claim, ContactMessage or User
+            cursor: Cursor from a previous page, or None
+            limit: Most changes to return
+
+        Returns:
+            (changed rows, deleted ids, next cursor, whether more changes are ready)
+
+        Raises:
+            ValueError: If the cursor is malformed (maps to 400)
+        """
+        # On the database clock, which stamped updated_at and deleted_at (the app host's may differ)
+        cutoff = func.current_timestamp() - text(f"INTERVAL {int(settings.SYNC_LAG_SECONDS)} SECOND")
+
+        query = query.filter(model.updated_at <= cutoff)
+        tombstones = db.query(Tombstone.entity_id, Tombstone.deleted_at).filter(
+            Tombstone.entity_type == model.__tablename__,
+            Tombstone.deleted_at <= cutoff,
+        )
+        if cursor:
+            query = query.filter(after_cursor(model.updated_at, model.id, cursor))
+            tombstones = tombstones.filter(after_cursor(Tombstone.deleted_at, Tombstone.entity_id, cursor))
+
+        # limit + 1 of each, so has_more is known without counting
+        rows = query.order_by(model.updated_at, model.id).limit(limit + 1).all()
+        deletes = tombstones.order_by(Tombstone.deleted_at, Tombstone.entity_id).limit(limit + 1).all()
+
+        # Merge the two streams by position; ids are never reused, so positions never tie
+        changes = sorted(
+            [(row.updated_at, row.id, row) for row in rows]
+            + [(tombstone.deleted_at, tombstone.entity_id, None) for tombstone in deletes],
+            key=lambda change: change[:2],
+        )
+        page = changes[:limit]
+        if not page:
+            return [], [], cursor, False
+
+        timestamp, last_id, _ = page[-1]
+        return (
+            [row for _, _, row in page if row is not None],
+            [row_id for _, row_id, row in page if row is None],
+            encode_cursor(timestamp, last_id),
+            len(changes) > limit,
+        )
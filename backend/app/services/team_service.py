@@ -0,0 +1,228 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, unit_of_work
+from app.core.tracing import traced_service
+from app.models.team_member import TeamMember
+from app.schemas.team_schemas import TeamMemberAdmin, TeamMemberCreate, TeamMemberPublic, TeamMemberUpdate
+from app.services.audit_log_service import AuditLogService
+
+
+class TeamSnapshot:
+    """Pre-serialized public roster with its validators"""
+
+    def __init__(self, body: bytes, last_modified: datetime, generation: int):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.last_modified = last_modified
+        self.generation = generation
+        self.built_at = time.monotonic()
+
+
+@traced_service
+class TeamService:
+    """
+    Team roster for the public team page, plus admin management of team members.
+
+    The public roster is served from an in-memory snapshot: the active members
+    ordered by display_order, already serialized to JSON, with an ETag over the
+    body. It is built on the first request and rebuilt only after an admin
+    edit invalidates it, so the team page does not touch the database in
+    steady state. Invalidation is per process: when running several workers,
+    set TEAM_SNAPSHOT_MAX_AGE_SECONDS so the other workers pick up edits.
+    """
+
+    _snapshot: Optional[TeamSnapshot] = None
+    _generation = 0
+    _last_modified: Optional[datetime] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_public_snapshot() -> TeamSnapshot:
+        """
+        Current public roster snapshot, building it if needed.
+
+        Opens its own session only when the snapshot is missing or expired,
+        so callers need no database dependency.
+
+        Returns:
+            TeamSnapshot with the JSON body, ETag and Last-Modified time
+        """
+        snapshot = TeamService.cached_public_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        with TeamService._lock:
+            # Another thread may have rebuilt it while we waited
+            snapshot = TeamService._snapshot
+            if snapshot is not None and not TeamService._expired(snapshot):
+                return snapshot
+
+            generation = TeamService._generation
+            db = SessionLocal()
+            try:
+                members = (
+                    db.query(TeamMember)
+                    .filter(TeamMember.is_active.is_(True))
+                    .order_by(TeamMember.display_order, TeamMember.id)
+                    .all()
+                )
+            finally:
+                db.close()
+
+            items = [TeamMemberPublic.model_validate(member).model_dump(mode="json") for member in members]
+            body = json.dumps(items, separators=(",", ":")).encode()
+            # Build time rather than the newest updated_at, which would move backwards after a removal;
+            # always past the previous build so If-Modified-Since sees edits made within the same second
+            last_modified = datetime.utcnow().replace(microsecond=0)
+            if TeamService._last_modified is not None and last_modified <= TeamService._last_modified:
+                last_modified = TeamService._last_modified + timedelta(seconds=1)
+            snapshot = TeamSnapshot(body, last_modified, generation)
+
+            # An edit committed while we were reading invalidates this build
+            if generation == TeamService._generation:
+                TeamService._snapshot = snapshot
+                TeamService._last_modified = last_modified
+            return snapshot
+
+    @staticmethod
+    def cached_public_snapshot() -> Optional[TeamSnapshot]:
+        """Current public roster snapshot if it is built and fresh, else None (never queries)"""
+        snapshot = TeamService._snapshot
+        if snapshot is None or TeamService._expired(snapshot):
+            return None
+        return snapshot
+
+    @staticmethod
+    def invalidate():
+        """Drop the public roster snapshot (called after every admin edit)"""
+        with TeamService._lock:
+            TeamService._generation += 1
+            TeamService._snapshot = None
+
+    @staticmethod
+    def _expired(snapshot: TeamSnapshot) -> bool:
+        max_age = settings.TEAM_SNAPSHOT_MAX_AGE_SECONDS
+        return max_age > 0 and time.monotonic() - snapshot.built_at > max_age
+
+    # ===== Admin Methods =====
+
+    @staticmethod
+    def get_all_members(db: Session) -> List[TeamMemberAdmin]:
+        """
+        Get all team members, including inactive ones, in display order.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List of team members
+        """
+        members = db.query(TeamMember).order_by(TeamMember.display_order, TeamMember.id).all()
+        return [TeamMemberAdmin.model_validate(member) for member in members]
+
+    @staticmethod
+    def create_member(db: Session, member_data: TeamMemberCreate, admin_user_id: int) -> TeamMemberAdmin:
+        """
+        Add a team member (admin only).
+
+        Args:
+            db: Database session
+            member_data: Team member data
+            admin_user_id: ID of the admin user making the change
+
+        Returns:
+            Created team member
+        """
+        member = TeamMember(**member_data.model_dump())
+        with unit_of_work(db):
+            db.add(member)
+            db.flush()
+            AuditLogService.add_user_action(
+                db=db,
+                user_id=admin_user_id,
+                action="TEAM_MEMBER_CREATED",
+                entity_type="TeamMember",
+                entity_id=member.id,
+                details=f"Admin added team member: {member.name}",
+            )
+        TeamService.invalidate()
+        db.refresh(member)
+        return TeamMemberAdmin.model_validate(member)
+
+    @staticmethod
+    def update_member(
+        db: Session,
+        member_id: int,
+        update_data: TeamMemberUpdate,
+        admin_user_id: int,
+    ) -> Optional[TeamMemberAdmin]:
+        """
+        Update a team member (admin only).
+
+        Args:
+            db: Database session
+            member_id: ID of the team member
+            update_data: Fields to change
+            admin_user_id: ID of the admin user making the change
+
+        Returns:
+            Updated team member or None if not found
+        """
+        member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
+        if not member:
+            return None
+
+        changes = update_data.model_dump(exclude_unset=True)
+        with unit_of_work(db):
+            for field, value in changes.items():
+                setattr(member, field, value)
+            db.flush()
+            AuditLogService.add_user_action(
+                db=db,
+                user_id=admin_user_id,
+                action="TEAM_MEMBER_UPDATED",
+                entity_type="TeamMember",
+                entity_id=member.id,
+                details=f"Admin updated team member: {sorted(changes)}",
+            )
+        TeamService.invalidate()
+        db.refresh(member)
+        return TeamMemberAdmin.model_validate(member)
+
+    @staticmethod
+    def delete_member(db: Session, member_id: int, admin_user_id: int) -> bool:
+        """
+        Remove a team member (admin only).
+
+        Args:
+            db: Database session
+            member_id: ID of the team member
+            admin_user_id: ID of the admin user making the change
+
+        Returns:
+            True if deleted, False if not found
+        """
+        member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
+        if not member:
+            return False
+
+        with unit_of_work(db):
+            AuditLogService.add_user_action(
+                db=db,
+                user_id=admin_user_id,
+                action="TEAM_MEMBER_DELETED",
+                entity_type="TeamMember",
+                entity_id=member.id,
+                details=f"Admin removed team member: {member.name}",
+            )
+            db.delete(member)
+        TeamService.invalidate()
+        return True
@@ -0,0 +1 @@
+# Performance benchmarks and developer tooling (run from backend/ with python -m benchmarks.<module>)
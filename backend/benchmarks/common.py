@@ -0,0 +1,90 @@
+import asyncio
+import math
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples: Latency samples (seconds)
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, or 0.0 if there are no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, float]:
+    """
+    Summarize a latency sample set.
+
+    Args:
+        latencies: Per-request latencies in seconds
+        elapsed: Wall-clock duration of the run in seconds
+        errors: Number of failed requests
+
+    Returns:
+        Dictionary with request count, errors, requests/sec and p50/p95/p99 in milliseconds
+    """
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def asgi_client(app, **kwargs) -> httpx.AsyncClient:
+    """Create an httpx client that calls the ASGI app in-process (no sockets)"""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        **kwargs,
+    )
+
+
+async def run_closed_loop(
+    call: Callable[[], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """
+    Issue `total` requests with `concurrency` workers and summarize the latencies.
+
+    Args:
+        call: Coroutine factory that performs one request
+        total: Total number of requests
+        concurrency: Number of concurrent workers
+
+    Returns:
+        Summary from summarize()
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await call()
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
@@ -0,0 +1,210 @@
+"""
+Benchmark fixtures: bench accounts and realistic request payloads.
+
+Payloads follow the real taxonomy (app/core/catalog.py) and the shape of the
+category-specific forms, and are generated from a random.Random so runs are
+reproducible.
+"""
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from app.core.catalog import SUBCATEGORIES
+from app.core.database import SessionLocal
+from app.core.security import create_access_token, hash_password
+from app.models.user import User
+
+BENCH_ADMIN_USERNAME = "bench_admin"
+BENCH_CUSTOMER_PREFIX = "bench_customer_"
+BENCH_PASSWORD = "BenchPassword123!"
+
+FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+               "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+              "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"]
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Pine St", "Elm St", "Lake Rd", "Hill St", "Park Ave", "Mill Rd"]
+CITIES = [("Columbus", "OH", "43215"), ("Dayton", "OH", "45402"), ("Toledo", "OH", "43604"),
+          ("Akron", "OH", "44308"), ("Cincinnati", "OH", "45202"), ("Cleveland", "OH", "44114")]
+VEHICLES = [("Toyota", "Camry"), ("Honda", "Civic"), ("Ford", "F-150"), ("Chevrolet", "Silverado"), ("Subaru", "Outback"),
+            ("Jeep", "Wrangler"), ("Harley-Davidson", "Street Glide"), ("Polaris", "Sportsman"), ("Yamaha", "Grizzly")]
+INCIDENTS = [
+    "Rear-ended while stopped at a red light on the way to work. Bumper and trunk damaged, no injuries.",
+    "Hail storm damaged the roof and two skylights. Water is leaking into the upstairs bedroom.",
+    "Pipe burst in the basement overnight and flooded the finished family room and laundry area.",
+    "Tree limb fell on the garage during a wind storm and cracked the roof trusses.",
+    "Backed into a pole in a parking lot, the rear quarter panel and tail light need replacing.",
+    "Kitchen fire started on the stove, smoke damage throughout the first floor of the house.",
+    "Wallet stolen at the airport, credit cards were used before they could be cancelled.",
+    "Dog was injured at the park and needed emergency surgery on a torn ligament in the back leg.",
+]
+CONTACT_MESSAGES = [
+    "I would like to review my current auto policy and see whether bundling with my homeowners policy saves money.",
+    "Can someone call me about adding my teenage son as a driver on our policy next month when he gets his license?",
+    "I have a question about the status of my claim and whether I need to send additional photos of the damage.",
+    "We are buying a rental property and need to know what landlord coverage would cost for a duplex in Dayton.",
+]
+CONTACT_PREFERENCES = ["phone", "email", "text"]
+CONTACT_TIMES = ["morning", "afternoon", "evening", "anytime"]
+CONTACT_SUBJECTS = ["general", "quote", "claim", "policy", "other"]
+
+
+def random_person(rng: random.Random) -> Tuple[str, str]:
+    """Random (full name, email) pair"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return f"{first} {last}", f"{first.lower()}.{last.lower()}{rng.randint(1, 9999)}@example.com"
+
+
+def random_phone(rng: random.Random) -> str:
+    """Phone number in the XXX.XXX.XXXX format the forms use"""
+    return f"{rng.randint(200, 999)}.{rng.randint(200, 999)}.{rng.randint(0, 9999):04d}"
+
+
+def random_category(rng: random.Random) -> Tuple[str, str]:
+    """Random (category, subcategory) pair from the category catalog (subcategory may be None)"""
+    category = rng.choice(list(SUBCATEGORIES))
+    subcategories = SUBCATEGORIES[category]
+    return category, rng.choice(subcategories) if subcategories else None
+
+
+def category_form_data(rng: random.Random, category: str, subcategory: str) -> Dict:
+    """Category-specific form data, shaped like the frontend quote and claim forms"""
+    city, state, zip_code = rng.choice(CITIES)
+    address = {
+        "street": f"{rng.randint(100, 9999)} {rng.choice(STREETS)}",
+        "city": city,
+        "state": state,
+        "zip": zip_code,
+    }
+    if category == "vehicle":
+        make, model = rng.choice(VEHICLES)
+        return {
+            "year": rng.randint(2005, 2025),
+            "make": make,
+            "model": model,
+            "vin": "".join(rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ0123456789") for _ in range(17)),
+            "primary_use": rng.choice(["commute", "pleasure", "business"]),
+            "annual_mileage": rng.randrange(2000, 25000, 500),
+            "drivers": [{"age": rng.randint(16, 85), "years_licensed": rng.randint(0, 50)} for _ in range(rng.randint(1, 3))],
+            "garaging_address": address,
+        }
+    if category == "property":
+        return {
+            "property_address": address,
+            "year_built": rng.randint(1900, 2024),
+            "square_feet": rng.randrange(600, 5000, 50),
+            "construction_type": rng.choice(["frame", "masonry", "brick_veneer"]),
+            "roof_age_years": rng.randint(0, 30),
+            "has_security_system": rng.random() < 0.4,
+            "dwelling_coverage": rng.randrange(100000, 800000, 10000),
+        }
+    if category == "life":
+        # LifeQuoteForm.vue: beneficiary is optional, beneficiary_other only with relationship "other"
+        relationship = rng.choice(["", "spouse", "parent", "sibling", "child", "other"])
+        return {
+            "coverage_amount": rng.choice([100000, 250000, 500000, 1000000]),
+            "term_length": rng.choice(["10", "15", "20", "30"]),
+            "beneficiary_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" if relationship else "",
+            "beneficiary_relationship": relationship,
+            "beneficiary_other": "Business partner" if relationship == "other" else "",
+            "health_info": rng.choice(["excellent", "good", "fair", "pre_existing"]),
+        }
+    if category == "business":
+        return {
+            "business_name": f"{rng.choice(LAST_NAMES)} {rng.choice(['Plumbing', 'Bakery', 'Consulting', 'Landscaping', 'Auto Repair'])}",
+            "employees": rng.randint(1, 250),
+            "annual_revenue": rng.randrange(50000, 20000000, 10000),
+            "years_in_business": rng.randint(0, 60),
+            "business_address": address,
+        }
+    if category == "identity_protection":
+        return {
+            "household_members": rng.randint(1, 6),
+            "credit_monitoring": rng.random() < 0.5,
+            "prior_identity_theft": rng.random() < 0.1,
+        }
+    return {
+        "coverage_type": subcategory,
+        "estimated_value": rng.randrange(500, 250000, 100),
+        "description": rng.choice(INCIDENTS)[:120],
+        "address": address,
+    }
+
+
+def quote_payload(rng: random.Random) -> Dict:
+    """Request body for POST /api/v1/quotes/"""
+    category, subcategory = random_category(rng)
+    return {
+        "category": category,
+        "subcategory": subcategory,
+        "quote_data": category_form_data(rng, category, subcategory),
+        "customer_notes": rng.choice([None, "Please call after 5pm.", "Looking to switch carriers at renewal."]),
+    }
+
+
+def claim_payload(rng: random.Random) -> Dict:
+    """Request body for POST /api/v1/claims/"""
+    category, subcategory = random_category(rng)
+    incident_date = date.today() - timedelta(days=rng.randint(0, 700))
+    return {
+        "category": category,
+        "subcategory": subcategory,
+        "incident_date": incident_date.isoformat(),
+        "incident_summary": rng.choice(INCIDENTS),
+        "claim_data": category_form_data(rng, category, subcategory),
+        "appointment_requested": (date.today() + timedelta(days=rng.randint(1, 30))).isoformat() if rng.random() < 0.3 else None,
+        "contact_preference": rng.choice(CONTACT_PREFERENCES),
+        "preferred_contact_time": rng.choice(CONTACT_TIMES),
+        "additional_notes": None,
+    }
+
+
+def contact_payload(rng: random.Random) -> Dict:
+    """Request body for POST /api/v1/contact/submit"""
+    full_name, email = random_person(rng)
+    return {
+        "full_name": full_name,
+        "email": email,
+        "phone": random_phone(rng) if rng.random() < 0.6 else None,
+        "subject": rng.choice(CONTACT_SUBJECTS),
+        "message": rng.choice(CONTACT_MESSAGES),
+    }
+
+
+def ensure_bench_users(customers: int) -> Tuple[str, List[str]]:
+    """
+    Create the bench admin and customer accounts if they do not exist yet.
+
+    Args:
+        customers: Number of customer accounts to use
+
+    Returns:
+        Tuple of (admin access token, list of customer access tokens)
+    """
+    db = SessionLocal()
+    try:
+        usernames = [BENCH_ADMIN_USERNAME] + [f"{BENCH_CUSTOMER_PREFIX}{i}" for i in range(customers)]
+        existing = {
+            user.username: user
+            for user in db.query(User).filter(User.username.in_(usernames)).all()
+        }
+
+        hashed_password = hash_password(BENCH_PASSWORD)
+        for username in usernames:
+            if username in existing:
+                continue
+            user = User(
+                username=username,
+                email=f"{username}@bench.example.com",
+                full_name=f"Bench {username.replace('_', ' ').title()}",
+                hashed_password=hashed_password,
+                is_active=True,
+                is_admin=username == BENCH_ADMIN_USERNAME,
+            )
+            db.add(user)
+            existing[username] = user
+        db.commit()
+
+        tokens = [create_access_token({"sub": str(existing[username].id)}) for username in usernames]
+        return tokens[0], tokens[1:]
+    finally:
+        db.close()
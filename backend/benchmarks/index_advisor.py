@@ -0,0 +1,314 @@
+"""
+Index advisor: EXPLAIN every service query shape and suggest composite indexes.
+
+Calls the read paths of AdminService, ClaimService, QuoteService,
+ContactService, DashboardService and SyncService with representative filters against
+the database in DATABASE_URL (seed it first with benchmarks/seed.py; plans
+on a near-empty table say little). Every SELECT they issue is captured and
+re-run under EXPLAIN with the same parameters, and the plan is checked for:
+
+- full table scans (type=ALL)
+- filesorts (Using filesort)
+- temporary tables (Using temporary)
+
+For flagged statements the WHERE / ORDER BY columns of the SQLAlchemy
+statement are split into equality, sort and range columns, and a composite
+index (equality, then sort, then range columns) is suggested unless an
+existing index already starts with those columns. Suggestions are grouped
+across query shapes so the most useful index comes first.
+
+MariaDB/MySQL use EXPLAIN; SQLite (for a quick local look) uses EXPLAIN
+QUERY PLAN, where SCAN / TEMP B-TREE map to the same findings.
+
+Usage (from backend/):
+    python -m benchmarks.index_advisor
+    python -m benchmarks.index_advisor --only AdminService --plans
+"""
+import argparse
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Table, event, func, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, ColumnClause, UnaryExpression
+from sqlalchemy.sql.selectable import Select
+
+from app.core.database import SessionLocal, engine
+from app.core.pagination import encode_cursor
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.user import User
+from app.services.admin_service import AdminService
+from app.services.claim_service import ClaimService
+from app.services.contact_service import ContactService
+from app.services.dashboard_service import DashboardService
+from app.services.quote_service import QuoteService
+from app.services.sync_service import SyncService
+
+EQUALITY_OPERATORS = {operators.eq, operators.in_op, operators.is_}
+RANGE_OPERATORS = {operators.lt, operators.le, operators.gt, operators.ge, operators.between_op}
+
+
+class SampleIds:
+    """Ids of existing rows (and a change feed cursor) used as arguments for detail, per-user and feed queries"""
+
+    def __init__(self, db: Session):
+        self.quote_id = db.query(func.max(QuoteRequest.id)).scalar() or 0
+        self.claim_id = db.query(func.max(Claim.id)).scalar() or 0
+        self.message_id = db.query(func.max(ContactMessage.id)).scalar() or 0
+        self.user_id = (
+            db.query(QuoteRequest.user_id).filter(QuoteRequest.id == self.quote_id).scalar()
+            or db.query(func.max(User.id)).scalar()
+            or 0
+        )
+        # A client that last synced a day ago
+        self.sync_cursor = encode_cursor(datetime.now() - timedelta(days=1), 0)
+
+
+# (label, call(db, ids))
+SERVICE_CALLS: List[Tuple[str, Callable[[Session, SampleIds], object]]] = [
+    ("AdminService.get_dashboard_stats", lambda db, ids: AdminService.get_dashboard_stats(db)),
+    ("AdminService.get_recent_activity", lambda db, ids: AdminService.get_recent_activity(db)),
+    ("AdminService.get_attention_items", lambda db, ids: AdminService.get_attention_items(db)),
+    ("AdminService.get_all_quotes()", lambda db, ids: AdminService.get_all_quotes(db)),
+    ("AdminService.get_all_quotes(status)", lambda db, ids: AdminService.get_all_quotes(db, status="pending")),
+    ("AdminService.get_all_quotes(category, subcategory)",
+     lambda db, ids: AdminService.get_all_quotes(db, category="vehicle", subcategory="auto")),
+    ("AdminService.get_all_quotes(search)", lambda db, ids: AdminService.get_all_quotes(db, search="smith")),
+    ("AdminService.get_quote_detail", lambda db, ids: AdminService.get_quote_detail(db, ids.quote_id)),
+    ("AdminService.get_all_claims()", lambda db, ids: AdminService.get_all_claims(db)),
+    ("AdminService.get_all_claims(status)", lambda db, ids: AdminService.get_all_claims(db, status="submitted")),
+    ("AdminService.get_all_claims(category, subcategory)",
+     lambda db, ids: AdminService.get_all_claims(db, category="property", subcategory="homeowners")),
+    ("AdminService.get_claim_detail", lambda db, ids: AdminService.get_claim_detail(db, ids.claim_id)),
+    ("AdminService.get_all_messages()", lambda db, ids: AdminService.get_all_messages(db)),
+    ("AdminService.get_all_messages(subject, status)",
+     lambda db, ids: AdminService.get_all_messages(db, subject="quote", status="new")),
+    ("AdminService.get_all_messages(include_guest=False)",
+     lambda db, ids: AdminService.get_all_messages(db, include_guest=False)),
+    ("AdminService.get_message_detail", lambda db, ids: AdminService.get_message_detail(db, ids.message_id)),
+    ("AdminService.get_all_users(activity)", lambda db, ids: AdminService.get_all_users(db)),
+    ("AdminService.get_all_users(name, active)",
+     lambda db, ids: AdminService.get_all_users(db, status="active", sort_by="name", sort_order="asc")),
+    ("AdminService.get_all_users(recently_contacted)",
+     lambda db, ids: AdminService.get_all_users(db, recently_contacted="1month")),
+    ("AdminService.get_user_detail", lambda db, ids: AdminService.get_user_detail(db, ids.user_id)),
+    ("AdminService.get_user_detail(date_range)",
+     lambda db, ids: AdminService.get_user_detail(db, ids.user_id, date_range="6months")),
+    ("ClaimService.get_user_claims", lambda db, ids: ClaimService.get_user_claims(db, ids.user_id)),
+    ("ClaimService.get_user_claims_etag", lambda db, ids: ClaimService.get_user_claims_etag(db, ids.user_id)),
+    ("ClaimService.get_claim_by_id", lambda db, ids: _allow_denied(ClaimService.get_claim_by_id, db, ids.claim_id, ids.user_id)),
+    ("QuoteService.get_user_quote_requests", lambda db, ids: QuoteService.get_user_quote_requests(db, ids.user_id)),
+    ("QuoteService.get_user_quote_requests_etag", lambda db, ids: QuoteService.get_user_quote_requests_etag(db, ids.user_id)),
+    ("QuoteService.get_quote_request_by_id",
+     lambda db, ids: _allow_denied(QuoteService.get_quote_request_by_id, db, ids.quote_id, ids.user_id)),
+    ("ContactService.get_user_messages", lambda db, ids: ContactService.get_user_messages(db, ids.user_id)),
+    ("ContactService.get_user_messages_etag", lambda db, ids: ContactService.get_user_messages_etag(db, ids.user_id)),
+    ("ContactService.get_message_detail",
+     lambda db, ids: _allow_denied(ContactService.get_message_detail, db, ids.message_id, ids.user_id)),
+    ("DashboardService.get_section_stats", lambda db, ids: DashboardService.get_section_stats(db, ids.user_id)),
+    ("DashboardService.get_dashboard",
+     lambda db, ids: DashboardService.get_dashboard(db, ids.user_id, DashboardService.get_section_stats(db, ids.user_id))),
+    ("SyncService.get_quote_changes", lambda db, ids: SyncService.get_quote_changes(db, ids.sync_cursor)),
+    ("SyncService.get_claim_changes", lambda db, ids: SyncService.get_claim_changes(db, ids.sync_cursor)),
+    ("SyncService.get_message_changes", lambda db, ids: SyncService.get_message_changes(db, ids.sync_cursor)),
+    ("SyncService.get_user_changes", lambda db, ids: SyncService.get_user_changes(db, ids.sync_cursor)),
+]
+
+
+def _allow_denied(method: Callable, *args):
+    """Ownership checks may reject the sample ids; the lookup query has run by then"""
+    try:
+        return method(*args)
+    except (PermissionError, ValueError):
+        return None
+
+
+class CapturedQuery:
+    """A SELECT issued by a service call, with what is needed to EXPLAIN it"""
+
+    def __init__(self, sql: str, parameters, statement):
+        self.sql = sql
+        self.parameters = parameters
+        self.statement = statement
+        self.findings: List[Tuple[str, str]] = []  # (table, issue)
+        self.plan: List[str] = []
+
+
+def explain(conn, query: CapturedQuery):
+    """Run EXPLAIN for a captured query and record full scans, filesorts and temporary tables"""
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + query.sql, query.parameters).fetchall()
+        for row in rows:
+            detail = row[-1]
+            query.plan.append(detail)
+            words = detail.split()
+            if words[0] == "SCAN" and "INDEX" not in words:
+                query.findings.append((words[1], "full scan"))
+            elif "TEMP B-TREE FOR ORDER BY" in detail:
+                query.findings.append(("", "filesort"))
+            elif "TEMP B-TREE" in detail:
+                query.findings.append(("", "temporary"))
+        return
+
+    result = conn.exec_driver_sql("EXPLAIN " + query.sql, query.parameters)
+    columns = list(result.keys())
+    for row in result.fetchall():
+        plan = dict(zip(columns, row))
+        query.plan.append(
+            f"table={plan.get('table')} type={plan.get('type')} key={plan.get('key')} "
+            f"rows={plan.get('rows')} extra={plan.get('Extra')}"
+        )
+        table = plan.get("table") or ""
+        extra = plan.get("Extra") or ""
+        if plan.get("type") == "ALL":
+            query.findings.append((table, f"full scan (~{plan.get('rows')} rows)"))
+        if "Using filesort" in extra:
+            query.findings.append((table, "filesort"))
+        if "Using temporary" in extra:
+            query.findings.append((table, "temporary"))
+
+
+def _table_column(element) -> Optional[Tuple[str, str]]:
+    """(table, column) for a column of a real table, else None"""
+    if isinstance(element, UnaryExpression):
+        element = element.element
+    if isinstance(element, ColumnClause) and isinstance(getattr(element, "table", None), Table):
+        return element.table.name, element.name
+    return None
+
+
+def suggest_indexes(statement) -> Dict[str, Tuple[str, ...]]:
+    """
+    Suggest one composite index per table for a statement, ordered as
+    equality columns, then ORDER BY columns, then the first range column.
+    """
+    equality: Dict[str, List[str]] = defaultdict(list)
+    ranges: Dict[str, List[str]] = defaultdict(list)
+    sorts: Dict[str, List[str]] = defaultdict(list)
+
+    def add(target: Dict[str, List[str]], table: str, column: str):
+        if column not in target[table]:
+            target[table].append(column)
+
+    for select in (e for e in visitors.iterate(statement) if isinstance(e, Select)):
+        if select.whereclause is not None:
+            for element in visitors.iterate(select.whereclause):
+                if not isinstance(element, BinaryExpression):
+                    continue
+                column = _table_column(element.left)
+                if column is None:
+                    continue
+                if element.operator in EQUALITY_OPERATORS:
+                    add(equality, *column)
+                elif element.operator in RANGE_OPERATORS:
+                    add(ranges, *column)
+        for clause in select._order_by_clauses:
+            column = _table_column(clause)
+            if column is not None:
+                add(sorts, *column)
+
+    suggestions = {}
+    for table in set(equality) | set(sorts) | set(ranges):
+        columns = list(equality[table])
+        columns += [c for c in sorts[table] if c not in columns]
+        # A range column only helps after the sort columns if it is the sort column itself
+        if ranges[table] and not sorts[table]:
+            columns += [c for c in ranges[table][:1] if c not in columns]
+        if columns and columns != ["id"]:
+            suggestions[table] = tuple(columns)
+    return suggestions
+
+
+def existing_index_prefixes(table: str) -> Set[Tuple[str, ...]]:
+    """Column tuples of existing indexes (and every leading prefix of them)"""
+    inspector = inspect(engine)
+    indexes = [tuple(index["column_names"]) for index in inspector.get_indexes(table)]
+    indexes.append(tuple(inspector.get_pk_constraint(table)["constrained_columns"]))
+    return {index[:length] for index in indexes for length in range(1, len(index) + 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help="Only run calls whose label contains this text (e.g. AdminService)")
+    parser.add_argument("--plans", action="store_true", help="Print the full plan of every statement")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    captured: List[CapturedQuery] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            compiled = getattr(context, "compiled", None)
+            captured.append(CapturedQuery(statement, parameters, getattr(compiled, "statement", None)))
+
+    db = SessionLocal()
+    ids = SampleIds(db)
+    # (label, captured queries, error of the call or None)
+    results: List[Tuple[str, List[CapturedQuery], Optional[str]]] = []
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        for label, call in SERVICE_CALLS:
+            if args.only and args.only not in label:
+                continue
+            captured.clear()
+            error = None
+            try:
+                call(db, ids)
+            except Exception as exc:
+                # Reported with the call's queries; the other calls still run
+                error = f"{type(exc).__name__}: {exc}"
+            db.rollback()
+            results.append((label, list(captured), error))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        db.close()
+
+    # (table, columns) -> labels of the query shapes that would use it
+    suggestions: Dict[Tuple[str, Tuple[str, ...]], Set[str]] = defaultdict(set)
+    prefixes: Dict[str, Set[Tuple[str, ...]]] = {}
+
+    with engine.connect() as conn:
+        for label, queries, error in results:
+            print(f"\n{label}")
+            if error:
+                print(f"  [error] {' '.join(error.split())[:150]}")
+            for query in queries:
+                try:
+                    explain(conn, query)
+                except Exception as exc:
+                    # e.g. the statement the call failed on
+                    conn.rollback()
+                    print(f"  [error] {type(exc).__name__} in EXPLAIN: {' '.join(query.sql.split())[:150]}")
+                    continue
+                status = "; ".join(f"{table} {issue}".strip() for table, issue in query.findings) or "ok"
+                print(f"  [{status}] {' '.join(query.sql.split())[:150]}")
+                if args.plans:
+                    for line in query.plan:
+                        print(f"      {line}")
+
+                if not query.findings or query.statement is None:
+                    continue
+                for table, columns in suggest_indexes(query.statement).items():
+                    if table not in prefixes:
+                        prefixes[table] = existing_index_prefixes(table)
+                    if columns not in prefixes[table]:
+                        suggestions[(table, columns)].add(label)
+
+    print("\nSuggested composite indexes (most query shapes first):")
+    if not suggestions:
+        print("  none")
+    for (table, columns), labels in sorted(suggestions.items(), key=lambda item: -len(item[1])):
+        name = f"ix_{table}_{'_'.join(columns)}"
+        print(f"  CREATE INDEX {name} ON {table} ({', '.join(columns)});")
+        for label in sorted(labels):
+            print(f"      used by {label}")
+
+
+if __name__ == "__main__":
+    main()
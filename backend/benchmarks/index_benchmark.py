@@ -0,0 +1,203 @@
+"""
+Before/after benchmark for the composite indexes of migration 002.
+
+Times the hot query shapes (attention items, customer lists, admin list
+filters, today's appointments) against a seeded database, once with the
+composite indexes hidden from the planner ("before") and once with them
+("after"), and prints the median and p95 latency of each shape.
+
+On MariaDB/MySQL the indexes are hidden with IGNORE INDEX hints, so the
+schema is not touched. SQLite has no per-index hints: there the indexes
+are dropped for the "before" phase and recreated afterwards, so only use it
+on a scratch database. Run migration 002 (alembic upgrade head) and seed
+the database with benchmarks/seed.py first.
+
+Usage (from backend/):
+    python -m benchmarks.index_benchmark
+    python -m benchmarks.index_benchmark --repeat 50
+"""
+import argparse
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import func, select, text
+
+from app.core.database import engine
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.user import User
+
+MODELS = [QuoteRequest, Claim, ContactMessage]
+# The indexes of migrations 002 and 004 (004 replaced the user_id ones); the models also carry
+# the change feed indexes of migration 005, which these shapes do not use
+COMPOSITE_INDEXES: Dict[str, List[str]] = {
+    "quote_requests": [
+        "ix_quote_requests_status_created_at",
+        "ix_quote_requests_user_id_created_at_id_version",
+        "ix_quote_requests_category_subcategory_created_at",
+        "ix_quote_requests_appointment_date",
+    ],
+    "claims": [
+        "ix_claims_status_created_at",
+        "ix_claims_user_id_created_at_id_version",
+        "ix_claims_category_subcategory_created_at",
+        "ix_claims_appointment_requested",
+    ],
+    "contact_messages": [
+        "ix_contact_messages_status_created_at",
+        "ix_contact_messages_user_id_created_at_id_version",
+        "ix_contact_messages_subject_created_at",
+        "ix_contact_messages_appointment_date",
+    ],
+}
+
+PAGE_SIZE = 20
+
+
+def build_shapes(user_id: int) -> List[Tuple[str, Callable[[bool], object]]]:
+    """
+    Query shapes to time, as (label, build(hide_indexes) -> statement).
+
+    Args:
+        user_id: Customer used for the per-user shapes (the one with most quotes)
+    """
+    two_days_ago = datetime.now() - timedelta(days=2)
+    today = date.today()
+
+    def hinted(statement, hide: bool, *models):
+        if hide:
+            for model in models:
+                names = ", ".join(COMPOSITE_INDEXES[model.__tablename__])
+                statement = statement.with_hint(model, f"IGNORE INDEX ({names})", "mysql")
+                statement = statement.with_hint(model, f"IGNORE INDEX ({names})", "mariadb")
+        return statement
+
+    return [
+        ("attention: overdue quotes", lambda hide: hinted(
+            select(QuoteRequest, User.full_name).join(User).where(
+                QuoteRequest.status.in_(["pending", "in_review"]), QuoteRequest.created_at < two_days_ago
+            ), hide, QuoteRequest)),
+        ("attention: overdue claims", lambda hide: hinted(
+            select(Claim, User.full_name).join(User).where(
+                Claim.status == "submitted", Claim.created_at < two_days_ago
+            ), hide, Claim)),
+        ("attention: quote appointments today", lambda hide: hinted(
+            select(QuoteRequest, User.full_name).join(User).where(QuoteRequest.appointment_date == today),
+            hide, QuoteRequest)),
+        ("attention: claim appointments today", lambda hide: hinted(
+            select(Claim, User.full_name).join(User).where(Claim.appointment_requested == today),
+            hide, Claim)),
+        ("attention: message appointments today", lambda hide: hinted(
+            select(ContactMessage).where(ContactMessage.appointment_date == today), hide, ContactMessage)),
+        ("dashboard: count quotes by status", lambda hide: hinted(
+            select(func.count()).select_from(QuoteRequest).where(QuoteRequest.status == "pending"),
+            hide, QuoteRequest)),
+        ("customer: quotes by user", lambda hide: hinted(
+            select(QuoteRequest).where(QuoteRequest.user_id == user_id).order_by(QuoteRequest.created_at.desc()),
+            hide, QuoteRequest)),
+        ("customer: claims by user", lambda hide: hinted(
+            select(Claim).where(Claim.user_id == user_id).order_by(Claim.created_at.desc()).limit(100),
+            hide, Claim)),
+        ("customer: messages by user", lambda hide: hinted(
+            select(ContactMessage).where(ContactMessage.user_id == user_id)
+            .order_by(ContactMessage.created_at.desc()).limit(100), hide, ContactMessage)),
+        ("admin: quotes by status", lambda hide: hinted(
+            select(QuoteRequest).where(QuoteRequest.status == "pending")
+            .order_by(QuoteRequest.created_at.desc()).limit(PAGE_SIZE), hide, QuoteRequest)),
+        ("admin: quotes by category/subcategory", lambda hide: hinted(
+            select(QuoteRequest).where(QuoteRequest.category == "vehicle", QuoteRequest.subcategory == "auto")
+            .order_by(QuoteRequest.created_at.desc()).limit(PAGE_SIZE), hide, QuoteRequest)),
+        ("admin: claims by status", lambda hide: hinted(
+            select(Claim).where(Claim.status == "submitted")
+            .order_by(Claim.created_at.desc()).limit(PAGE_SIZE), hide, Claim)),
+        ("admin: claims by category/subcategory", lambda hide: hinted(
+            select(Claim).where(Claim.category == "property", Claim.subcategory == "homeowners")
+            .order_by(Claim.created_at.desc()).limit(PAGE_SIZE), hide, Claim)),
+        ("admin: messages by status", lambda hide: hinted(
+            select(ContactMessage).where(ContactMessage.status == "new")
+            .order_by(ContactMessage.created_at.desc()).limit(PAGE_SIZE), hide, ContactMessage)),
+        ("admin: messages by subject", lambda hide: hinted(
+            select(ContactMessage).where(ContactMessage.subject == "quote")
+            .order_by(ContactMessage.created_at.desc()).limit(PAGE_SIZE), hide, ContactMessage)),
+    ]
+
+
+@contextmanager
+def composite_indexes_hidden(conn):
+    """On SQLite, drop the composite indexes for the duration of the block and recreate them afterwards"""
+    if conn.dialect.name != "sqlite":
+        yield
+        return
+    # pysqlite does not wrap DDL in a transaction, so the drop cannot simply be rolled back
+    indexes = [
+        index for model in MODELS for index in model.__table_args__
+        if index.name in COMPOSITE_INDEXES[model.__tablename__]
+    ]
+    for index in indexes:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+    conn.commit()
+    try:
+        yield
+    finally:
+        conn.rollback()
+        for index in indexes:
+            index.create(conn, checkfirst=True)
+        conn.commit()
+
+
+def time_shape(conn, statement, repeat: int) -> List[float]:
+    """Run a statement repeat times (after one unmeasured run) and return the latencies in ms"""
+    conn.execute(statement).fetchall()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(statement).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> Tuple[float, float]:
+    """(median, p95) of a list of latencies"""
+    ordered = sorted(timings)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query shape and phase")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        user_id = conn.execute(
+            select(QuoteRequest.user_id).group_by(QuoteRequest.user_id)
+            .order_by(func.count().desc()).limit(1)
+        ).scalar() or 0
+        rows = {model.__tablename__: conn.execute(select(func.count()).select_from(model)).scalar() for model in MODELS}
+        conn.rollback()
+        print("Rows: " + ", ".join(f"{table}={count}" for table, count in rows.items()))
+
+        shapes = build_shapes(user_id)
+        results: Dict[str, Dict[str, List[float]]] = {label: {} for label, _ in shapes}
+
+        with composite_indexes_hidden(conn):
+            for label, build in shapes:
+                results[label]["before"] = time_shape(conn, build(True), args.repeat)
+        conn.rollback()
+        for label, build in shapes:
+            results[label]["after"] = time_shape(conn, build(False), args.repeat)
+        conn.rollback()
+
+    print(f"\n{'query shape':<40} {'before p50':>11} {'p95':>9} {'after p50':>11} {'p95':>9} {'speedup':>8}")
+    for label, phases in results.items():
+        before_p50, before_p95 = summarize(phases["before"])
+        after_p50, after_p95 = summarize(phases["after"])
+        speedup = before_p50 / after_p50 if after_p50 else float("inf")
+        print(f"{label:<40} {before_p50:>9.2f}ms {before_p95:>7.2f}ms {after_p50:>9.2f}ms {after_p95:>7.2f}ms {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Load and latency benchmark for the API.
+
+Boots app.main:app in-process (httpx over ASGI, no sockets) against the
+database in DATABASE_URL and drives a weighted request mix with a fixed
+number of concurrent virtual users. Reports throughput and p50/p95/p99 per
+endpoint and writes the results, tagged with the git commit, as JSON so
+runs can be compared across commits.
+
+Mixes:
+    customer  quote and claim submissions plus the customer's own lists
+    public    guest /contact/submit
+    admin     dashboard polling, list pagination, filters and search
+    mixed     all of the above in production-like proportions
+
+Point DATABASE_URL at a benchmark database (see benchmarks/seed.py for bulk
+data); bench_admin / bench_customer_N accounts are created on first run.
+
+Usage (from backend/):
+    python -m benchmarks.load_test --mix mixed --duration 30 --concurrency 50
+    python -m benchmarks.load_test --mix admin --compare benchmarks/results/<earlier run>.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.services.admin_service import AdminService
+from benchmarks.common import asgi_client, summarize
+from benchmarks.fixtures import (
+    CONTACT_SUBJECTS,
+    LAST_NAMES,
+    claim_payload,
+    contact_payload,
+    ensure_bench_users,
+    quote_payload,
+    random_category,
+)
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# (method, url, httpx request kwargs)
+RequestSpec = Tuple[str, str, Dict]
+# (endpoint label, weight, factory(rng, context) -> RequestSpec)
+MixEntry = Tuple[str, int, Callable[[random.Random, "BenchContext"], RequestSpec]]
+
+
+class BenchContext:
+    """Access tokens shared by the virtual users"""
+
+    def __init__(self, admin_token: str, customer_tokens: List[str]):
+        self.admin_headers = {"Authorization": f"Bearer {admin_token}"}
+        self.customer_headers = [{"Authorization": f"Bearer {token}"} for token in customer_tokens]
+
+    def customer(self, rng: random.Random) -> Dict[str, str]:
+        return rng.choice(self.customer_headers)
+
+
+def _admin_list(path: str, filters: Callable[[random.Random], Dict]) -> Callable[[random.Random, BenchContext], RequestSpec]:
+    """Factory for an admin list request: random page, 20-50 rows, optional filters/search"""
+    def build(rng: random.Random, ctx: BenchContext) -> RequestSpec:
+        params = {"page": rng.randint(1, 5), "limit": rng.choice([20, 20, 50])}
+        if rng.random() < 0.5:
+            params.update(filters(rng))
+        if rng.random() < 0.3:
+            params["search"] = rng.choice(LAST_NAMES).lower()
+        return "GET", path, {"params": params, "headers": ctx.admin_headers}
+    return build
+
+
+def _category_filter(statuses: List[str]) -> Callable[[random.Random], Dict]:
+    def build(rng: random.Random) -> Dict:
+        if rng.random() < 0.5:
+            return {"status": rng.choice(statuses)}
+        category, subcategory = random_category(rng)
+        params = {"category": category}
+        if subcategory and rng.random() < 0.5:
+            params["subcategory"] = subcategory
+        return params
+    return build
+
+
+CUSTOMER_MIX: List[MixEntry] = [
+    ("POST /quotes/", 3, lambda rng, ctx: ("POST", "/api/v1/quotes/", {"json": quote_payload(rng), "headers": ctx.customer(rng)})),
+    ("POST /claims/", 2, lambda rng, ctx: ("POST", "/api/v1/claims/", {"json": claim_payload(rng), "headers": ctx.customer(rng)})),
+    ("GET /quotes/", 3, lambda rng, ctx: ("GET", "/api/v1/quotes/", {"headers": ctx.customer(rng)})),
+    ("GET /claims/my-claims", 2, lambda rng, ctx: ("GET", "/api/v1/claims/my-claims", {"headers": ctx.customer(rng)})),
+    ("GET /auth/me", 2, lambda rng, ctx: ("GET", "/api/v1/auth/me", {"headers": ctx.customer(rng)})),
+]
+
+PUBLIC_MIX: List[MixEntry] = [
+    ("POST /contact/submit", 1, lambda rng, ctx: ("POST", "/api/v1/contact/submit", {"json": contact_payload(rng)})),
+]
+
+ADMIN_MIX: List[MixEntry] = [
+    ("GET /admin/dashboard/stats", 4, lambda rng, ctx: ("GET", "/api/v1/admin/dashboard/stats", {"headers": ctx.admin_headers})),
+    ("GET /admin/dashboard/recent-activity", 2, lambda rng, ctx: ("GET", "/api/v1/admin/dashboard/recent-activity", {"headers": ctx.admin_headers})),
+    ("GET /admin/dashboard/attention-items", 2, lambda rng, ctx: ("GET", "/api/v1/admin/dashboard/attention-items", {"headers": ctx.admin_headers})),
+    ("GET /admin/quotes", 3, _admin_list("/api/v1/admin/quotes", _category_filter(AdminService.QUOTE_STATUSES))),
+    ("GET /admin/claims", 3, _admin_list("/api/v1/admin/claims", _category_filter(AdminService.CLAIM_STATUSES))),
+    ("GET /admin/messages", 2, _admin_list("/api/v1/admin/messages", lambda rng: {"subject": rng.choice(CONTACT_SUBJECTS)})),
+    ("GET /admin/users", 2, _admin_list("/api/v1/admin/users", lambda rng: {"sort_by": rng.choice(["activity", "name", "status"])})),
+]
+
+MIXES: Dict[str, List[MixEntry]] = {
+    "customer": CUSTOMER_MIX,
+    "public": PUBLIC_MIX,
+    "admin": ADMIN_MIX,
+    # Roughly: most traffic is customers, a steady trickle of guests, admins polling
+    "mixed": (
+        [(name, weight * 4, build) for name, weight, build in CUSTOMER_MIX]
+        + [(name, weight * 6, build) for name, weight, build in PUBLIC_MIX]
+        + ADMIN_MIX
+    ),
+}
+
+
+async def run_mix(
+    app,
+    mix: List[MixEntry],
+    ctx: BenchContext,
+    concurrency: int,
+    duration: float,
+    total: Optional[int],
+    seed: int,
+) -> Dict:
+    """
+    Drive the app with `concurrency` virtual users picking requests from the mix.
+
+    Args:
+        app: ASGI app under test
+        mix: Weighted request mix
+        ctx: Shared access tokens
+        concurrency: Number of concurrent virtual users
+        duration: Run length in seconds (ignored when total is given)
+        total: Total number of requests, or None to run for `duration`
+        seed: Seed for the per-user random generators
+
+    Returns:
+        Dictionary with per-endpoint and overall summaries
+    """
+    names = [name for name, _, _ in mix]
+    weights = [weight for _, weight, _ in mix]
+    builders = {name: build for name, _, build in mix}
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {name: 0 for name in names}
+    remaining = total
+    deadline = time.perf_counter() + duration
+
+    async with asgi_client(app, timeout=60) as client:
+        async def virtual_user(index: int):
+            nonlocal remaining
+            rng = random.Random(seed * 1000 + index)
+            while True:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                elif time.perf_counter() >= deadline:
+                    return
+
+                name = rng.choices(names, weights)[0]
+                method, url, kwargs = builders[name](rng, ctx)
+                start = time.perf_counter()
+                response = await client.request(method, url, **kwargs)
+                latencies[name].append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors[name] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    all_latencies = [latency for samples in latencies.values() for latency in samples]
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "overall": summarize(all_latencies, elapsed, sum(errors.values())),
+        "endpoints": {
+            name: summarize(latencies[name], elapsed, errors[name])
+            for name in names
+            if latencies[name]
+        },
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit (with a -dirty suffix for uncommitted changes), if available"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: Dict):
+    """Print per-endpoint throughput and latency percentiles"""
+    print(f"{'endpoint':<42}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = list(results["endpoints"].items()) + [("TOTAL", results["overall"])]
+    for name, summary in rows:
+        print(
+            f"{name:<42}{summary['requests']:>10}{summary['errors']:>8}{summary['rps']:>10}"
+            f"{summary['p50_ms']:>10}{summary['p95_ms']:>10}{summary['p99_ms']:>10}"
+        )
+
+
+def print_comparison(baseline: Dict, current: Dict):
+    """Print throughput and p50/p95/p99 changes relative to a baseline result file"""
+    def change(before: float, after: float) -> str:
+        if not before:
+            return "n/a"
+        return f"{(after - before) / before * 100:+.1f}%"
+
+    print(f"\nCompared with {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')}):")
+    print(f"{'endpoint':<42}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    rows = [(name, summary, baseline["endpoints"].get(name)) for name, summary in current["endpoints"].items()]
+    rows.append(("TOTAL", current["overall"], baseline["overall"]))
+    for name, after, before in rows:
+        if before is None:
+            print(f"{name:<42}{'(new)':>10}")
+            continue
+        print(
+            f"{name:<42}{change(before['rps'], after['rps']):>10}{change(before['p50_ms'], after['p50_ms']):>10}"
+            f"{change(before['p95_ms'], after['p95_ms']):>10}{change(before['p99_ms'], after['p99_ms']):>10}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mix", choices=sorted(MIXES), default="mixed", help="Request mix to run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured run length in seconds")
+    parser.add_argument("--requests", type=int, default=None, help="Run a fixed number of requests instead of --duration")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured warm-up in seconds")
+    parser.add_argument("--customers", type=int, default=50, help="Number of bench customer accounts")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the request generators")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<mix>-<time>-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    args = parser.parse_args()
+
+    # Per-request INFO logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    from app.main import app
+
+    admin_token, customer_tokens = ensure_bench_users(args.customers)
+    ctx = BenchContext(admin_token, customer_tokens)
+    mix = MIXES[args.mix]
+
+    if args.warmup > 0:
+        asyncio.run(run_mix(app, mix, ctx, args.concurrency, args.warmup, None, seed=args.seed + 1))
+    results = asyncio.run(run_mix(app, mix, ctx, args.concurrency, args.duration, args.requests, seed=args.seed))
+
+    commit = git_commit()
+    timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    results["meta"] = {
+        "commit": commit,
+        "timestamp": timestamp,
+        "mix": args.mix,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "requests": args.requests,
+        "seed": args.seed,
+        "customers": args.customers,
+    }
+
+    print_report(results)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{args.mix}-{timestamp}-{commit or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Middleware micro-benchmark: stacked BaseHTTPMiddleware vs pure ASGI RequestMiddleware.
+
+Builds two otherwise identical apps exposing `/health` and a DB-backed route
+(`SELECT 1` through the regular `get_db` dependency) and drives both in-process
+with httpx, reporting requests/sec and latency percentiles.
+
+Usage (from backend/, DATABASE_URL and JWT_SECRET_KEY set as for the API):
+    python -m benchmarks.middleware_bench --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from fastapi import Depends, FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.database import get_db
+from app.middleware.request_middleware import RequestMiddleware
+from benchmarks.common import asgi_client, run_closed_loop
+
+logger = logging.getLogger("benchmarks.legacy")
+
+
+class LegacyExceptionMiddleware(BaseHTTPMiddleware):
+    """Shape of the former GlobalExceptionMiddleware (happy path only)"""
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as exc:
+            return JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": str(exc)}
+            )
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """Shape of the former LoggingMiddleware"""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info(
+            f"Response: {request.method} {request.url.path} "
+            f"Status: {response.status_code} Duration: {duration:.3f}s"
+        )
+        return response
+
+
+def build_app(legacy: bool) -> FastAPI:
+    """Build a benchmark app with either the legacy or the pure ASGI middleware"""
+    bench_app = FastAPI()
+
+    if legacy:
+        bench_app.add_middleware(LegacyExceptionMiddleware)
+        bench_app.add_middleware(LegacyLoggingMiddleware)
+    else:
+        bench_app.add_middleware(RequestMiddleware)
+
+    @bench_app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    @bench_app.get("/db")
+    def db_check(db: Session = Depends(get_db)):
+        return {"value": db.execute(text("SELECT 1")).scalar()}
+
+    return bench_app
+
+
+async def bench_route(path: str, total: int, concurrency: int) -> dict:
+    """Benchmark one route against both middleware stacks"""
+    results = {}
+    for label, legacy in (("before", True), ("after", False)):
+        async with asgi_client(build_app(legacy)) as client:
+            # Warm up (connection pool, routing caches)
+            for _ in range(min(100, total)):
+                await client.get(path)
+            results[label] = await run_closed_loop(lambda: client.get(path), total, concurrency)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per route and stack")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent in-flight requests")
+    parser.add_argument("--skip-db", action="store_true", help="Only benchmark /health")
+    args = parser.parse_args()
+
+    routes = ["/health"] if args.skip_db else ["/health", "/db"]
+    report = {}
+    for path in routes:
+        report[path] = asyncio.run(bench_route(path, args.requests, args.concurrency))
+
+    print(f"{'route':<10}{'stack':<8}{'rps':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for path, results in report.items():
+        for label, summary in results.items():
+            print(f"{path:<10}{label:<8}{summary['rps']:>10}{summary['p50_ms']:>10}{summary['p99_ms']:>10}")
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
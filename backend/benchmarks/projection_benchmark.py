@@ -0,0 +1,158 @@
+"""
+Before/after benchmark for the admin list column projections.
+
+Loads one page of the admin quote, claim and message lists two ways:
+
+- before: full entities, as the list paths used to (every column, including
+  quote_data/claim_data JSON, incident summaries, notes and message bodies)
+- after:  AdminService's list queries, which select only the *_LIST_COLUMNS
+
+and prints, per list, the bytes the database sent for the page and the
+median/p95 time to fetch and hydrate it through the ORM.
+
+On MariaDB/MySQL the bytes are the server's own Bytes_sent counter for the
+session (result set metadata and packets included). SQLite has no such
+counter; there the figure is the encoded size of the values fetched, which
+is the part the projection changes. Seed the database with
+benchmarks/seed.py first.
+
+Usage (from backend/):
+    python -m benchmarks.projection_benchmark
+    python -m benchmarks.projection_benchmark --repeat 50 --page 10
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.user import User
+from app.services.admin_service import AdminService
+
+PAGE_SIZE = 20
+
+
+def build_lists(page: int) -> List[Tuple[str, Callable[[Session], object], Callable[[Session], object]]]:
+    """
+    Page queries to compare, as (label, before(db) -> query, after(db) -> query).
+
+    Args:
+        page: Page number (1-indexed), as in the admin list endpoints
+    """
+    offset = (page - 1) * PAGE_SIZE
+
+    def paged(query, model):
+        return query.order_by(model.created_at.desc()).offset(offset).limit(PAGE_SIZE)
+
+    return [
+        ("admin quotes",
+         lambda db: paged(db.query(QuoteRequest, User.full_name, User.email).join(User), QuoteRequest),
+         lambda db: paged(AdminService._quotes_query(db), QuoteRequest)),
+        ("admin claims",
+         lambda db: paged(db.query(Claim, User.full_name, User.email).join(User), Claim),
+         lambda db: paged(AdminService._claims_query(db), Claim)),
+        ("admin messages",
+         lambda db: paged(db.query(ContactMessage), ContactMessage),
+         lambda db: paged(AdminService._messages_query(db), ContactMessage)),
+    ]
+
+
+def _value_size(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (dict, list)):
+        return len(json.dumps(value).encode())
+    return len(str(value).encode())
+
+
+def _row_size(row) -> int:
+    size = 0
+    # Single-entity queries return the entity itself rather than a Row
+    for item in (row if isinstance(row, Row) else (row,)):
+        if hasattr(item, "__table__"):
+            # Full entity: every column it loaded
+            size += sum(_value_size(getattr(item, column.key)) for column in item.__table__.columns)
+        else:
+            size += _value_size(item)
+    return size
+
+
+def measure(db: Session, build: Callable[[Session], object], repeat: int) -> Tuple[int, List[float]]:
+    """
+    Fetch a page repeat times (after one unmeasured run).
+
+    Returns:
+        (bytes for one page, latencies in ms)
+    """
+    mysql = db.get_bind().dialect.name in ("mysql", "mariadb")
+
+    def bytes_sent() -> int:
+        return int(db.execute(text("SHOW SESSION STATUS LIKE 'Bytes_sent'")).one()[1])
+
+    # Unmeasured run; also where the page size is taken
+    if mysql:
+        before = bytes_sent()
+        build(db).all()
+        # Minus the status query's own result set, measured the same way
+        baseline = bytes_sent()
+        overhead = bytes_sent() - baseline
+        page_bytes = baseline - before - overhead
+    else:
+        page_bytes = sum(_row_size(row) for row in build(db).all())
+    db.expunge_all()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(db).all()
+        timings.append((time.perf_counter() - start) * 1000)
+        db.expunge_all()
+    return page_bytes, timings
+
+
+def summarize(timings: List[float]) -> Tuple[float, float]:
+    """(median, p95) of a list of latencies"""
+    ordered = sorted(timings)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per list and phase")
+    parser.add_argument("--page", type=int, default=1, help="Page number to fetch (page size 20)")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, Tuple[int, List[float]]]] = {}
+    with Session(engine) as db:
+        source = "server Bytes_sent" if db.get_bind().dialect.name in ("mysql", "mariadb") else "encoded values"
+        for label, before, after in build_lists(args.page):
+            results[label] = {
+                "before": measure(db, before, args.repeat),
+                "after": measure(db, after, args.repeat),
+            }
+        db.rollback()
+
+    print(f"Page {args.page} ({PAGE_SIZE} rows), bytes from {source}")
+    print(f"\n{'list':<16} {'before bytes':>13} {'after bytes':>12} {'ratio':>7} "
+          f"{'before p50':>11} {'p95':>9} {'after p50':>11} {'p95':>9} {'speedup':>8}")
+    for label, phases in results.items():
+        before_bytes, before_timings = phases["before"]
+        after_bytes, after_timings = phases["after"]
+        before_p50, before_p95 = summarize(before_timings)
+        after_p50, after_p95 = summarize(after_timings)
+        ratio = before_bytes / after_bytes if after_bytes else float("inf")
+        speedup = before_p50 / after_p50 if after_p50 else float("inf")
+        print(f"{label:<16} {before_bytes:>13,} {after_bytes:>12,} {ratio:>6.1f}x "
+              f"{before_p50:>9.2f}ms {before_p95:>7.2f}ms {after_p50:>9.2f}ms {after_p95:>7.2f}ms {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Query-count regression guard.
+
+Sends one request to every route in app/routers through the FastAPI test
+client against a small fixture dataset, counts the SQL statements each
+request executes, and compares the count with the route's @query_budget.
+Exits non-zero (failing CI) when a route exceeds its budget, declares no
+budget, or has no request defined here. The offending statements are
+printed, with repeats grouped, so N+1 patterns stand out.
+
+Fixture rows are owned by qb_* accounts, which are removed before and after
+the run. Point DATABASE_URL at a scratch database with the schema migrated.
+
+Usage (from backend/):
+    python -m benchmarks.query_budget
+    python -m benchmarks.query_budget --verbose   # print statements for every route
+"""
+import argparse
+import logging
+import random
+import sys
+from collections import Counter
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, select
+from starlette.routing import Match
+
+from app.core.catalog import CATALOG_VERSION
+from app.core.database import SessionLocal, engines
+from app.core.query_budget import get_query_budget
+from app.core.security import create_access_token, hash_password
+from app.main import app
+from app.models.audit_log import AuditLog
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.team_member import TeamMember
+from app.models.user import User
+from benchmarks.fixtures import category_form_data
+
+FIXTURE_PREFIX = "qb_"
+FIXTURE_PASSWORD = "QueryBudget123!"
+# Several rows per list so per-row queries (N+1) show up in the counts
+ROWS_PER_ENTITY = 5
+
+
+class Fixtures:
+    """Ids and auth headers of the fixture dataset"""
+
+    def __init__(self):
+        self.admin_headers: Dict[str, str] = {}
+        self.customer_headers: Dict[str, str] = {}
+        self.customer_id = 0
+        self.quote_id = 0
+        self.claim_id = 0
+        self.deletable_claim_id = 0
+        self.message_id = 0
+        self.team_member_id = 0
+
+
+# "METHOD /path" -> factory(fixtures) -> (expected status, url, request kwargs)
+RequestFactory = Callable[[Fixtures], Tuple[int, str, Dict]]
+
+REQUESTS: Dict[str, RequestFactory] = {
+    "POST /api/v1/auth/register": lambda f: (201, "/api/v1/auth/register", {"json": {
+        "username": f"{FIXTURE_PREFIX}registered", "email": f"{FIXTURE_PREFIX}registered@example.com",
+        "password": FIXTURE_PASSWORD, "full_name": "Query Budget",
+    }}),
+    "POST /api/v1/auth/login": lambda f: (200, "/api/v1/auth/login", {"json": {
+        "username": f"{FIXTURE_PREFIX}customer", "password": FIXTURE_PASSWORD,
+    }}),
+    "GET /api/v1/auth/me": lambda f: (200, "/api/v1/auth/me", {"headers": f.customer_headers}),
+    "POST /api/v1/quotes/": lambda f: (201, "/api/v1/quotes/", {"headers": f.customer_headers, "json": {
+        "category": "vehicle", "subcategory": "auto", "quote_data": {"year": 2020, "make": "Subaru"},
+    }}),
+    "GET /api/v1/quotes/": lambda f: (200, "/api/v1/quotes/", {"headers": f.customer_headers}),
+    "GET /api/v1/quotes/{quote_id}": lambda f: (200, f"/api/v1/quotes/{f.quote_id}", {"headers": f.customer_headers}),
+    "POST /api/v1/claims/": lambda f: (201, "/api/v1/claims/", {"headers": f.customer_headers, "json": {
+        "category": "vehicle", "subcategory": "auto", "incident_date": date.today().isoformat(),
+        "incident_summary": "Rear-ended at a stoplight, bumper damaged.", "claim_data": {"vehicle": "2020 Subaru"},
+        "contact_preference": "email",
+    }}),
+    "GET /api/v1/claims/my-claims": lambda f: (200, "/api/v1/claims/my-claims", {"headers": f.customer_headers}),
+    "GET /api/v1/claims/{claim_id}": lambda f: (200, f"/api/v1/claims/{f.claim_id}", {"headers": f.customer_headers}),
+    "DELETE /api/v1/claims/{claim_id}": lambda f: (204, f"/api/v1/claims/{f.deletable_claim_id}", {"headers": f.customer_headers}),
+    "POST /api/v1/contact/submit": lambda f: (201, "/api/v1/contact/submit", {"json": {
+        "full_name": "Query Budget", "email": "qb@example.com", "subject": "general",
+        "message": "I would like to review my policy options and talk to an agent this week.",
+    }}),
+    "GET /api/v1/contact/messages": lambda f: (200, "/api/v1/contact/messages", {"headers": f.customer_headers}),
+    "GET /api/v1/contact/{message_id}": lambda f: (200, f"/api/v1/contact/{f.message_id}", {"headers": f.customer_headers}),
+    "GET /api/v1/me/dashboard": lambda f: (200, "/api/v1/me/dashboard", {"headers": f.customer_headers}),
+    "GET /api/v1/team/": lambda f: (200, "/api/v1/team/", {}),
+    "GET /api/v1/catalog/": lambda f: (200, "/api/v1/catalog/", {}),
+    "GET /api/v1/catalog/{version}": lambda f: (200, f"/api/v1/catalog/{CATALOG_VERSION}", {}),
+    "GET /api/v1/admin/dashboard/stats": lambda f: (200, "/api/v1/admin/dashboard/stats", {"headers": f.admin_headers}),
+    "GET /api/v1/admin/dashboard/recent-activity": lambda f: (200, "/api/v1/admin/dashboard/recent-activity", {"headers": f.admin_headers}),
+    "GET /api/v1/admin/dashboard/attention-items": lambda f: (200, "/api/v1/admin/dashboard/attention-items", {"headers": f.admin_headers}),
+    "GET /api/v1/admin/quotes": lambda f: (200, "/api/v1/admin/quotes", {"headers": f.admin_headers, "params": {"search": "budget"}}),
+    "GET /api/v1/admin/quotes/export": lambda f: (200, "/api/v1/admin/quotes/export", {"headers": f.admin_headers, "params": {"search": "budget"}}),
+    "GET /api/v1/admin/quotes/changes": lambda f: (200, "/api/v1/admin/quotes/changes", {"headers": f.admin_headers, "params": {"limit": 20}}),
+    "GET /api/v1/admin/quotes/{quote_id}": lambda f: (200, f"/api/v1/admin/quotes/{f.quote_id}", {"headers": f.admin_headers}),
+    "PUT /api/v1/admin/quotes/{quote_id}": lambda f: (200, f"/api/v1/admin/quotes/{f.quote_id}", {"headers": f.admin_headers, "json": {"status": "in_review"}}),
+    "POST /api/v1/admin/quotes/bulk-status": lambda f: (200, "/api/v1/admin/quotes/bulk-status", {"headers": f.admin_headers, "json": {"filters": {"search": "budget"}, "status": "declined"}}),
+    "GET /api/v1/admin/claims": lambda f: (200, "/api/v1/admin/claims", {"headers": f.admin_headers, "params": {"search": "budget"}}),
+    "GET /api/v1/admin/claims/export": lambda f: (200, "/api/v1/admin/claims/export", {"headers": f.admin_headers, "params": {"search": "budget"}}),
+    "GET /api/v1/admin/claims/changes": lambda f: (200, "/api/v1/admin/claims/changes", {"headers": f.admin_headers, "params": {"limit": 20}}),
+    "GET /api/v1/admin/claims/{claim_id}": lambda f: (200, f"/api/v1/admin/claims/{f.claim_id}", {"headers": f.admin_headers}),
+    "PUT /api/v1/admin/claims/{claim_id}": lambda f: (200, f"/api/v1/admin/claims/{f.claim_id}", {"headers": f.admin_headers, "json": {"status": "contacted"}}),
+    "POST /api/v1/admin/claims/bulk-status": lambda f: (200, "/api/v1/admin/claims/bulk-status", {"headers": f.admin_headers, "json": {"ids": [f.claim_id], "status": "closed"}}),
+    "GET /api/v1/admin/messages": lambda f: (200, "/api/v1/admin/messages", {"headers": f.admin_headers, "params": {"search": "budget"}}),
+    "GET /api/v1/admin/messages/export": lambda f: (200, "/api/v1/admin/messages/export", {"headers": f.admin_headers, "params": {"search": "budget", "format": "ndjson"}}),
+    "GET /api/v1/admin/messages/changes": lambda f: (200, "/api/v1/admin/messages/changes", {"headers": f.admin_headers, "params": {"limit": 20}}),
+    "GET /api/v1/admin/messages/{message_id}": lambda f: (200, f"/api/v1/admin/messages/{f.message_id}", {"headers": f.admin_headers}),
+    "PUT /api/v1/admin/messages/{message_id}": lambda f: (200, f"/api/v1/admin/messages/{f.message_id}", {"headers": f.admin_headers, "json": {"status": "read"}}),
+    "POST /api/v1/admin/messages/bulk-status": lambda f: (200, "/api/v1/admin/messages/bulk-status", {"headers": f.admin_headers, "json": {"filters": {"search": "budget"}, "status": "closed"}}),
+    "GET /api/v1/admin/users": lambda f: (200, "/api/v1/admin/users", {"headers": f.admin_headers, "params": {"search": FIXTURE_PREFIX}}),
+    "GET /api/v1/admin/users/export": lambda f: (200, "/api/v1/admin/users/export", {"headers": f.admin_headers, "params": {"search": FIXTURE_PREFIX}}),
+    "GET /api/v1/admin/users/changes": lambda f: (200, "/api/v1/admin/users/changes", {"headers": f.admin_headers, "params": {"limit": 20}}),
+    "GET /api/v1/admin/users/{user_id}": lambda f: (200, f"/api/v1/admin/users/{f.customer_id}", {"headers": f.admin_headers}),
+    "PUT /api/v1/admin/users/{user_id}": lambda f: (200, f"/api/v1/admin/users/{f.customer_id}", {"headers": f.admin_headers, "json": {"is_active": True}}),
+    "GET /api/v1/admin/team": lambda f: (200, "/api/v1/admin/team", {"headers": f.admin_headers}),
+    "POST /api/v1/admin/team": lambda f: (201, "/api/v1/admin/team", {"headers": f.admin_headers, "json": {
+        "name": f"{FIXTURE_PREFIX}new member", "title": "Account Manager", "display_order": 99,
+    }}),
+    "PUT /api/v1/admin/team/{member_id}": lambda f: (200, f"/api/v1/admin/team/{f.team_member_id}", {"headers": f.admin_headers, "json": {"title": "Senior Agent"}}),
+    "DELETE /api/v1/admin/team/{member_id}": lambda f: (204, f"/api/v1/admin/team/{f.team_member_id}", {"headers": f.admin_headers}),
+    "POST /api/v1/batch/": lambda f: (200, "/api/v1/batch/", {"headers": f.customer_headers, "json": {"requests": [
+        {"path": "/api/v1/me/dashboard"}, {"path": f"/api/v1/quotes/{f.quote_id}"}, {"path": "/api/v1/catalog/"},
+    ]}}),
+    "POST /api/v1/admin/batch/": lambda f: (200, "/api/v1/admin/batch/", {"headers": f.admin_headers, "json": {"requests": [
+        {"path": "/api/v1/admin/dashboard/stats"}, {"path": "/api/v1/admin/dashboard/attention-items"},
+        {"path": f"/api/v1/admin/quotes/{f.quote_id}"},
+    ]}}),
+    "GET /api/v1/admin/profiles": lambda f: (200, "/api/v1/admin/profiles", {"headers": f.admin_headers}),
+    # No profile is stored during the run; the 404 path still covers authentication
+    "GET /api/v1/admin/profiles/{profile_id}": lambda f: (404, "/api/v1/admin/profiles/00000000T000000000000Z-0-0", {"headers": f.admin_headers}),
+}
+
+# A batch's own budget covers its principal lookup; its sub-requests run on
+# its session and are allowed their routes' budgets on top
+BATCH_ROUTES = {"POST /api/v1/batch/", "POST /api/v1/admin/batch/"}
+
+
+def batched_budget(paths: List[str]) -> int:
+    """Sum of the @query_budget of the GET routes serving the given paths"""
+    total = 0
+    for path in paths:
+        scope = {"type": "http", "method": "GET", "path": path.split("?")[0]}
+        route = next(
+            route for route in app.routes
+            if isinstance(route, APIRoute) and route.matches(scope)[0] == Match.FULL
+        )
+        total += get_query_budget(route.endpoint) or 0
+    return total
+
+
+def remove_fixtures():
+    """Delete the qb_* accounts and everything they own"""
+    db = SessionLocal()
+    try:
+        user_ids = select(User.id).where(User.username.like(f"{FIXTURE_PREFIX}%")).scalar_subquery()
+        for model in (AuditLog, ContactMessage, Claim, QuoteRequest):
+            db.execute(delete(model).where(model.user_id.in_(user_ids)))
+        db.execute(delete(ContactMessage).where(ContactMessage.email == "qb@example.com"))
+        db.execute(delete(User).where(User.username.like(f"{FIXTURE_PREFIX}%")))
+        db.execute(delete(TeamMember).where(TeamMember.name.like(f"{FIXTURE_PREFIX}%")))
+        db.commit()
+    finally:
+        db.close()
+
+
+def create_fixtures() -> Fixtures:
+    """Create an admin, a customer, a team member and a few quotes, claims and messages owned by the customer"""
+    rng = random.Random(0)
+    fixtures = Fixtures()
+    db = SessionLocal()
+    try:
+        hashed_password = hash_password(FIXTURE_PASSWORD)
+        admin = User(username=f"{FIXTURE_PREFIX}admin", email=f"{FIXTURE_PREFIX}admin@example.com",
+                     full_name="Budget Admin", hashed_password=hashed_password, is_admin=True)
+        customer = User(username=f"{FIXTURE_PREFIX}customer", email=f"{FIXTURE_PREFIX}customer@example.com",
+                        full_name="Budget Customer", hashed_password=hashed_password)
+        member = TeamMember(name=f"{FIXTURE_PREFIX}member", title="Agent", display_order=98)
+        db.add_all([admin, customer, member])
+        db.flush()
+
+        for _ in range(ROWS_PER_ENTITY):
+            db.add(QuoteRequest(user_id=customer.id, category="vehicle", subcategory="auto", status="pending",
+                                quote_data=category_form_data(rng, "vehicle", "auto")))
+            db.add(Claim(user_id=customer.id, category="property", subcategory="homeowners",
+                         incident_date=date.today() - timedelta(days=3),
+                         incident_summary="Hail damaged the roof and two skylights last night.",
+                         claim_data=category_form_data(rng, "property", "homeowners"),
+                         contact_preference="phone", status="submitted"))
+            db.add(ContactMessage(user_id=customer.id, full_name="Budget Customer", email=customer.email,
+                                  subject="policy", message="Please call me about renewing my policy next month.",
+                                  status="new"))
+        db.commit()
+
+        fixtures.customer_id = customer.id
+        fixtures.team_member_id = member.id
+        fixtures.quote_id = db.query(QuoteRequest.id).filter(QuoteRequest.user_id == customer.id).first()[0]
+        claim_ids = [row[0] for row in db.query(Claim.id).filter(Claim.user_id == customer.id).order_by(Claim.id)]
+        # The admin PUT moves the first claim out of "submitted"; the customer DELETE needs another one
+        fixtures.claim_id, fixtures.deletable_claim_id = claim_ids[0], claim_ids[-1]
+        fixtures.message_id = db.query(ContactMessage.id).filter(ContactMessage.user_id == customer.id).first()[0]
+        fixtures.admin_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id)})}"}
+        fixtures.customer_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(customer.id)})}"}
+        return fixtures
+    finally:
+        db.close()
+
+
+def _route_key(route: APIRoute) -> str:
+    return f"{next(iter(route.methods))} {route.path}"
+
+
+def _request_order(route: APIRoute) -> int:
+    # Reads first, then writes, so updates and the claim DELETE do not change what the reads see
+    return {"GET": 0, "POST": 1, "PUT": 2, "DELETE": 3}.get(next(iter(route.methods)), 4)
+
+
+def check_budgets(verbose: bool = False) -> int:
+    """
+    Run every router endpoint once and compare statement counts with the budgets.
+
+    Returns:
+        Number of failing routes
+    """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    routes = sorted(
+        (route for route in app.routes if isinstance(route, APIRoute) and route.path.startswith("/api/")),
+        key=_request_order,
+    )
+
+    failures = 0
+    remove_fixtures()
+    fixtures = create_fixtures()
+    # Requests run on the public and admin lane pools
+    for lane_engine in engines.values():
+        event.listen(lane_engine, "before_cursor_execute", record)
+    try:
+        with TestClient(app, raise_server_exceptions=False) as client:
+            print(f"{'route':<52}{'budget':>8}{'actual':>8}  result")
+            for route in routes:
+                key = _route_key(route)
+                budget = get_query_budget(route.endpoint)
+                factory = REQUESTS.get(key)
+                if factory is None:
+                    print(f"{key:<52}{budget if budget is not None else '-':>8}{'-':>8}  FAIL: no request defined in benchmarks/query_budget.py")
+                    failures += 1
+                    continue
+
+                expected_status, url, kwargs = factory(fixtures)
+                if key in BATCH_ROUTES and budget is not None:
+                    budget += batched_budget([sub["path"] for sub in kwargs["json"]["requests"]])
+                method = next(iter(route.methods))
+                statements.clear()
+                response = client.request(method, url, **kwargs)
+                count = len(statements)
+
+                problems = []
+                if response.status_code != expected_status:
+                    problems.append(f"expected HTTP {expected_status}, got {response.status_code}")
+                if budget is None:
+                    problems.append("no @query_budget declared")
+                elif count > budget:
+                    problems.append(f"over budget by {count - budget}")
+
+                result = "FAIL: " + "; ".join(problems) if problems else "ok"
+                print(f"{key:<52}{budget if budget is not None else '-':>8}{count:>8}  {result}")
+                if problems or verbose:
+                    for statement, repeats in Counter(statements).items():
+                        print(f"    {repeats}x {statement[:200]}")
+                failures += bool(problems)
+    finally:
+        for lane_engine in engines.values():
+            event.remove(lane_engine, "before_cursor_execute", record)
+        remove_fixtures()
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verbose", action="store_true", help="Print the statements of every route")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    failures = check_budgets(verbose=args.verbose)
+    if failures:
+        print(f"\n{failures} route(s) failed the query budget check")
+        sys.exit(1)
+    print("\nAll routes within their query budgets")
+
+
+if __name__ == "__main__":
+    main()
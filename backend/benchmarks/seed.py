@@ -0,0 +1,364 @@
+"""
+Synthetic data seeding for benchmark databases.
+
+Generates users, quote requests, claims, contact messages and audit rows that
+follow the real taxonomy (app/core/catalog.py), the admin workflow
+statuses (AdminService.*_STATUSES) and the shape of the quote/claim forms
+(benchmarks/fixtures.py).
+
+Output is deterministic for a given --seed and --as-of date: every table is
+split into fixed-size chunks, each generated from its own random.Random keyed
+by (seed, table, chunk), with explicit primary keys. The number of workers
+therefore changes only the speed, never the data (the one exception is the
+shared bcrypt password hash, whose salt is random).
+
+Rows are written with SQLAlchemy Core executemany, which PyMySQL rewrites
+into multi-row INSERT statements. Users are loaded first; the other tables
+are then loaded in parallel by a pool of worker processes. With --fast, the
+workers disable foreign_key_checks and unique_checks for their sessions
+(MariaDB/MySQL only).
+
+Usage (from backend/, DATABASE_URL pointing at a benchmark database):
+    python -m benchmarks.seed --truncate --users 100000 --quotes 2000000 \\
+        --claims 1000000 --messages 500000 --audit 3000000 --workers 8 --fast
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.security import hash_password
+from app.models.audit_log import AuditLog
+from app.models.claim import Claim
+from app.models.contact_message import ContactMessage
+from app.models.quote_request import QuoteRequest
+from app.models.user import User
+from app.services.admin_service import AdminService
+from benchmarks.fixtures import (
+    CONTACT_MESSAGES,
+    CONTACT_PREFERENCES,
+    CONTACT_SUBJECTS,
+    CONTACT_TIMES,
+    FIRST_NAMES,
+    INCIDENTS,
+    LAST_NAMES,
+    category_form_data,
+    random_category,
+    random_phone,
+)
+
+CHUNK_SIZE = 10_000
+SEED_PASSWORD = "SeedPassword123!"
+
+# Share of each status; older rows are further along the workflow
+QUOTE_STATUS_WEIGHTS = dict(zip(AdminService.QUOTE_STATUSES, [30, 15, 25, 20, 10]))
+CLAIM_STATUS_WEIGHTS = dict(zip(AdminService.CLAIM_STATUSES, [35, 35, 30]))
+MESSAGE_STATUS_WEIGHTS = dict(zip(AdminService.MESSAGE_STATUSES, [25, 25, 35, 15]))
+
+AUDIT_ACTIONS = [
+    # (action, entity type, weight)
+    ("user_login", "User", 40),
+    ("QUOTE_REQUEST_CREATED", "QuoteRequest", 15),
+    ("QUOTE_UPDATED_BY_ADMIN", "QuoteRequest", 12),
+    ("CLAIM_SUBMITTED", "Claim", 8),
+    ("CLAIM_UPDATED_BY_ADMIN", "Claim", 7),
+    ("CONTACT_MESSAGE_CREATED", "ContactMessage", 8),
+    ("MESSAGE_UPDATED_BY_ADMIN", "ContactMessage", 6),
+    ("user_registered", "User", 3),
+    ("CLAIM_CANCELLED", "Claim", 1),
+]
+
+# Worker process state (set by _init_worker)
+_worker_engine: Engine = None
+_worker_fast = False
+
+
+class SeedPlan:
+    """Row counts, id offsets and the time window shared by all workers"""
+
+    def __init__(self, args, id_offsets: Dict[str, int], hashed_password: str):
+        self.seed = args.seed
+        self.as_of = datetime.combine(args.as_of, datetime.min.time())
+        self.days = args.days
+        self.counts = {
+            "users": args.users,
+            "quote_requests": args.quotes,
+            "claims": args.claims,
+            "contact_messages": args.messages,
+            "audit_logs": args.audit,
+        }
+        self.id_offsets = id_offsets
+        self.hashed_password = hashed_password
+
+    def id_range(self, table: str) -> Tuple[int, int]:
+        """First and last id that will be seeded for a table"""
+        first = self.id_offsets[table] + 1
+        return first, first + self.counts[table] - 1
+
+    def random_user_id(self, rng: random.Random) -> int:
+        first, last = self.id_range("users")
+        return rng.randint(first, last)
+
+    def timestamps(self, rng: random.Random) -> Tuple[datetime, datetime, float]:
+        """
+        Random (created_at, updated_at, age) inside the seeding window.
+        Recent days are denser, as in a growing business; age is 0 (now) to 1 (oldest).
+        """
+        age = rng.random() ** 1.5
+        created_at = self.as_of - timedelta(seconds=int(age * self.days * 86400))
+        updated_at = created_at + timedelta(seconds=int(rng.random() * age * self.days * 86400 * 0.2))
+        return created_at, min(updated_at, self.as_of), age
+
+
+def _weighted_status(rng: random.Random, weights: Dict[str, int], age: float) -> str:
+    """Pick a status; the first (initial) status is much rarer for old rows"""
+    statuses = list(weights)
+    values = list(weights.values())
+    values[0] = values[0] * (1 - age) ** 3
+    return rng.choices(statuses, values)[0]
+
+
+def generate_users(plan: SeedPlan, rng: random.Random, first_id: int, count: int) -> List[Dict]:
+    rows = []
+    for user_id in range(first_id, first_id + count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        created_at, updated_at, age = plan.timestamps(rng)
+        rows.append({
+            "id": user_id,
+            "username": f"{first.lower()}{last.lower()}{user_id}",
+            "email": f"{first.lower()}.{last.lower()}.{user_id}@example.com",
+            "full_name": f"{first} {last}",
+            "phone": random_phone(rng) if rng.random() < 0.7 else None,
+            "hashed_password": plan.hashed_password,
+            "is_active": rng.random() < 0.97,
+            "is_admin": False,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+    return rows
+
+
+def generate_quote_requests(plan: SeedPlan, rng: random.Random, first_id: int, count: int) -> List[Dict]:
+    rows = []
+    for quote_id in range(first_id, first_id + count):
+        category, subcategory = random_category(rng)
+        created_at, updated_at, age = plan.timestamps(rng)
+        status = _weighted_status(rng, QUOTE_STATUS_WEIGHTS, age)
+        quoted = status in ("quoted", "accepted", "declined")
+        rows.append({
+            "id": quote_id,
+            "user_id": plan.random_user_id(rng),
+            "category": category,
+            "subcategory": subcategory,
+            "status": status,
+            "quote_data": category_form_data(rng, category, subcategory),
+            "agent_notes": "Reviewed coverage options with customer." if status != "pending" and rng.random() < 0.5 else None,
+            "customer_notes": rng.choice([None, None, "Please call after 5pm.", "Looking to switch carriers at renewal."]),
+            "quote_amount": round(rng.uniform(300, 5000), 2) if quoted else None,
+            "appointment_date": (created_at + timedelta(days=rng.randint(1, 14))).date() if rng.random() < 0.2 else None,
+            "quoted_at": updated_at if quoted else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+    return rows
+
+
+def generate_claims(plan: SeedPlan, rng: random.Random, first_id: int, count: int) -> List[Dict]:
+    rows = []
+    for claim_id in range(first_id, first_id + count):
+        category, subcategory = random_category(rng)
+        created_at, updated_at, age = plan.timestamps(rng)
+        status = _weighted_status(rng, CLAIM_STATUS_WEIGHTS, age)
+        rows.append({
+            "id": claim_id,
+            "user_id": plan.random_user_id(rng),
+            "category": category,
+            "subcategory": subcategory,
+            "incident_date": (created_at - timedelta(days=rng.randint(0, 60))).date(),
+            "incident_summary": rng.choice(INCIDENTS),
+            "claim_data": category_form_data(rng, category, subcategory),
+            "appointment_requested": (created_at + timedelta(days=rng.randint(1, 30))).date() if rng.random() < 0.3 else None,
+            "contact_preference": rng.choice(CONTACT_PREFERENCES),
+            "preferred_contact_time": rng.choice(CONTACT_TIMES),
+            "additional_notes": None,
+            "status": status,
+            "admin_notes": "Left voicemail, follow up in two days." if status != "submitted" and rng.random() < 0.5 else None,
+            "contacted_at": updated_at if status != "submitted" else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+    return rows
+
+
+def generate_contact_messages(plan: SeedPlan, rng: random.Random, first_id: int, count: int) -> List[Dict]:
+    rows = []
+    for message_id in range(first_id, first_id + count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        created_at, updated_at, age = plan.timestamps(rng)
+        status = _weighted_status(rng, MESSAGE_STATUS_WEIGHTS, age)
+        responded = status in ("responded", "closed")
+        rows.append({
+            "id": message_id,
+            # About a third of messages come from guests
+            "user_id": plan.random_user_id(rng) if rng.random() < 0.65 else None,
+            "full_name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}{rng.randint(1, 9999)}@example.com",
+            "phone": random_phone(rng) if rng.random() < 0.6 else None,
+            "subject": rng.choice(CONTACT_SUBJECTS),
+            "message": rng.choice(CONTACT_MESSAGES),
+            "status": status,
+            "admin_response": "Thanks for reaching out, an agent will call you shortly." if responded else None,
+            "appointment_date": None,
+            "responded_at": updated_at if responded else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+    return rows
+
+
+def generate_audit_logs(plan: SeedPlan, rng: random.Random, first_id: int, count: int) -> List[Dict]:
+    entity_tables = {"User": "users", "QuoteRequest": "quote_requests", "Claim": "claims", "ContactMessage": "contact_messages"}
+    actions = [(action, entity_type) for action, entity_type, _ in AUDIT_ACTIONS]
+    weights = [weight for _, _, weight in AUDIT_ACTIONS]
+
+    rows = []
+    for audit_id in range(first_id, first_id + count):
+        action, entity_type = rng.choices(actions, weights)[0]
+        entity_first, entity_last = plan.id_range(entity_tables[entity_type])
+        entity_id = rng.randint(entity_first, entity_last) if entity_last >= entity_first else None
+        user_id = plan.random_user_id(rng)
+        created_at, _, _ = plan.timestamps(rng)
+        rows.append({
+            "id": audit_id,
+            "user_id": entity_id if entity_type == "User" and entity_id else user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "details": f"{action.replace('_', ' ').capitalize()} ({entity_type} {entity_id})",
+            "ip_address": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            "created_at": created_at,
+        })
+    return rows
+
+
+TABLES: Dict[str, Tuple[object, Callable]] = {
+    "users": (User.__table__, generate_users),
+    "quote_requests": (QuoteRequest.__table__, generate_quote_requests),
+    "claims": (Claim.__table__, generate_claims),
+    "contact_messages": (ContactMessage.__table__, generate_contact_messages),
+    "audit_logs": (AuditLog.__table__, generate_audit_logs),
+}
+
+
+def _create_engine() -> Engine:
+    return create_engine(settings.DATABASE_URL, pool_size=1, max_overflow=0)
+
+
+def _init_worker(fast: bool):
+    global _worker_engine, _worker_fast
+    _worker_engine = _create_engine()
+    _worker_fast = fast
+
+
+def _load_chunk(task: Tuple[SeedPlan, str, int, int]) -> Tuple[str, int]:
+    """Generate and insert one chunk of a table (runs in a worker process)"""
+    plan, table_name, first_id, count = task
+    table, generate = TABLES[table_name]
+    rng = random.Random(f"{plan.seed}:{table_name}:{first_id}")
+    rows = generate(plan, rng, first_id, count)
+
+    with _worker_engine.begin() as conn:
+        if _worker_fast and conn.dialect.name in ("mysql", "mariadb"):
+            conn.execute(text("SET SESSION foreign_key_checks = 0, unique_checks = 0"))
+        conn.execute(table.insert(), rows)
+    return table_name, count
+
+
+def _chunks(plan: SeedPlan, table_name: str) -> List[Tuple[SeedPlan, str, int, int]]:
+    first, last = plan.id_range(table_name)
+    return [
+        (plan, table_name, start, min(CHUNK_SIZE, last - start + 1))
+        for start in range(first, last + 1, CHUNK_SIZE)
+    ]
+
+
+def _truncate(engine: Engine):
+    """Delete all rows from the seeded tables (children first)"""
+    with engine.begin() as conn:
+        is_mysql = conn.dialect.name in ("mysql", "mariadb")
+        if is_mysql:
+            conn.execute(text("SET SESSION foreign_key_checks = 0"))
+        for table_name in reversed(list(TABLES)):
+            table = TABLES[table_name][0]
+            conn.execute(text(f"TRUNCATE TABLE {table.name}") if is_mysql else table.delete())
+
+
+def _id_offsets(engine: Engine) -> Dict[str, int]:
+    """Current max id per table, so seeded ids never collide with existing rows"""
+    with engine.connect() as conn:
+        return {
+            table_name: conn.execute(select(func.coalesce(func.max(table.c.id), 0))).scalar()
+            for table_name, (table, _) in TABLES.items()
+        }
+
+
+def _run_phase(pool, tasks: List, label: str) -> int:
+    if not tasks:
+        return 0
+    start = time.perf_counter()
+    loaded: Dict[str, int] = {}
+    for table_name, count in pool.imap_unordered(_load_chunk, tasks):
+        loaded[table_name] = loaded.get(table_name, 0) + count
+    elapsed = time.perf_counter() - start
+    total = sum(loaded.values())
+    details = ", ".join(f"{name}={count:,}" for name, count in loaded.items())
+    print(f"{label}: {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s) [{details}]")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--quotes", type=int, default=100_000)
+    parser.add_argument("--claims", type=int, default=50_000)
+    parser.add_argument("--messages", type=int, default=30_000)
+    parser.add_argument("--audit", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the generated data")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(), help="Newest timestamp (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=730, help="Spread created_at over this many days before --as-of")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Worker processes")
+    parser.add_argument("--truncate", action="store_true", help="Empty the seeded tables first (ids then start at 1)")
+    parser.add_argument("--fast", action="store_true", help="Disable FK and unique checks while loading (MariaDB/MySQL)")
+    args = parser.parse_args()
+
+    engine = _create_engine()
+    if args.truncate:
+        _truncate(engine)
+    id_offsets = _id_offsets(engine)
+    engine.dispose()
+
+    # One bcrypt hash for every seeded account (hashing per row would dominate the run)
+    plan = SeedPlan(args, id_offsets, hash_password(SEED_PASSWORD))
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(args.fast,)) as pool:
+        total = _run_phase(pool, _chunks(plan, "users"), "users")
+        # Children only reference users (and audit rows only reference ids by value), so they load together
+        child_tasks = [task for table_name in list(TABLES)[1:] for task in _chunks(plan, table_name)]
+        # Interleave tables so every worker stays busy until the end
+        child_tasks.sort(key=lambda task: task[2])
+        total += _run_phase(pool, child_tasks, "quotes/claims/messages/audit")
+
+    elapsed = time.perf_counter() - start
+    print(f"Total: {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -89,6 +89,7 @@ export interface AdminQuote {
   quoted_at: string | null
   created_at: string
   updated_at: string
+  version: number  // ETag; send back as If-Match when updating
   customer_name: string
   customer_email: string
   customer_phone: string | null
@@ -115,6 +116,7 @@ export interface AdminClaim {
   contacted_at: string | null
   created_at: string
   updated_at: string
+  version: number  // ETag; send back as If-Match when updating
   customer_name: string
   customer_email: string
   customer_phone: string | null
@@ -138,6 +140,7 @@ export interface AdminMessage {
   responded_at: string | null
   created_at: string
   updated_at: string
+  version: number  // ETag; send back as If-Match when updating
   sender_name: string
   sender_email: string
   sender_phone: string | null
@@ -183,8 +186,69 @@ export interface UpdateUserRequest {
   is_admin?: boolean
 }
 
+// Sends the version of the loaded record as If-Match, so the update fails
+// with 409 instead of overwriting a change another admin made meanwhile
+function ifMatch(version?: number) {
+  return version === undefined ? {} : { headers: { 'If-Match': `"${version}"` } }
+}
+
+/**
+ * Whether an update failed because the record changed since it was loaded
+ */
+export function isConflict(error: any): boolean {
+  return error?.response?.status === 409
+}
+
+// One sub-response of POST /admin/batch/
+export interface BatchResponseItem {
+  status: number
+  headers: Record<string, string>
+  body: any
+}
+
+// Page of a change feed (GET /admin/{entity}/changes): rows created or updated, and ids deleted, after the cursor
+export interface AdminChanges<T> {
+  items: T[]
+  deleted: number[]
+  next_cursor: string | null
+  has_more: boolean
+}
+
+export type ChangeFeed = 'quotes' | 'claims' | 'messages' | 'users'
+
 // Admin Service
 class AdminService {
+  /**
+   * Run several admin GETs in one request (paths relative to the API base, e.g. '/admin/dashboard/stats').
+   * Rejects if any of them failed, like the separate requests would.
+   */
+  async batchGet(paths: string[]): Promise<any[]> {
+    const response = await apiClient.post('/admin/batch/', {
+      requests: paths.map((path) => ({ path: `/api/v1${path}` }))
+    })
+    const items: BatchResponseItem[] = response.data.responses
+    const failed = items.find((item) => item.status >= 400)
+    if (failed) {
+      throw Object.assign(new Error(failed.body?.detail || `Batched request failed (${failed.status})`), {
+        response: { status: failed.status, data: failed.body }
+      })
+    }
+    return items.map((item) => item.body)
+  }
+
+  /**
+   * Get dashboard stats and attention items in one round trip
+   */
+  async getDashboardOverview(): Promise<{ stats: DashboardStats; attentionItems: AttentionItem[] }> {
+    try {
+      const [stats, attention] = await this.batchGet(['/admin/dashboard/stats', '/admin/dashboard/attention-items'])
+      return { stats, attentionItems: attention.items }
+    } catch (error: any) {
+      console.error('Error fetching dashboard overview:', error)
+      throw error
+    }
+  }
+
   /**
    * Get dashboard stats
    */
@@ -233,6 +297,22 @@ class AdminService {
     }
   }
 
+  /**
+   * Get the rows of a list changed since a cursor (omit it to start from the beginning).
+   * Keep next_cursor for the next call; fetch again at once while has_more is set.
+   */
+  async getChanges<T>(feed: ChangeFeed, cursor?: string | null, limit?: number): Promise<AdminChanges<T>> {
+    try {
+      const response = await apiClient.get(`/admin/${feed}/changes`, {
+        params: { cursor: cursor || undefined, limit }
+      })
+      return response.data
+    } catch (error: any) {
+      console.error(`Error fetching ${feed} changes:`, error)
+      throw error
+    }
+  }
+
   /**
    * Get single quote by ID
    */
@@ -249,9 +329,9 @@ class AdminService {
   /**
    * Update quote (amount, notes, status)
    */
-  async updateQuote(id: number, data: UpdateQuoteRequest): Promise<AdminQuote> {
+  async updateQuote(id: number, data: UpdateQuoteRequest, version?: number): Promise<AdminQuote> {
     try {
-      const response = await apiClient.put(`/admin/quotes/${id}`, data)
+      const response = await apiClient.put(`/admin/quotes/${id}`, data, ifMatch(version))
       return response.data
     } catch (error: any) {
       console.error(`Error updating quote ${id}:`, error)
@@ -297,9 +377,9 @@ class AdminService {
   /**
    * Update claim (notes, status, appointment)
    */
-  async updateClaim(id: number, data: UpdateClaimRequest): Promise<AdminClaim> {
+  async updateClaim(id: number, data: UpdateClaimRequest, version?: number): Promise<AdminClaim> {
     try {
-      const response = await apiClient.put(`/admin/claims/${id}`, data)
+      const response = await apiClient.put(`/admin/claims/${id}`, data, ifMatch(version))
       return response.data
     } catch (error: any) {
       console.error(`Error updating claim ${id}:`, error)
@@ -345,9 +425,9 @@ class AdminService {
   /**
    * Update message (response, status)
    */
-  async updateMessage(id: number, data: UpdateMessageRequest): Promise<AdminMessage> {
+  async updateMessage(id: number, data: UpdateMessageRequest, version?: number): Promise<AdminMessage> {
     try {
-      const response = await apiClient.put(`/admin/messages/${id}`, data)
+      const response = await apiClient.put(`/admin/messages/${id}`, data, ifMatch(version))
       return response.data
     } catch (error: any) {
       console.error(`Error updating message ${id}:`, error)
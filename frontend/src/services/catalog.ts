@@ -0,0 +1,55 @@
+import api from './api'
+
+export interface CatalogSubcategory {
+  key: string
+  label: string
+}
+
+export interface CatalogCategory {
+  key: string
+  label: string
+  subcategories: CatalogSubcategory[] | null
+}
+
+export interface Catalog {
+  version: string
+  categories: CatalogCategory[]
+}
+
+// The catalog only changes with a deploy: fetch it once per page load
+let catalogRequest: Promise<Catalog> | null = null
+
+const catalogService = {
+  /**
+   * Get the insurance category catalog (public endpoint - no auth required)
+   */
+  getCatalog(): Promise<Catalog> {
+    if (!catalogRequest) {
+      catalogRequest = api.get<Catalog>('/catalog/')
+        .then(response => response.data)
+        .catch(error => {
+          catalogRequest = null // Retry on the next call
+          throw error
+        })
+    }
+    return catalogRequest
+  },
+
+  /**
+   * Subcategory options of a category ([] if it has none or is unknown)
+   */
+  subcategoryOptions(catalog: Catalog | null, category: string): Array<{ value: string; label: string }> {
+    const entry = catalog?.categories.find(c => c.key === category)
+    return (entry?.subcategories || []).map(sub => ({ value: sub.key, label: sub.label }))
+  },
+
+  /**
+   * Whether a category requires a subcategory
+   */
+  hasSubcategories(catalog: Catalog | null, category: string): boolean {
+    const entry = catalog?.categories.find(c => c.key === category)
+    return !!entry?.subcategories
+  }
+}
+
+export default catalogService
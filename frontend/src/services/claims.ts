@@ -34,6 +34,16 @@ export interface ClaimResponse {
   updated_at: string
 }
 
+export interface ClaimSummary {
+  id: number
+  category: string
+  subcategory: string | null
+  incident_type: string | null
+  incident_date: string
+  status: 'submitted' | 'contacted' | 'closed'
+  created_at: string
+}
+
 export default {
   // Create a new claim
   async createClaim(claimData: ClaimRequest): Promise<ClaimResponse> {
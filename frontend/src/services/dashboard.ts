@@ -0,0 +1,34 @@
+import api from './api'
+import type { QuoteSummary } from './quotes'
+import type { ClaimSummary } from './claims'
+import type { ContactMessageResponse } from './contact'
+
+export interface DashboardQuotes {
+  items: QuoteSummary[]
+  total: number
+  next_cursor: string | null
+}
+
+export interface DashboardClaims {
+  items: ClaimSummary[]
+  total: number
+}
+
+export interface DashboardMessages {
+  items: ContactMessageResponse[]
+  total: number
+}
+
+export interface DashboardResponse {
+  quotes: DashboardQuotes
+  claims: DashboardClaims
+  messages: DashboardMessages
+}
+
+export default {
+  // Newest quotes, claims and messages of the current user, with totals, in one request
+  async getDashboard(limit?: number): Promise<DashboardResponse> {
+    const response = await api.get('/me/dashboard', { params: limit ? { limit } : {} })
+    return response.data
+  }
+}
@@ -26,6 +26,20 @@ export interface QuoteResponse {
   updated_at: string
 }
 
+export interface QuoteSummary {
+  id: number
+  category: string
+  subcategory: string | null
+  status: string
+  quote_amount: number | null
+  created_at: string
+}
+
+export interface QuoteListResponse {
+  items: QuoteSummary[]
+  next_cursor: string | null
+}
+
 export default {
   // Create a new quote request
   async createQuote(quoteData: QuoteRequest): Promise<QuoteResponse> {
@@ -33,9 +47,9 @@ export default {
     return response.data
   },
 
-  // Get all quotes for the current user
-  async getMyQuotes(): Promise<QuoteResponse[]> {
-    const response = await api.get('/quotes/')
+  // Get a page of the current user's quotes (newest first); pass next_cursor for the following page
+  async getMyQuotes(params: { limit?: number; cursor?: string } = {}): Promise<QuoteListResponse> {
+    const response = await api.get('/quotes/', { params })
     return response.data
   },
 
@@ -0,0 +1,24 @@
+import api from './api'
+
+export interface TeamMember {
+  id: number
+  name: string
+  title: string
+  bio: string | null
+  photo_url: string | null
+  display_order: number
+}
+
+const teamService = {
+  /**
+   * Get the team roster in display order (public endpoint - no auth required).
+   * Served from a server-side snapshot with ETag/Last-Modified, so the browser
+   * revalidates it cheaply.
+   */
+  async getTeam(): Promise<TeamMember[]> {
+    const response = await api.get<TeamMember[]>('/team/')
+    return response.data
+  }
+}
+
+export default teamService